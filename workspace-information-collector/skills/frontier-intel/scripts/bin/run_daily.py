@@ -1,16 +1,74 @@
 #!/usr/bin/env python3
 
+import argparse
+from contextlib import nullcontext
 from pathlib import Path
 
-from scripts.lib.pipeline.run_daily import run_daily
+from scripts.lib.collectors import parse_sources
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the frontier-intel daily pipeline.")
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument("--record", type=Path, help="Record every external response into this fixture bundle.")
+    fixtures.add_argument("--replay", type=Path, help="Replay external responses from this fixture bundle.")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Injected latency per replayed call.")
+    parser.add_argument("--latency-scale", type=float, default=0.0, help="Replay recorded latencies scaled by this factor.")
+    parser.add_argument("--incremental", action="store_true", help="Merge new items into today's store instead of rebuilding it.")
+    parser.add_argument("--no-resume", action="store_true", help="Discard checkpoints left by an interrupted run.")
+    parser.add_argument("--sources", type=_sources, help="Comma-separated sources to collect (news, github, arxiv, tweet, reddit); default all.")
+    parser.add_argument("--profile", help="Run profile from the profile config, e.g. morning or weekend.")
+    parser.add_argument("--config", type=Path, help="Profile config file; defaults to config/profiles.toml in the skill.")
+    return parser.parse_args()
+
+
+def _sources(value: str) -> tuple[str, ...]:
+    try:
+        return parse_sources(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error)) from error
 
 
 def main() -> None:
+    args = parse_args()
     skill_root = Path(__file__).resolve().parents[2]
-    digest_date, items, target = run_daily(skill_root)
+    profile = None
+    if args.profile:
+        from scripts.lib.pipeline.profiles import ProfileError, load_profile
+
+        try:
+            profile = load_profile(args.config or skill_root / "config" / "profiles.toml", args.profile)
+        except ProfileError as error:
+            raise SystemExit(f"frontier-intel daily run aborted: {error}") from error
+    from scripts.lib.pipeline.run_daily import run_daily
+    from scripts.lib.storage.run_lock import RunLockedError
+    from scripts.utils.replay import MODE_RECORD, Cassette, LatencyProfile, use_cassette
+
+    latency = LatencyProfile(http_ms=args.latency_ms, command_ms=args.latency_ms, recorded_scale=args.latency_scale)
+    if args.replay:
+        fixtures = use_cassette(Cassette.load(args.replay, latency))
+    elif args.record:
+        fixtures = use_cassette(Cassette(MODE_RECORD), save_to=args.record)
+    else:
+        fixtures = nullcontext()
+    try:
+        with fixtures:
+            digest_date, items, target = run_daily(
+                skill_root,
+                resume=not args.no_resume,
+                incremental=args.incremental,
+                sources=args.sources,
+                profile=profile,
+            )
+    except RunLockedError as error:
+        print(f"frontier-intel daily run skipped: {error}")
+        raise SystemExit(1) from error
     print(
         f"frontier-intel daily run complete: date={digest_date} items={len(items)} output={target}"
     )
+    print(f"frontier-intel traces: {target.parents[2] / 'traces'}")
+    if args.record:
+        print(f"frontier-intel fixtures recorded: {args.record}")
 
 
 if __name__ == "__main__":
@@ -2,11 +2,12 @@
 
 from pathlib import Path
 
-from scripts.lib.pipeline.run_weekly import run_weekly
 from scripts.utils.dates import current_digest_date
 
 
 def main() -> None:
+    from scripts.lib.pipeline.run_weekly import run_weekly
+
     skill_root = Path(__file__).resolve().parents[2]
     week_key, markdown = run_weekly(skill_root, current_digest_date())
     print(
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+import argparse
+from pathlib import Path
+
+from scripts.lib.storage.items_store import ItemsStore
+from scripts.lib.storage.search_index import SearchIndex, SearchQueryError
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Search collected frontier-intel items.")
+    parser.add_argument("query", nargs="?", default="", help="Search terms; every term must match.")
+    parser.add_argument("--type", dest="item_type", help="Only return items of this type (news, github, arxiv, tweet, reddit).")
+    parser.add_argument("--since", help="Earliest digest date, YYYY-MM-DD.")
+    parser.add_argument("--until", help="Latest digest date, YYYY-MM-DD.")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--raw", action="store_true", help="Pass the query to FTS5 as a raw MATCH expression.")
+    parser.add_argument("--reindex", action="store_true", help="Index item files that changed since they were last indexed.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    skill_root = Path(__file__).resolve().parents[2]
+    project_root = skill_root.parent.parent / "projects" / "frontier-intel"
+    index = SearchIndex(project_root / "state" / "search-index.sqlite3")
+    if args.reindex:
+        updated = ItemsStore(project_root, index).reindex()
+        print(f"frontier-intel search index refreshed: dates={updated}")
+    if not args.query:
+        return
+    try:
+        hits = index.search(args.query, item_type=args.item_type, since=args.since, until=args.until, limit=args.limit, raw=args.raw)
+    except SearchQueryError as error:
+        raise SystemExit(f"frontier-intel search: {error}; check the --raw MATCH syntax") from error
+    for hit in hits:
+        print(f"{hit.digest_date}  {hit.type:<7} {hit.title}")
+        print(f"    {hit.url}")
+    print(f"{len(hits)} result(s)")
+
+
+if __name__ == "__main__":
+    main()
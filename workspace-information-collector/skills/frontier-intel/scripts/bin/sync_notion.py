@@ -3,7 +3,9 @@
 from pathlib import Path
 
 from scripts.lib.models.item import FrontierItem
+from scripts.lib.notion.blocks import MAX_BLOCKS_PER_REQUEST, batched, load_digest_blocks
 from scripts.lib.notion.schema import build_digest_page_properties, build_item_page_properties
+from scripts.utils.dates import current_digest_date
 
 
 def main() -> None:
@@ -34,6 +36,11 @@ def main() -> None:
     print(f"frontier-intel notion dry-run scaffold: {skill_root}")
     print(f"item fields={sorted(item_payload.keys())}")
     print(f"digest fields={sorted(digest_payload.keys())}")
+    digest_path = skill_root.parent.parent / "projects" / "frontier-intel" / "digests" / "daily" / f"{current_digest_date()}.md"
+    body = load_digest_blocks(digest_path)
+    if body:
+        requests = 1 + len(list(batched(body[MAX_BLOCKS_PER_REQUEST:])))
+        print(f"digest body blocks={len(body)} requests={requests}")
 
 
 if __name__ == "__main__":
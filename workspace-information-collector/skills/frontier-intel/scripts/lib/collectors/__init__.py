@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from scripts.lib.collectors.base import Collector
+
+COLLECTORS = {
+    "news": "scripts.lib.collectors.web_news:WebNewsCollector",
+    "github": "scripts.lib.collectors.github:GitHubCollector",
+    "arxiv": "scripts.lib.collectors.arxiv:ArxivCollector",
+    "tweet": "scripts.lib.collectors.twitter:TwitterCollector",
+    "reddit": "scripts.lib.collectors.reddit:RedditCollector",
+}
+
+
+def source_types() -> tuple[str, ...]:
+    return tuple(COLLECTORS)
+
+
+def parse_sources(value: str | None) -> tuple[str, ...]:
+    if not value:
+        return source_types()
+    sources = tuple(dict.fromkeys(source.strip() for source in value.split(",") if source.strip()))
+    unknown = [source for source in sources if source not in COLLECTORS]
+    if unknown:
+        raise ValueError(f"unknown source(s): {', '.join(unknown)}; expected any of {', '.join(COLLECTORS)}")
+    return sources
+
+
+def load_collector(source_type: str) -> type[Collector]:
+    module_name, _, class_name = COLLECTORS[source_type].partition(":")
+    return getattr(import_module(module_name), class_name)
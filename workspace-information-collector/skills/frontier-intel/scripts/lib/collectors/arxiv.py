@@ -1,58 +1,198 @@
 from __future__ import annotations
 
+import time
 import xml.etree.ElementTree as ET
-from urllib.request import urlopen
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
 
 from scripts.lib.collectors.base import Collector
 from scripts.lib.models.item import FrontierItem
-from scripts.utils.dates import current_digest_date, current_week_key, utc_now_iso
+from scripts.lib.storage.state_store import JsonStateStore
+from scripts.utils.dates import current_digest_date, current_week_key, parse_timestamp, utc_now_iso
+from scripts.utils.http import open_url
+from scripts.utils.replay import current_cassette
 from scripts.utils.summarizer import Summarizer
+from scripts.utils.tracing import span
 
-ARXIV_API = "https://export.arxiv.org/api/query?search_query=cat:cs.AI&start=0&max_results={limit}&sortBy=submittedDate&sortOrder=descending"
+ARXIV_API = "https://export.arxiv.org/api/query?search_query=cat:{category}&start={start}&max_results={page_size}&sortBy=lastUpdatedDate&sortOrder=descending"
 ATOM_NS = {"atom": "http://www.w3.org/2005/Atom"}
+ATOM_ENTRY_TAG = "{http://www.w3.org/2005/Atom}entry"
+TOTAL_RESULTS_TAG = "{http://a9.com/-/spec/opensearch/1.1/}totalResults"
+DEFAULT_CATEGORIES = ("cs.AI", "cs.CL", "cs.LG", "cs.CV", "stat.ML")
+MAX_PAGE_SIZE = 100
+POLITENESS_DELAY_SECONDS = 3.0
+# Entries examined per category, as a multiple of the limit, before giving up on
+# finding new ones; bounds the paging when most of the listing is already known
+SCAN_LIMIT_FACTOR = 4
+
+
+@dataclass(slots=True)
+class ArxivEntry:
+    paper_id: str
+    url: str
+    pdf_url: str | None
+    title: str
+    abstract: str
+    published_at: str
+    updated_at: str
+    category: str
 
 
 class ArxivCollector(Collector):
     source_type = "arxiv"
 
-    def __init__(self, limit: int = 5) -> None:
+    def __init__(
+        self,
+        limit: int = 5,
+        categories: list[str] | tuple[str, ...] | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+        cursor_path: Path | None = None,
+        summary_workers: int = 4,
+        request_delay: float = POLITENESS_DELAY_SECONDS,
+    ) -> None:
         self.limit = limit
+        self.categories = list(categories or DEFAULT_CATEGORIES)
+        self.page_size = max(1, min(page_size, limit, MAX_PAGE_SIZE))
+        self.cursors = JsonStateStore(cursor_path) if cursor_path else None
+        self.summary_workers = summary_workers
+        self.request_delay = request_delay
         self.summarizer = Summarizer()
+        self._last_request_at: float | None = None
+        self._pending_cursors: dict[str, str] | None = None
+
+    def configure_state(self, state_dir: Path) -> None:
+        self.cursors = JsonStateStore(state_dir / "arxiv-cursors.json")
 
     def collect(self) -> list[FrontierItem]:
-        try:
-            with urlopen(ARXIV_API.format(limit=self.limit)) as response:
-                payload = response.read().decode()
-        except Exception:
-            return []
+        cursors = self.cursors.read() if self.cursors else {}
+        updated_cursors = dict(cursors)
+        entries: dict[str, ArxivEntry] = {}
+        for category in self.categories:
+            # Only incremental runs stop at the watermark; a full run rebuilds the day
+            watermark = cursors.get(category) if self.incremental else None
+            try:
+                with span(category, "arxiv_category"):
+                    harvested, covered_until = self._harvest_category(category, watermark)
+            except Exception:
+                continue
+            for entry in harvested:
+                entries.setdefault(entry.paper_id, entry)
+            previous = parse_timestamp(cursors.get(category))
+            if covered_until is not None and (previous is None or covered_until > previous):
+                updated_cursors[category] = covered_until.isoformat()
+        items = self._build_items(list(entries.values()))
+        self._pending_cursors = updated_cursors if updated_cursors != cursors else None
+        return items
+
+    def commit_state(self) -> None:
+        if self.cursors is not None and self._pending_cursors is not None:
+            self.cursors.write(self._pending_cursors)
+            self._pending_cursors = None
+
+    def pending_state(self) -> dict[str, Any] | None:
+        return None if self._pending_cursors is None else {"cursors": self._pending_cursors}
+
+    def restore_pending_state(self, state: dict[str, Any]) -> None:
+        self._pending_cursors = state["cursors"]
 
-        root = ET.fromstring(payload)
+    def _harvest_category(self, category: str, watermark: str | None) -> tuple[list[ArxivEntry], datetime | None]:
+        """Harvest the newest entries of a category, stopping at the watermark.
+
+        Paging also stops once limit entries are harvested or SCAN_LIMIT_FACTOR
+        times limit entries have been examined, so a listing made up of known
+        papers costs a few pages rather than the whole category.
+
+        Returns the entries and the newest timestamp seen. The harvest starts at
+        the top of the listing, so that is the new watermark; anything below
+        where it stopped is left to full runs.
+        """
+        watermark_at = parse_timestamp(watermark)
+        newest_at: datetime | None = None
+        harvested: list[ArxivEntry] = []
+        scan_limit = self.limit * SCAN_LIMIT_FACTOR
+        examined = 0
+        start = 0
+        while True:
+            page, total = self._fetch_page(ARXIV_API.format(category=category, start=start, page_size=self.page_size), category)
+            if not page:
+                break
+            reached_watermark = False
+            for entry in page:
+                updated_at = parse_timestamp(entry.updated_at or entry.published_at)
+                if watermark_at is not None and updated_at is not None and updated_at <= watermark_at:
+                    reached_watermark = True
+                    break
+                if len(harvested) >= self.limit or examined >= scan_limit:
+                    break
+                examined += 1
+                if updated_at is not None and (newest_at is None or updated_at > newest_at):
+                    newest_at = updated_at
+                # The harvest is ordered by lastUpdated, so a revision counts as new;
+                # entries rejected here still count toward the scan limit
+                if not self.is_new(key=entry.paper_id, published_at=entry.updated_at or entry.published_at):
+                    continue
+                harvested.append(entry)
+            start += len(page)
+            if reached_watermark or (total is not None and start >= total):
+                break
+            if len(harvested) >= self.limit or examined >= scan_limit:
+                break
+        return harvested, newest_at
+
+    def _fetch_page(self, url: str, category: str) -> tuple[list[ArxivEntry], int | None]:
+        self._throttle()
+        entries: list[ArxivEntry] = []
+        total: int | None = None
+        with open_url(url) as stream:
+            for _, element in ET.iterparse(stream, events=("end",)):
+                if element.tag == TOTAL_RESULTS_TAG:
+                    total = int((element.text or "0").strip() or 0)
+                elif element.tag == ATOM_ENTRY_TAG:
+                    entries.append(self._parse_entry(element, category))
+                    element.clear()
+        return entries, total
+
+    def _parse_entry(self, entry: ET.Element, category: str) -> ArxivEntry:
+        url = self._text(entry, "atom:id")
+        title = " ".join(self._text(entry, "atom:title").split())
+        return ArxivEntry(
+            paper_id=url.rsplit("/", 1)[-1] if url else title,
+            url=url,
+            pdf_url=self._pdf_url(entry),
+            title=title,
+            abstract=" ".join(self._text(entry, "atom:summary").split()),
+            published_at=self._text(entry, "atom:published"),
+            updated_at=self._text(entry, "atom:updated"),
+            category=category,
+        )
+
+    def _build_items(self, entries: list[ArxivEntry]) -> list[FrontierItem]:
+        summaries = self.summarizer.summarize_batch(
+            item_type="arxiv",
+            entries=[(entry.title, entry.abstract) for entry in entries],
+            max_workers=self.summary_workers,
+        )
         items: list[FrontierItem] = []
-        for entry in root.findall("atom:entry", ATOM_NS):
-            url = self._text(entry, "atom:id")
-            pdf_url = self._pdf_url(entry)
-            title = " ".join(self._text(entry, "atom:title").split())
-            abstract = " ".join(self._text(entry, "atom:summary").split())
-            published_at = self._text(entry, "atom:published")
-            paper_id = url.rsplit("/", 1)[-1] if url else title
-            summary = self.summarizer.summarize_text(item_type="arxiv", title=title, text=abstract)
+        for entry, summary in zip(entries, summaries):
             items.append(
                 FrontierItem(
-                    id=paper_id,
+                    id=entry.paper_id,
                     type="arxiv",
-                    title=title,
+                    title=entry.title,
                     source="arXiv",
-                    url=url,
-                    source_urls=[candidate for candidate in [url, pdf_url] if candidate],
-                    pdf_url=pdf_url,
-                    published_at=published_at,
+                    url=entry.url,
+                    source_urls=[candidate for candidate in [entry.url, entry.pdf_url] if candidate],
+                    pdf_url=entry.pdf_url,
+                    published_at=entry.published_at,
                     collected_at=utc_now_iso(),
                     summary=summary,
                     executive_summary=summary,
-                    highlights=[f"Published: {published_at[:10]}"] if published_at else [],
+                    highlights=[f"Published: {entry.published_at[:10]}"] if entry.published_at else [],
                     suggested_actions=[],
                     learning=[],
-                    tags=["arxiv", "research"],
+                    tags=["arxiv", "research", entry.category],
                     week_key=current_week_key(),
                     digest_date=current_digest_date(),
                     raw_source_type="arxiv",
@@ -61,6 +201,16 @@ class ArxivCollector(Collector):
             )
         return items
 
+    def _throttle(self) -> None:
+        cassette = current_cassette()
+        if cassette is not None and cassette.replaying:
+            return
+        if self._last_request_at is not None:
+            remaining = self.request_delay - (time.monotonic() - self._last_request_at)
+            if remaining > 0:
+                time.sleep(remaining)
+        self._last_request_at = time.monotonic()
+
     def _text(self, entry: ET.Element, selector: str) -> str:
         node = entry.find(selector, ATOM_NS)
         return (node.text or "").strip() if node is not None else ""
@@ -1,13 +1,47 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any
 
 from scripts.lib.models.item import FrontierItem
+from scripts.utils.dates import parse_timestamp
 
 
 class Collector(ABC):
     source_type: str
+    since: datetime | None = None
+    known_keys: frozenset[str] = frozenset()
+    incremental: bool = False
 
     @abstractmethod
     def collect(self) -> list[FrontierItem]:
         raise NotImplementedError
+
+    def configure_state(self, state_dir: Path) -> None:
+        pass
+
+    def commit_state(self) -> None:
+        """Persist state from the last collect(); called once its items are saved."""
+
+    def pending_state(self) -> dict[str, Any] | None:
+        """Return the state commit_state() would persist, for checkpointing."""
+        return None
+
+    def restore_pending_state(self, state: dict[str, Any]) -> None:
+        """Reload pending state checkpointed by a run that stopped before committing it."""
+
+    def configure_incremental(self, *, since: str | None, known_keys: set[str] | frozenset[str]) -> None:
+        self.incremental = True
+        self.since = parse_timestamp(since)
+        self.known_keys = frozenset(known_keys)
+
+    def is_new(self, *, key: str | None = None, published_at: str | None = None) -> bool:
+        if key and key in self.known_keys:
+            return False
+        if self.since is not None and published_at:
+            published = parse_timestamp(published_at)
+            if published is not None and published <= self.since:
+                return False
+        return True
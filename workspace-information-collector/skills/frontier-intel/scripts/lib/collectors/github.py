@@ -4,12 +4,13 @@ import json
 import re
 from html import unescape
 from urllib.parse import quote
-from urllib.request import Request, urlopen
+from urllib.request import Request
 
 from scripts.lib.collectors.base import Collector
 from scripts.lib.models.item import FrontierItem
 from scripts.utils.command import load_json_output
 from scripts.utils.dates import current_digest_date, current_week_key, utc_now_iso
+from scripts.utils.http import read_url
 from scripts.utils.summarizer import Summarizer
 
 GITHUB_SEARCH_API = "https://api.github.com/search/repositories?q={query}&sort=stars&order=desc&per_page={limit}"
@@ -40,6 +41,8 @@ class GitHubCollector(Collector):
         items: list[FrontierItem] = []
         for repo in payload[: self.limit]:
             name = repo.get("nameWithOwner") or repo.get("full_name") or ""
+            if not self.is_new(key=name):
+                continue
             repo = self._enrich_repo(repo, name)
             description = repo.get("description") or ""
             stars = repo.get("stargazersCount") or repo.get("stargazers_count") or 0
@@ -82,8 +85,7 @@ class GitHubCollector(Collector):
     def _fetch_trending_payload(self) -> list[dict]:
         request = Request(GITHUB_TRENDING_URL, headers={"User-Agent": "Mozilla/5.0"})
         try:
-            with urlopen(request) as response:
-                html = response.read().decode()
+            html = read_url(request).decode()
         except Exception:
             return []
         payload: list[dict] = []
@@ -132,8 +134,7 @@ class GitHubCollector(Collector):
             GITHUB_SEARCH_API.format(query=quote(self.query), limit=self.limit),
             headers={"Accept": "application/vnd.github+json", "User-Agent": "frontier-intel/1.0"},
         )
-        with urlopen(request) as response:
-            payload = json.loads(response.read().decode())
+        payload = json.loads(read_url(request).decode())
         return payload.get("items", [])
 
     def _enrich_repo(self, repo: dict, name: str) -> dict:
@@ -146,8 +147,7 @@ class GitHubCollector(Collector):
                 GITHUB_REPO_API.format(name=name),
                 headers={"Accept": "application/vnd.github+json", "User-Agent": "frontier-intel/1.0"},
             )
-            with urlopen(request) as response:
-                payload = json.loads(response.read().decode())
+            payload = json.loads(read_url(request).decode())
             merged = dict(repo)
             merged.update(payload)
             return merged
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import json
-from urllib.request import Request, urlopen
+from urllib.request import Request
 
 from scripts.lib.collectors.base import Collector
 from scripts.lib.models.item import FrontierItem
 from scripts.utils.dates import current_digest_date, current_week_key, utc_now_iso
+from scripts.utils.http import read_url
 from scripts.utils.text import clean_summary_text
 
 DEFAULT_SUBREDDITS = ["MachineLearning", "LocalLLaMA", "singularity"]
@@ -75,8 +76,7 @@ class RedditCollector(Collector):
             url=f"https://www.reddit.com/r/{subreddit}/hot.json?limit={self.per_subreddit}",
             headers={"User-Agent": "frontier-intel/1.0"},
         )
-        with urlopen(request) as response:
-            return json.loads(response.read().decode())
+        return json.loads(read_url(request).decode())
 
     def _should_skip_title(self, title: str) -> bool:
         lowered = title.lower()
@@ -40,10 +40,17 @@ AI_SIGNAL_PATTERN = re.compile(
 class TwitterCollector(Collector):
     source_type = "tweet"
 
-    def __init__(self, handles: list[str] | None = None, per_handle: int = 1, search_limit: int = 5) -> None:
+    def __init__(
+        self,
+        handles: list[str] | None = None,
+        per_handle: int = 1,
+        search_limit: int = 5,
+        max_total: int = MAX_TWEETS_TOTAL,
+    ) -> None:
         self.handles = handles or DEFAULT_HANDLES
         self.per_handle = per_handle
         self.search_limit = search_limit
+        self.max_total = max_total
 
     def collect(self) -> list[FrontierItem]:
         items: list[FrontierItem] = []
@@ -51,7 +58,7 @@ class TwitterCollector(Collector):
             items.extend(self._collect_handle(handle))
         if items:
             ranked = sorted(items, key=lambda item: item.score, reverse=True)
-            return ranked[:MAX_TWEETS_TOTAL]
+            return ranked[: self.max_total]
         return self._collect_search_fallback()
 
     def _collect_handle(self, handle: str) -> list[FrontierItem]:
@@ -60,7 +67,7 @@ class TwitterCollector(Collector):
         except Exception:
             return []
         tweets = payload.get("items", []) if isinstance(payload, dict) else payload
-        tweet_dicts = [tweet for tweet in tweets if isinstance(tweet, dict) and self._is_relevant(tweet)]
+        tweet_dicts = [tweet for tweet in tweets if isinstance(tweet, dict) and self._is_relevant(tweet) and self._is_new_tweet(tweet)]
         ranked = sorted(tweet_dicts, key=self._fresh_signal_score, reverse=True)
         limited = ranked[: self.per_handle]
         return [self._tweet_to_item(handle, tweet) for tweet in limited]
@@ -74,7 +81,7 @@ class TwitterCollector(Collector):
         except Exception:
             return []
         tweets = payload.get("items", []) if isinstance(payload, dict) else payload
-        tweet_dicts = [tweet for tweet in tweets if isinstance(tweet, dict) and self._is_relevant(tweet)]
+        tweet_dicts = [tweet for tweet in tweets if isinstance(tweet, dict) and self._is_relevant(tweet) and self._is_new_tweet(tweet)]
         ranked = sorted(tweet_dicts, key=self._fresh_signal_score, reverse=True)
         items: list[FrontierItem] = []
         for tweet in ranked[: self.search_limit]:
@@ -140,6 +147,9 @@ class TwitterCollector(Collector):
             return 250
         return 0
 
+    def _is_new_tweet(self, tweet: dict) -> bool:
+        return self.is_new(published_at=tweet.get("createdAt") or tweet.get("created_at"))
+
     def _is_relevant(self, tweet: dict) -> bool:
         text = ((tweet.get("text") or tweet.get("full_text") or "") + " " + (tweet.get("quotedText") or ""))
         return bool(AI_SIGNAL_PATTERN.search(text))
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+from collections import Counter
 from pathlib import Path
+from typing import Iterable
 from urllib.parse import urlsplit
 
 from scripts.lib.collectors.base import Collector
 from scripts.lib.models.item import FrontierItem
-from scripts.utils.command import run_command
+from scripts.lib.pipeline.dedupe import url_dedup_key
+from scripts.lib.storage.state_store import JsonStateStore
+from scripts.utils.command import CommandPool, CommandSpec, PooledResult
 from scripts.utils.dates import current_digest_date, current_week_key, utc_now_iso
 from scripts.utils.fetcher import fetch_url_text
-from scripts.utils.quality import is_bad_summary
+from scripts.utils.quality import is_bad_summary, snippet_issues, title_issues
 from scripts.utils.summarizer import Summarizer
+from scripts.utils.tracing import span
 
 BASE_DIR = Path('/root/openclaw-workspaces/workspace-information-collector')
 TAVILY_SCRIPT = BASE_DIR / 'skills' / 'tavily-search' / 'scripts' / 'search.mjs'
@@ -31,22 +36,44 @@ HIGH_SIGNAL_DOMAINS = {
     'fortune.com', 'techcrunch.com', 'cnbc.com', 'axios.com', 'forbes.com',
     'www.microsoft.com', 'openai.com', 'www.theverge.com', 'roboticsandautomationnews.com',
 }
+MAX_CANDIDATES_PER_QUERY = 3
+SEARCH_CONCURRENCY = 4
+SEARCH_DEADLINE_SECONDS = 180.0
+SEARCH_TIMEOUT_SECONDS = 90.0
+REJECTING_TITLE_ISSUES = {'low_signal_title'}
+TRIAGE_PENALTY = 10.0
 
 
 class WebNewsCollector(Collector):
     source_type = 'news'
 
-    def __init__(self, limit: int = 7) -> None:
+    def __init__(
+        self,
+        limit: int = 7,
+        per_query: int = MAX_CANDIDATES_PER_QUERY,
+        queries: list[str] | None = None,
+        search_concurrency: int = SEARCH_CONCURRENCY,
+        search_deadline: float = SEARCH_DEADLINE_SECONDS,
+    ) -> None:
         self.limit = limit
+        self.per_query = per_query
+        self.queries = list(queries or NEWS_QUERIES)
+        self.search_concurrency = search_concurrency
+        self.search_deadline = search_deadline
         self.summarizer = Summarizer()
+        self.triage_report: JsonStateStore | None = None
+        self.rejected: list[dict] = []
+
+    def configure_state(self, state_dir: Path) -> None:
+        self.triage_report = JsonStateStore(state_dir / 'news-triage.json')
 
     def collect(self) -> list[FrontierItem]:
-        raw_results = self._fetch_results()
+        candidates = self._triage(self._fetch_results())
         items: list[FrontierItem] = []
-        for result in raw_results:
+        for result in candidates:
             url = result.get('url', '')
             title = result.get('title', '')
-            snippet = (result.get('text') or result.get('summary') or '').strip()
+            snippet = self._snippet(result)
             full_text = self._fetch_full_text(url) or snippet
             summary = self.summarizer.summarize_text(item_type='news', title=title, text=full_text)
             if is_bad_summary(title, summary):
@@ -65,6 +92,51 @@ class WebNewsCollector(Collector):
         items.sort(key=lambda current: current.score, reverse=True)
         return items[: self.limit]
 
+    def _triage(self, results: list[dict]) -> list[dict]:
+        with span('triage', 'news') as current:
+            rejected: list[dict] = []
+            seen_titles: set[str] = set()
+            ranked_by_query: dict[str | None, list[tuple[float, dict]]] = {}
+            for result in results:
+                url = result.get('url', '')
+                title = result.get('title', '')
+                reason = self._rejection_reason(url, title, seen_titles)
+                if reason:
+                    rejected.append(_rejection(result, reason))
+                    continue
+                if title.strip():
+                    seen_titles.add(title.strip().lower())
+                snippet = self._snippet(result)
+                penalty = TRIAGE_PENALTY * (len(title_issues(title)) + len(snippet_issues(title, snippet)))
+                priority = self._news_score(title=title, url=url, summary=snippet) - penalty
+                ranked_by_query.setdefault(result.get('query'), []).append((priority, result))
+            kept: list[dict] = []
+            for ranked in ranked_by_query.values():
+                ranked.sort(key=lambda entry: entry[0], reverse=True)
+                kept.extend(result for _, result in ranked[: self.per_query])
+                rejected.extend(_rejection(result, 'below_top_n') for _, result in ranked[self.per_query :])
+            self.rejected = rejected
+            reasons = dict(Counter(entry['reason'] for entry in rejected))
+            if current is not None:
+                current.args.update(kept=len(kept), rejected=reasons)
+            if self.triage_report is not None:
+                self.triage_report.write({'kept': [result.get('url', '') for result in kept], 'rejected': rejected, 'reasons': reasons})
+        return kept
+
+    def _rejection_reason(self, url: str, title: str, seen_titles: set[str]) -> str | None:
+        if not self.is_new(key=url_dedup_key(url)):
+            return 'known'
+        if _domain(url) in LOW_QUALITY_DOMAINS:
+            return 'low_quality_domain'
+        if title.strip() and title.strip().lower() in seen_titles:
+            return 'duplicate_title'
+        if REJECTING_TITLE_ISSUES.intersection(title_issues(title)):
+            return 'low_signal_title'
+        return None
+
+    def _snippet(self, result: dict) -> str:
+        return (result.get('text') or result.get('summary') or '').strip()
+
     def _fetch_full_text(self, url: str) -> str:
         try:
             return fetch_url_text(url)
@@ -72,43 +144,39 @@ class WebNewsCollector(Collector):
             return ''
 
     def _fetch_results(self) -> list[dict]:
+        specs: list[CommandSpec] = []
+        for query in self.queries:
+            specs.append(CommandSpec(self._tavily_command(query), self._parse_tavily_output, SEARCH_TIMEOUT_SECONDS))
+            specs.append(CommandSpec(self._exa_command(query), self._parse_exa_output, SEARCH_TIMEOUT_SECONDS))
+        pool = CommandPool(max_concurrency=self.search_concurrency, deadline=self.search_deadline)
+        outcomes = iter(pool.run(specs))
         merged: list[dict] = []
         seen_urls: set[str] = set()
-        seen_titles: set[str] = set()
-        for query in NEWS_QUERIES:
-            for result in self._run_tavily_query(query) + self._run_exa_query(query):
+        for query in self.queries:
+            tavily, exa = next(outcomes), next(outcomes)
+            for result in self._tagged(tavily, 'tavily') + self._tagged(exa, 'exa'):
                 url = (result.get('url') or '').strip()
-                title = (result.get('title') or '').strip().lower()
-                if not url or url in seen_urls or title in seen_titles:
+                if not url or url in seen_urls:
                     continue
                 seen_urls.add(url)
-                if title:
-                    seen_titles.add(title)
+                result['query'] = query
                 merged.append(result)
         return merged
 
-    def _run_tavily_query(self, query: str) -> list[dict]:
-        command = ['node', str(TAVILY_SCRIPT), query, '--topic', 'news', '--days', '1', '-n', '5']
-        result = run_command(command, timeout=90)
-        if not result.ok:
-            return []
-        results = self._parse_tavily_output(result.stdout)
-        for item in results:
-            item['retrieval_source'] = 'tavily'
-        return results
+    def _tavily_command(self, query: str) -> list[str]:
+        return ['node', str(TAVILY_SCRIPT), query, '--topic', 'news', '--days', '1', '-n', '5']
 
-    def _run_exa_query(self, query: str) -> list[dict]:
-        command = ['mcporter', 'call', f'exa.web_search_exa(query: "{query}", numResults: 5)']
-        result = run_command(command, timeout=90)
-        if not result.ok:
+    def _exa_command(self, query: str) -> list[str]:
+        return ['mcporter', 'call', f'exa.web_search_exa(query: "{query}", numResults: 5)']
+
+    def _tagged(self, outcome: PooledResult, retrieval_source: str) -> list[dict]:
+        if not outcome.ok or not outcome.parsed:
             return []
-        results = self._parse_exa_output(result.stdout)
-        for item in results:
-            item['retrieval_source'] = 'exa'
-        return results
+        for item in outcome.parsed:
+            item['retrieval_source'] = retrieval_source
+        return outcome.parsed
 
-    def _parse_tavily_output(self, text: str) -> list[dict]:
-        lines = [line.rstrip() for line in text.splitlines()]
+    def _parse_tavily_output(self, lines: Iterable[str]) -> list[dict]:
         results: list[dict] = []
         current: dict[str, str] | None = None
         in_sources = False
@@ -134,10 +202,10 @@ class WebNewsCollector(Collector):
             results.append(current)
         return results
 
-    def _parse_exa_output(self, text: str) -> list[dict]:
+    def _parse_exa_output(self, lines: Iterable[str]) -> list[dict]:
         results: list[dict] = []
         current: dict[str, str] | None = None
-        for line in text.splitlines():
+        for line in lines:
             stripped = line.strip()
             if not stripped:
                 continue
@@ -176,3 +244,11 @@ class WebNewsCollector(Collector):
         if any(term in summary_lower for term in ('model', 'research', 'policy', 'robot', 'agent', 'deployment', 'reasoning', 'world model')):
             score += 6.0
         return score
+
+
+def _domain(url: str) -> str:
+    return urlsplit(url).netloc.lower().removeprefix('www.')
+
+
+def _rejection(result: dict, reason: str) -> dict:
+    return {'url': result.get('url', ''), 'title': result.get('title', ''), 'query': result.get('query'), 'reason': reason}
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Any
 
 
@@ -27,8 +27,34 @@ class FrontierItem:
     score: float = 0.0
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "id": self.id,
+            "type": self.type,
+            "title": self.title,
+            "source": self.source,
+            "url": self.url,
+            "source_urls": list(self.source_urls),
+            "pdf_url": self.pdf_url,
+            "published_at": self.published_at,
+            "collected_at": self.collected_at,
+            "summary": self.summary,
+            "executive_summary": self.executive_summary,
+            "highlights": list(self.highlights),
+            "suggested_actions": list(self.suggested_actions),
+            "learning": list(self.learning),
+            "tags": list(self.tags),
+            "week_key": self.week_key,
+            "digest_date": self.digest_date,
+            "raw_source_type": self.raw_source_type,
+            "score": self.score,
+        }
 
     @classmethod
     def from_dict(cls, payload: dict[str, Any]) -> "FrontierItem":
-        return cls(**payload)
+        if payload.keys() <= FRONTIER_ITEM_FIELD_SET:
+            return cls(**payload)
+        return cls(**{key: value for key, value in payload.items() if key in FRONTIER_ITEM_FIELD_SET})
+
+
+FRONTIER_ITEM_FIELDS = tuple(current.name for current in fields(FrontierItem))
+FRONTIER_ITEM_FIELD_SET = frozenset(FRONTIER_ITEM_FIELDS)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from scripts.lib.pipeline.render import Block
+
+MAX_TEXT_LENGTH = 2000
+MAX_RICH_TEXT_SEGMENTS = 100
+MAX_BLOCKS_PER_REQUEST = 100
+NOTION_BLOCK_TYPES = {
+    "h1": "heading_1",
+    "h2": "heading_2",
+    "h3": "heading_3",
+    "bullet": "bulleted_list_item",
+}
+MARKDOWN_PREFIXES = (
+    ("### ", "heading_3"),
+    ("## ", "heading_2"),
+    ("# ", "heading_1"),
+    ("- ", "bulleted_list_item"),
+)
+
+
+def to_notion_blocks(block: "Block") -> list[dict]:
+    rich_text: list[dict] = []
+    if block.label:
+        rich_text.extend(text_segments(f"{block.label}: ", bold=True))
+    for span in block.spans:
+        rich_text.extend(text_segments(span.text, href=span.href, code=span.code))
+    return _blocks(NOTION_BLOCK_TYPES[block.kind], rich_text)
+
+
+def markdown_to_notion_blocks(markdown: str) -> list[dict]:
+    blocks: list[dict] = []
+    for line in markdown.splitlines():
+        if not line.strip():
+            continue
+        block_type, content = "paragraph", line
+        for prefix, candidate in MARKDOWN_PREFIXES:
+            if line.startswith(prefix):
+                block_type, content = candidate, line[len(prefix) :]
+                break
+        blocks.extend(_blocks(block_type, text_segments(content)))
+    return blocks
+
+
+def load_digest_blocks(markdown_path: Path) -> list[dict]:
+    rendered = markdown_path.with_name(markdown_path.name.removesuffix(".md") + ".notion.json")
+    if rendered.exists():
+        return json.loads(rendered.read_text())
+    if markdown_path.exists():
+        return markdown_to_notion_blocks(markdown_path.read_text())
+    return []
+
+
+def text_segments(content: str, *, href: str | None = None, bold: bool = False, code: bool = False) -> list[dict]:
+    segments: list[dict] = []
+    for start in range(0, len(content), MAX_TEXT_LENGTH):
+        text: dict = {"content": content[start : start + MAX_TEXT_LENGTH]}
+        if href:
+            text["link"] = {"url": href}
+        segment: dict = {"type": "text", "text": text}
+        if bold or code:
+            segment["annotations"] = {"bold": bold, "code": code}
+        segments.append(segment)
+    return segments
+
+
+def batched(blocks: list[dict], size: int = MAX_BLOCKS_PER_REQUEST) -> Iterator[list[dict]]:
+    for start in range(0, len(blocks), size):
+        yield blocks[start : start + size]
+
+
+def _blocks(block_type: str, rich_text: list[dict]) -> list[dict]:
+    # Notion caps rich_text at 100 segments per block, so longer text continues in
+    # further blocks of the same type instead of being cut off
+    chunks = [rich_text[start : start + MAX_RICH_TEXT_SEGMENTS] for start in range(0, len(rich_text), MAX_RICH_TEXT_SEGMENTS)]
+    return [{"object": "block", "type": block_type, block_type: {"rich_text": chunk}} for chunk in chunks or [[]]]
@@ -3,7 +3,9 @@ from __future__ import annotations
 import json
 from pathlib import Path
 from urllib.error import HTTPError
-from urllib.request import Request, urlopen
+from urllib.request import Request
+
+from scripts.utils.http import read_url
 
 
 NOTION_VERSION = "2025-09-03"
@@ -49,8 +51,7 @@ class NotionClient:
             },
         )
         try:
-            with urlopen(request) as response:
-                return json.loads(response.read().decode())
+            return json.loads(read_url(request).decode())
         except HTTPError as error:
             details = error.read().decode()
             raise RuntimeError(f"Notion API request failed: {error.code} {details}") from error
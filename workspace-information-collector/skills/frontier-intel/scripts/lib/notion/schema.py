@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from scripts.lib.models.item import FrontierItem
+from scripts.lib.notion.blocks import MAX_RICH_TEXT_SEGMENTS, text_segments
 
 
 def build_items_database_properties() -> dict:
@@ -87,7 +88,7 @@ def _title(content: str) -> dict:
 
 
 def _rich_text(content: str) -> dict:
-    return {"rich_text": [{"text": {"content": content[:1900]}}]} if content else {"rich_text": []}
+    return {"rich_text": text_segments(content)[:MAX_RICH_TEXT_SEGMENTS]}
 
 
 def _date(value: str | None) -> dict:
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from scripts.lib.models.item import FrontierItem
+from scripts.lib.notion.blocks import MAX_BLOCKS_PER_REQUEST, batched
 from scripts.lib.notion.client import NotionClient
 from scripts.lib.notion.schema import build_digest_page_properties, build_item_page_properties
 from scripts.lib.storage.state_store import JsonStateStore
@@ -21,24 +23,35 @@ class NotionSyncState:
 
 
 class NotionSyncService:
-    def __init__(self, client: NotionClient, project_dir: Path) -> None:
+    def __init__(self, client: NotionClient, project_dir: Path, max_workers: int = 3) -> None:
         self.client = client
         self.state = NotionSyncState(project_dir)
+        self.max_workers = max_workers
 
     def sync_items(self, database_id: str, items: list[FrontierItem]) -> list[dict]:
         state = self.state.read()
+        pending = [item for item in items if item.id not in state["items"]]
         synced_items: list[dict] = []
-        for item in items:
-            if item.id in state["items"]:
-                continue
-            payload = {
-                "parent": {"database_id": database_id},
-                "properties": build_item_page_properties(item),
-            }
-            result = self.client.create_page(payload)
-            state["items"][item.id] = result.get("id")
-            synced_items.append(result)
+        failure: BaseException | None = None
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [
+                pool.submit(
+                    self.client.create_page,
+                    {"parent": {"database_id": database_id}, "properties": build_item_page_properties(item)},
+                )
+                for item in pending
+            ]
+            for item, future in zip(pending, futures):
+                try:
+                    result = future.result()
+                except Exception as error:
+                    failure = failure or error
+                    continue
+                state["items"][item.id] = result.get("id")
+                synced_items.append(result)
         self.state.write(state)
+        if failure is not None:
+            raise failure
         return synced_items
 
     def sync_digest(
@@ -55,25 +68,46 @@ class NotionSyncService:
         suggested_actions: list[str],
         learning_themes: list[str],
         item_count: int,
+        children: list[dict] | None = None,
     ) -> dict | None:
         state = self.state.read()
+        # Digests whose body is still being appended, mapped to the blocks already sent
+        progress = state.setdefault("digest_progress", {})
+        children = children or []
         if digest_key in state["digests"]:
-            return None
-        payload = {
-            "parent": {"database_id": database_id},
-            "properties": build_digest_page_properties(
-                title=title,
-                period=period,
-                digest_date=digest_date,
-                week_key=week_key,
-                executive_summary=executive_summary,
-                top_highlights=top_highlights,
-                suggested_actions=suggested_actions,
-                learning_themes=learning_themes,
-                item_count=item_count,
-            ),
-        }
-        result = self.client.create_page(payload)
-        state["digests"][digest_key] = result.get("id")
-        self.state.write(state)
+            if digest_key not in progress:
+                return None
+            result = {"id": state["digests"][digest_key]}
+        else:
+            payload = {
+                "parent": {"database_id": database_id},
+                "properties": build_digest_page_properties(
+                    title=title,
+                    period=period,
+                    digest_date=digest_date,
+                    week_key=week_key,
+                    executive_summary=executive_summary,
+                    top_highlights=top_highlights,
+                    suggested_actions=suggested_actions,
+                    learning_themes=learning_themes,
+                    item_count=item_count,
+                ),
+            }
+            if children:
+                payload["children"] = children[:MAX_BLOCKS_PER_REQUEST]
+            result = self.client.create_page(payload)
+            # Record the page before appending, so a failed append resumes on this
+            # page instead of creating a second, partial digest
+            state["digests"][digest_key] = result.get("id")
+            if len(children) > MAX_BLOCKS_PER_REQUEST and result.get("id"):
+                progress[digest_key] = MAX_BLOCKS_PER_REQUEST
+            self.state.write(state)
+        sent = progress.get(digest_key, len(children))
+        for batch in batched(children[sent:]):
+            self.client.append_block_children(result["id"], batch)
+            sent += len(batch)
+            progress[digest_key] = sent
+            self.state.write(state)
+        if progress.pop(digest_key, None) is not None:
+            self.state.write(state)
         return result
@@ -16,12 +16,16 @@ def build_dedup_key(item: FrontierItem) -> str:
         trimmed = canonicalize_url(item.url).replace("https://github.com/", "")
         return trimmed
     if item.url and item.type in SOURCE_TYPES_WITH_URL_KEYS:
-        return hashlib.sha256(canonicalize_url(item.url).encode()).hexdigest()
+        return url_dedup_key(item.url)
     if item.url:
         return hashlib.sha256(item.url.encode()).hexdigest()
     return item.id
 
 
+def url_dedup_key(url: str) -> str:
+    return hashlib.sha256(canonicalize_url(url).encode()).hexdigest()
+
+
 def dedupe_items(items: list[FrontierItem]) -> list[FrontierItem]:
     unique_items: dict[str, FrontierItem] = {}
     for item in items:
@@ -29,3 +33,23 @@ def dedupe_items(items: list[FrontierItem]) -> list[FrontierItem]:
         item.id = dedup_key
         unique_items.setdefault(dedup_key, item)
     return list(unique_items.values())
+
+
+def merge_items(existing: list[FrontierItem], incoming: list[FrontierItem]) -> tuple[list[FrontierItem], set[str]]:
+    merged: dict[str, FrontierItem] = {item.id: item for item in existing}
+    changed: set[str] = set()
+    for item in incoming:
+        current = merged.get(item.id)
+        if current is None:
+            merged[item.id] = item
+            changed.add(item.id)
+            continue
+        winner, loser = (item, current) if item.score > current.score else (current, item)
+        source_urls = list(dict.fromkeys(winner.source_urls + loser.source_urls))
+        if winner is item:
+            item.collected_at = current.collected_at or item.collected_at
+        if winner is item or source_urls != winner.source_urls:
+            winner.source_urls = source_urls
+            merged[item.id] = winner
+            changed.add(item.id)
+    return list(merged.values()), changed
@@ -1,75 +1,181 @@
 from __future__ import annotations
 
+import hashlib
+from typing import TYPE_CHECKING, Any, Callable
+
 from scripts.lib.models.item import FrontierItem
+from scripts.lib.pipeline.render import Block, DigestDocument, Span, bullet, heading, render_markdown
 from scripts.lib.pipeline.selection import build_highlight_items, select_digest_items
+from scripts.lib.storage.similarity_index import item_key
+from scripts.utils.tracing import COUNTER_CACHE_HITS, incr
+
+if TYPE_CHECKING:
+    from scripts.lib.storage.similarity_index import RelatedItem
+    from scripts.lib.storage.trend_store import RisingTopic
+
+DAILY_SECTIONS = (
+    ("Top News", "news"),
+    ("Top GitHub Repos", "github"),
+    ("Top arXiv Papers", "arxiv"),
+    ("Top Twitter Signals", "tweet"),
+    ("Top Reddit Signals", "reddit"),
+)
+
 
+def build_daily_digest_markdown(
+    digest_date: str,
+    items: list[FrontierItem],
+    section_cache: dict[str, Any] | None = None,
+    related: dict[str, list[RelatedItem]] | None = None,
+    rising: list[RisingTopic] | None = None,
+) -> str:
+    return render_markdown(build_daily_digest_document(digest_date, items, section_cache, related, rising))
 
-def build_daily_digest_markdown(digest_date: str, items: list[FrontierItem]) -> str:
+
+def build_daily_digest_document(
+    digest_date: str,
+    items: list[FrontierItem],
+    section_cache: dict[str, Any] | None = None,
+    related: dict[str, list[RelatedItem]] | None = None,
+    rising: list[RisingTopic] | None = None,
+) -> DigestDocument:
     grouped = select_digest_items(items)
+    cache = section_cache if section_cache is not None else {}
+    related = related or {}
+
+    title = f"Daily Frontier AI Wrap-up — {digest_date}"
+    blocks: list[Block] = [heading(1, title)]
+    blocks.extend(_cached_section(cache, "executive_summary", items, lambda: _build_exec_summary(items), summary_only=True))
+    highlight_items = build_highlight_items(items)
+    blocks.extend(_cached_section(cache, "highlights", highlight_items, lambda: _build_highlights(highlight_items)))
+    if rising:
+        blocks.extend(build_rising_topics_section("Rising Topics", rising, "today"))
 
-    lines: list[str] = [f"# Daily Frontier AI Wrap-up — {digest_date}", ""]
-    lines.extend(_build_exec_summary(items))
-    lines.append("")
-    lines.extend(_build_highlights(items))
-    lines.append("")
-
-    for section_name, item_type in (
-        ("Top News", "news"),
-        ("Top GitHub Repos", "github"),
-        ("Top arXiv Papers", "arxiv"),
-        ("Top Twitter Signals", "tweet"),
-        ("Top Reddit Signals", "reddit"),
-    ):
+    rendered_items: list[FrontierItem] = []
+    for section_name, item_type in DAILY_SECTIONS:
         section_items = grouped.get(item_type, [])
         if not section_items:
+            cache.pop(item_type, None)
             continue
-        lines.append(f"## {section_name}")
-        lines.append("")
-        for index, item in enumerate(section_items, start=1):
-            lines.extend(_render_item(index, item))
-            lines.append("")
+        rendered_items.extend(section_items)
+        blocks.extend(
+            _cached_section(
+                cache,
+                item_type,
+                section_items,
+                lambda: _build_item_section(section_name, section_items, related),
+                related=related,
+            )
+        )
+
+    return DigestDocument(title, blocks, rendered_items)
+
+
+def changed_sections(previous: dict[str, Any], current: dict[str, Any]) -> list[str]:
+    keys = set(previous) | set(current)
+    return sorted(
+        key for key in keys if previous.get(key, {}).get("fingerprint") != current.get(key, {}).get("fingerprint")
+    )
+
+
+def _cached_section(
+    cache: dict[str, Any],
+    key: str,
+    items: list[FrontierItem],
+    render: Callable[[], list[Block]],
+    *,
+    summary_only: bool = False,
+    related: dict[str, list[RelatedItem]] | None = None,
+) -> list[Block]:
+    fingerprint = _fingerprint(items, summary_only=summary_only, related=related or {})
+    cached = cache.get(key)
+    if cached and cached.get("fingerprint") == fingerprint and "blocks" in cached:
+        incr(COUNTER_CACHE_HITS)
+        return [Block.from_dict(payload) for payload in cached["blocks"]]
+    blocks = render()
+    cache[key] = {"fingerprint": fingerprint, "blocks": [block.to_dict() for block in blocks]}
+    return blocks
+
+
+def _fingerprint(items: list[FrontierItem], *, summary_only: bool, related: dict[str, list[RelatedItem]]) -> str:
+    digest = hashlib.sha1()
+    if summary_only:
+        digest.update(f"{len(items)}|{sorted({item.type for item in items})}".encode())
+        return digest.hexdigest()
+    for item in items:
+        for value in (item.id, item.title, item.url, item.pdf_url or "", item.summary, item.executive_summary):
+            digest.update(value.encode())
+            digest.update(b"\x1f")
+        for values in (item.highlights, item.suggested_actions, item.learning):
+            digest.update("\x1e".join(values).encode())
+            digest.update(b"\x1f")
+        digest.update("\x1e".join(match.url for match in related.get(item_key(item), [])).encode())
+        digest.update(b"\x1d")
+    return digest.hexdigest()
+
+
+def build_rising_topics_section(title: str, rising: list[RisingTopic], period: str) -> list[Block]:
+    blocks = [heading(2, title)]
+    for topic in rising:
+        blocks.append(
+            bullet(
+                Span(topic.key, code=True),
+                f" ({topic.kind}): {topic.current} {period} vs {topic.baseline:g} typical, z={topic.z_score:g}",
+            )
+        )
+    return blocks
+
 
-    return "\n".join(line.rstrip() for line in lines).strip() + "\n"
+def _build_item_section(section_name: str, section_items: list[FrontierItem], related: dict[str, list[RelatedItem]]) -> list[Block]:
+    blocks = [heading(2, section_name)]
+    for index, item in enumerate(section_items, start=1):
+        blocks.extend(_render_item(index, item, related.get(item_key(item), [])))
+    return blocks
 
 
-def _build_exec_summary(items: list[FrontierItem]) -> list[str]:
+def _build_exec_summary(items: list[FrontierItem]) -> list[Block]:
     item_count = len(items)
     source_mix = sorted({item.type for item in items})
     summary = ", ".join(source_mix) if source_mix else "no sources"
     return [
-        "## Executive Summary",
-        "",
-        f"- Collected `{item_count}` frontier AI items across: {summary}.",
-        "- Every item below includes source links; arXiv items include direct PDF links.",
+        heading(2, "Executive Summary"),
+        bullet("Collected ", Span(str(item_count), code=True), f" frontier AI items across: {summary}."),
+        bullet("Every item below includes source links; arXiv items include direct PDF links."),
     ]
 
 
-def _build_highlights(items: list[FrontierItem]) -> list[str]:
-    highlights: list[str] = ["## Key Highlights", ""]
-    top_items = build_highlight_items(items)
+def _build_highlights(top_items: list[FrontierItem]) -> list[Block]:
+    highlights: list[Block] = [heading(2, "Key Highlights")]
     if not top_items:
-        highlights.append("- No high-signal items collected yet.")
+        highlights.append(bullet("No high-signal items collected yet."))
         return highlights
     for item in top_items:
-        bullet = item.executive_summary or item.summary or item.title
+        text = item.executive_summary or item.summary or item.title
         prefix = item.type.upper()
-        highlights.append(f"- [{prefix}] {bullet}")
+        highlights.append(bullet(f"[{prefix}] {text}"))
     return highlights
 
 
-def _render_item(index: int, item: FrontierItem) -> list[str]:
-    lines = [f"### {index}. {item.title}"]
+def _render_item(index: int, item: FrontierItem, related_items: list[RelatedItem] | None = None) -> list[Block]:
+    blocks = [heading(3, f"{index}. {item.title}")]
     if item.executive_summary:
-        lines.append(f"- **Executive Summary:** {item.executive_summary}")
+        blocks.append(bullet(item.executive_summary, label="Executive Summary"))
     elif item.summary:
-        lines.append(f"- **Summary:** {item.summary}")
+        blocks.append(bullet(item.summary, label="Summary"))
     if item.highlights:
-        lines.append(f"- **Highlights:** {'; '.join(item.highlights)}")
+        blocks.append(bullet("; ".join(item.highlights), label="Highlights"))
     if item.suggested_actions:
-        lines.append(f"- **Suggested Actions:** {'; '.join(item.suggested_actions)}")
+        blocks.append(bullet("; ".join(item.suggested_actions), label="Suggested Actions"))
     if item.learning:
-        lines.append(f"- **Learning:** {'; '.join(item.learning)}")
-    lines.append(f"- **Source:** {item.url}")
+        blocks.append(bullet("; ".join(item.learning), label="Learning"))
+    blocks.append(bullet(Span(item.url, href=item.url), label="Source"))
     if item.type == "arxiv" and item.pdf_url:
-        lines.append(f"- **PDF:** {item.pdf_url}")
-    return lines
+        blocks.append(bullet(Span(item.pdf_url, href=item.pdf_url), label="PDF"))
+    if related_items:
+        spans: list[str | Span] = []
+        for position, match in enumerate(related_items):
+            if position:
+                spans.append("; ")
+            spans.extend([Span(match.title, href=match.url), f" ({match.digest_date})"])
+        blocks.append(bullet(*spans, label="Related Earlier Items"))
+    return blocks
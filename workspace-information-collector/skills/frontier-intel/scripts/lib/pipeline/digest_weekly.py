@@ -1,47 +1,57 @@
 from __future__ import annotations
 
 from collections import Counter
+from typing import TYPE_CHECKING
 
 from scripts.lib.models.item import FrontierItem
+from scripts.lib.pipeline.digest_daily import build_rising_topics_section
+from scripts.lib.pipeline.render import Block, DigestDocument, Span, bullet, heading, render_markdown
 
+if TYPE_CHECKING:
+    from scripts.lib.storage.trend_store import RisingTopic
 
-def build_weekly_digest_markdown(week_key: str, items: list[FrontierItem]) -> str:
-    lines: list[str] = [f"# Weekly Frontier AI Summary — {week_key}", ""]
-    lines.extend(_build_week_summary(items))
-    lines.append("")
-    lines.extend(_build_theme_section(items))
-    lines.append("")
-    lines.extend(_build_actions_section(items))
-    return "\n".join(line.rstrip() for line in lines).strip() + "\n"
 
+def build_weekly_digest_markdown(week_key: str, items: list[FrontierItem], rising: list[RisingTopic] | None = None) -> str:
+    return render_markdown(build_weekly_digest_document(week_key, items, rising))
 
-def _build_week_summary(items: list[FrontierItem]) -> list[str]:
+
+def build_weekly_digest_document(week_key: str, items: list[FrontierItem], rising: list[RisingTopic] | None = None) -> DigestDocument:
+    title = f"Weekly Frontier AI Summary — {week_key}"
+    blocks: list[Block] = [heading(1, title)]
+    blocks.extend(_build_week_summary(items))
+    blocks.extend(_build_theme_section(items, rising or []))
+    blocks.extend(_build_actions_section(items))
+    return DigestDocument(title, blocks, sorted(items, key=lambda item: item.score, reverse=True))
+
+
+def _build_week_summary(items: list[FrontierItem]) -> list[Block]:
     return [
-        "## Week in One Paragraph",
-        "",
-        f"- This week captured `{len(items)}` frontier AI items with a mix of research, tooling, and fast-moving social signals.",
-        "- The weekly digest is designed to be shareable: concise, source-linked, and readable out of context.",
+        heading(2, "Week in One Paragraph"),
+        bullet("This week captured ", Span(str(len(items)), code=True), " frontier AI items with a mix of research, tooling, and fast-moving social signals."),
+        bullet("The weekly digest is designed to be shareable: concise, source-linked, and readable out of context."),
     ]
 
 
-def _build_theme_section(items: list[FrontierItem]) -> list[str]:
+def _build_theme_section(items: list[FrontierItem], rising: list[RisingTopic]) -> list[Block]:
     counts = Counter(item.type for item in items)
-    return [
-        "## Biggest Themes",
-        "",
-        f"- Research volume: `{counts.get('arxiv', 0)}` arXiv items.",
-        f"- Builder/tooling signal: `{counts.get('github', 0)}` GitHub items.",
-        f"- Social/community signal: `{counts.get('tweet', 0) + counts.get('reddit', 0)}` Twitter/Reddit items.",
-        f"- News signal: `{counts.get('news', 0)}` web/news items.",
+    blocks = [
+        heading(2, "Biggest Themes"),
+        bullet("Research volume: ", Span(str(counts.get("arxiv", 0)), code=True), " arXiv items."),
+        bullet("Builder/tooling signal: ", Span(str(counts.get("github", 0)), code=True), " GitHub items."),
+        bullet("Social/community signal: ", Span(str(counts.get("tweet", 0) + counts.get("reddit", 0)), code=True), " Twitter/Reddit items."),
+        bullet("News signal: ", Span(str(counts.get("news", 0)), code=True), " web/news items."),
     ]
+    if rising:
+        blocks.extend(build_rising_topics_section("Rising This Week", rising, "this week"))
+    return blocks
 
 
-def _build_actions_section(items: list[FrontierItem]) -> list[str]:
+def _build_actions_section(items: list[FrontierItem]) -> list[Block]:
     actions = [action for item in items for action in item.suggested_actions][:5]
-    lines = ["## Suggested Actions for Next Week", ""]
+    blocks = [heading(2, "Suggested Actions for Next Week")]
     if not actions:
-        lines.append("- Review top weekly items and decide which ones deserve deeper follow-up.")
-        return lines
+        blocks.append(bullet("Review top weekly items and decide which ones deserve deeper follow-up."))
+        return blocks
     for action in actions:
-        lines.append(f"- {action}")
-    return lines
+        blocks.append(bullet(action))
+    return blocks
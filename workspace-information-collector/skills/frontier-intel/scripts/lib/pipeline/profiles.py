@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import tomllib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from scripts.lib.collectors import COLLECTORS
+
+SOURCE_OPTIONS: dict[str, dict[str, type]] = {
+    "news": {"limit": int, "per_query": int, "queries": list, "search_concurrency": int, "search_deadline": float},
+    "github": {"query": str, "limit": int},
+    "arxiv": {"limit": int, "categories": list, "page_size": int, "summary_workers": int, "request_delay": float},
+    "tweet": {"handles": list, "per_handle": int, "search_limit": int, "max_total": int},
+    "reddit": {"subreddits": list, "per_subreddit": int},
+}
+NON_NEGATIVE_OPTIONS = {"request_delay"}
+PROFILE_KEYS = {"description", "time_budget_seconds", "sources"}
+
+
+class ProfileError(ValueError):
+    pass
+
+
+@dataclass(slots=True)
+class SourcePlan:
+    source_type: str
+    options: dict[str, Any] = field(default_factory=dict)
+    cache_ttl_minutes: float = 0.0
+
+
+@dataclass(slots=True)
+class RunProfile:
+    name: str
+    sources: dict[str, SourcePlan]
+    description: str = ""
+    time_budget_seconds: float | None = None
+
+    def source_types(self) -> tuple[str, ...]:
+        return tuple(self.sources)
+
+    def options(self) -> dict[str, dict[str, Any]]:
+        return {source_type: plan.options for source_type, plan in self.sources.items()}
+
+    def cache_ttls(self) -> dict[str, float]:
+        return {source_type: plan.cache_ttl_minutes for source_type, plan in self.sources.items() if plan.cache_ttl_minutes}
+
+
+def load_profiles(path: Path) -> dict[str, RunProfile]:
+    try:
+        payload = tomllib.loads(path.read_text())
+    except FileNotFoundError as error:
+        raise ProfileError(f"{path}: profile config not found") from error
+    except tomllib.TOMLDecodeError as error:
+        raise ProfileError(f"{path}: {error}") from error
+    errors: list[str] = []
+    profiles: dict[str, RunProfile] = {}
+    raw_profiles = payload.get("profiles")
+    if not isinstance(raw_profiles, dict) or not raw_profiles:
+        raise ProfileError(f"{path}: expected at least one [profiles.<name>] table")
+    for name, raw in raw_profiles.items():
+        profile = _parse_profile(name, raw, errors)
+        if profile is not None:
+            profiles[name] = profile
+    if errors:
+        raise ProfileError(f"{path}: invalid profile config:\n" + "\n".join(f"  {error}" for error in errors))
+    return profiles
+
+
+def load_profile(path: Path, name: str) -> RunProfile:
+    profiles = load_profiles(path)
+    if name not in profiles:
+        raise ProfileError(f"{path}: unknown profile {name!r}; expected any of {', '.join(profiles)}")
+    return profiles[name]
+
+
+def _parse_profile(name: str, raw: Any, errors: list[str]) -> RunProfile | None:
+    where = f"profiles.{name}"
+    if not isinstance(raw, dict):
+        errors.append(f"{where}: expected a table")
+        return None
+    for key in sorted(set(raw) - PROFILE_KEYS):
+        errors.append(f"{where}.{key}: unknown key")
+    description = raw.get("description", "")
+    if not isinstance(description, str):
+        errors.append(f"{where}.description: expected a string")
+    budget = _positive_number(raw.get("time_budget_seconds"), f"{where}.time_budget_seconds", errors)
+    raw_sources = raw.get("sources")
+    if not isinstance(raw_sources, dict) or not raw_sources:
+        errors.append(f"{where}.sources: expected at least one [{where}.sources.<source>] table")
+        return None
+    sources: dict[str, SourcePlan] = {}
+    for source_type, options in raw_sources.items():
+        plan = _parse_source(source_type, options, f"{where}.sources.{source_type}", errors)
+        if plan is not None:
+            sources[source_type] = plan
+    return RunProfile(name, sources, description if isinstance(description, str) else "", budget)
+
+
+def _parse_source(source_type: str, raw: Any, where: str, errors: list[str]) -> SourcePlan | None:
+    if source_type not in COLLECTORS:
+        errors.append(f"{where}: unknown source; expected any of {', '.join(COLLECTORS)}")
+        return None
+    if not isinstance(raw, dict):
+        errors.append(f"{where}: expected a table")
+        return None
+    options = dict(raw)
+    ttl = options.pop("cache_ttl_minutes", 0)
+    if isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl < 0:
+        errors.append(f"{where}.cache_ttl_minutes: expected a non-negative number")
+        ttl = 0
+    schema = SOURCE_OPTIONS[source_type]
+    for key, value in options.items():
+        expected = schema.get(key)
+        if expected is None:
+            errors.append(f"{where}.{key}: unknown option; expected any of cache_ttl_minutes, {', '.join(schema)}")
+        elif expected is list:
+            if not isinstance(value, list) or not value or not all(isinstance(entry, str) and entry.strip() for entry in value):
+                errors.append(f"{where}.{key}: expected a non-empty list of strings")
+        elif expected is str:
+            if not isinstance(value, str) or not value.strip():
+                errors.append(f"{where}.{key}: expected a non-empty string")
+        elif expected is int:
+            if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+                errors.append(f"{where}.{key}: expected a positive integer")
+        elif key in NON_NEGATIVE_OPTIONS:
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+                errors.append(f"{where}.{key}: expected a non-negative number")
+        else:
+            _positive_number(value, f"{where}.{key}", errors)
+    return SourcePlan(source_type, options, float(ttl))
+
+
+def _positive_number(value: Any, where: str, errors: list[str]) -> float | None:
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+        errors.append(f"{where}: expected a positive number")
+        return None
+    return float(value)
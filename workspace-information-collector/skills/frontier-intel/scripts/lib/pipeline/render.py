@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import threading
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from html import escape
+from pathlib import Path
+from typing import Any, Callable, TextIO
+
+from scripts.lib.models.item import FrontierItem
+from scripts.lib.notion.blocks import to_notion_blocks
+
+FORMAT_MARKDOWN = "markdown"
+FORMAT_HTML = "html"
+FORMAT_JSON_FEED = "jsonfeed"
+FORMAT_NOTION = "notion"
+HEADING_KINDS = frozenset({"h1", "h2", "h3"})
+MARKDOWN_LINK_ESCAPES = frozenset("\\[]*_`<>")
+JSON_FEED_VERSION = "https://jsonfeed.org/version/1.1"
+DIGEST_SUFFIXES = {
+    FORMAT_MARKDOWN: ".md",
+    FORMAT_HTML: ".html",
+    FORMAT_JSON_FEED: ".feed.json",
+    FORMAT_NOTION: ".notion.json",
+}
+
+MARKDOWN_TEMPLATES: dict[str, Callable[..., str]] = {
+    "h1": "# {text}\n".format,
+    "h2": "## {text}\n".format,
+    "h3": "### {text}\n".format,
+    "bullet": "- {text}\n".format,
+    "label": "**{label}:** {text}".format,
+    "link": "[{text}]({href})".format,
+    "code": "`{text}`".format,
+}
+HTML_TEMPLATES: dict[str, Callable[..., str]] = {
+    "document_start": '<!doctype html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n<title>{title}</title>\n</head>\n<body>\n'.format,
+    "document_end": "</body>\n</html>\n".format,
+    "h1": "<h1>{text}</h1>\n".format,
+    "h2": "<h2>{text}</h2>\n".format,
+    "h3": "<h3>{text}</h3>\n".format,
+    "bullet": "<li>{text}</li>\n".format,
+    "list_start": "<ul>\n".format,
+    "list_end": "</ul>\n".format,
+    "label": "<strong>{label}:</strong> {text}".format,
+    "link": '<a href="{href}">{text}</a>'.format,
+    "code": "<code>{text}</code>".format,
+}
+
+
+@dataclass(slots=True)
+class Span:
+    text: str
+    href: str | None = None
+    code: bool = False
+
+
+@dataclass(slots=True)
+class Block:
+    kind: str
+    spans: list[Span]
+    label: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"kind": self.kind, "label": self.label, "spans": [[span.text, span.href, span.code] for span in self.spans]}
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "Block":
+        return cls(payload["kind"], [Span(*span) for span in payload["spans"]], payload.get("label"))
+
+    def plain_text(self) -> str:
+        return "".join(span.text for span in self.spans)
+
+
+@dataclass(slots=True)
+class DigestDocument:
+    title: str
+    blocks: list[Block]
+    items: list[FrontierItem] = field(default_factory=list)
+
+
+def heading(level: int, text: str) -> Block:
+    return Block(f"h{level}", [Span(text)])
+
+
+def bullet(*parts: str | Span, label: str | None = None) -> Block:
+    return Block("bullet", [part if isinstance(part, Span) else Span(part) for part in parts], label)
+
+
+class MarkdownSink:
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+        self._previous: str | None = None
+
+    def start(self, document: DigestDocument) -> None:
+        pass
+
+    def block(self, block: Block) -> None:
+        is_heading = block.kind in HEADING_KINDS
+        if self._previous is not None and (self._previous in ("h1", "h2") or (is_heading and self._previous not in HEADING_KINDS)):
+            self.stream.write("\n")
+        text = "".join(_markdown_span(span) for span in block.spans).rstrip()
+        if block.label:
+            text = MARKDOWN_TEMPLATES["label"](label=block.label, text=text)
+        self.stream.write(MARKDOWN_TEMPLATES[block.kind](text=text))
+        self._previous = block.kind
+
+    def item(self, item: FrontierItem) -> None:
+        pass
+
+    def finish(self) -> None:
+        pass
+
+
+class HtmlSink:
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+        self._in_list = False
+
+    def start(self, document: DigestDocument) -> None:
+        self.stream.write(HTML_TEMPLATES["document_start"](title=escape(document.title)))
+
+    def block(self, block: Block) -> None:
+        is_bullet = block.kind == "bullet"
+        if is_bullet != self._in_list:
+            self.stream.write(HTML_TEMPLATES["list_start" if is_bullet else "list_end"]())
+            self._in_list = is_bullet
+        text = "".join(_html_span(span) for span in block.spans)
+        if block.label:
+            text = HTML_TEMPLATES["label"](label=escape(block.label), text=text)
+        self.stream.write(HTML_TEMPLATES[block.kind](text=text))
+
+    def item(self, item: FrontierItem) -> None:
+        pass
+
+    def finish(self) -> None:
+        if self._in_list:
+            self.stream.write(HTML_TEMPLATES["list_end"]())
+        self.stream.write(HTML_TEMPLATES["document_end"]())
+
+
+class JsonFeedSink:
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+        self._count = 0
+
+    def start(self, document: DigestDocument) -> None:
+        header = json.dumps({"version": JSON_FEED_VERSION, "title": document.title}, ensure_ascii=False)
+        self.stream.write(header[:-1] + ', "items": [')
+
+    def block(self, block: Block) -> None:
+        pass
+
+    def item(self, item: FrontierItem) -> None:
+        entry: dict[str, Any] = {
+            "id": item.id or item.url,
+            "url": item.url,
+            "title": item.title,
+            "content_text": item.executive_summary or item.summary or item.title,
+            "tags": item.tags,
+        }
+        if item.published_at or item.collected_at:
+            entry["date_published"] = item.published_at or item.collected_at
+        if item.pdf_url:
+            entry["attachments"] = [{"url": item.pdf_url, "mime_type": "application/pdf"}]
+        self.stream.write(("," if self._count else "") + "\n" + json.dumps(entry, ensure_ascii=False))
+        self._count += 1
+
+    def finish(self) -> None:
+        self.stream.write("\n]}\n")
+
+
+class NotionBlocksSink:
+    def __init__(self, stream: TextIO | None = None) -> None:
+        self.stream = stream
+        self.blocks: list[dict[str, Any]] = []
+
+    def start(self, document: DigestDocument) -> None:
+        pass
+
+    def block(self, block: Block) -> None:
+        self.blocks.extend(to_notion_blocks(block))
+
+    def item(self, item: FrontierItem) -> None:
+        pass
+
+    def finish(self) -> None:
+        if self.stream is not None:
+            json.dump(self.blocks, self.stream, ensure_ascii=False)
+
+
+SINK_TYPES = {
+    FORMAT_MARKDOWN: MarkdownSink,
+    FORMAT_HTML: HtmlSink,
+    FORMAT_JSON_FEED: JsonFeedSink,
+    FORMAT_NOTION: NotionBlocksSink,
+}
+
+
+def render_document(document: DigestDocument, sinks: list[Any]) -> None:
+    for sink in sinks:
+        sink.start(document)
+    for block in document.blocks:
+        for sink in sinks:
+            sink.block(block)
+    for item in document.items:
+        for sink in sinks:
+            sink.item(item)
+    for sink in sinks:
+        sink.finish()
+
+
+def digest_targets(directory: Path, stem: str, formats: tuple[str, ...] = tuple(DIGEST_SUFFIXES)) -> dict[str, Path]:
+    return {output_format: directory / f"{stem}{DIGEST_SUFFIXES[output_format]}" for output_format in formats}
+
+
+def render_to_files(document: DigestDocument, targets: dict[str, Path]) -> dict[str, Path]:
+    with ExitStack() as stack:
+        pending: list[tuple[Path, Path]] = []
+        sinks = []
+        for output_format, target in targets.items():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            stream = stack.enter_context(temp_path.open("w", encoding="utf-8"))
+            sinks.append(SINK_TYPES[output_format](stream))
+            pending.append((temp_path, target))
+        try:
+            render_document(document, sinks)
+        except BaseException:
+            stack.close()
+            for temp_path, _ in pending:
+                temp_path.unlink(missing_ok=True)
+            raise
+    for temp_path, target in pending:
+        os.replace(temp_path, target)
+    return targets
+
+
+def render_markdown(document: DigestDocument) -> str:
+    stream = io.StringIO()
+    render_document(document, [MarkdownSink(stream)])
+    return stream.getvalue()
+
+
+def _markdown_span(span: Span) -> str:
+    if span.code:
+        return MARKDOWN_TEMPLATES["code"](text=span.text)
+    if span.href and span.href != span.text:
+        return MARKDOWN_TEMPLATES["link"](text=_markdown_link_text(span.text), href=_markdown_link_href(span.href))
+    return span.text
+
+
+def _markdown_link_text(text: str) -> str:
+    # Brackets would end the link text early; the rest would start inline markup or HTML
+    return "".join("\\" + char if char in MARKDOWN_LINK_ESCAPES else char for char in text)
+
+
+def _markdown_link_href(href: str) -> str:
+    return href.replace(" ", "%20").replace("(", "%28").replace(")", "%29").replace("<", "%3C").replace(">", "%3E")
+
+
+def _html_span(span: Span) -> str:
+    text = escape(span.text)
+    if span.code:
+        text = HTML_TEMPLATES["code"](text=text)
+    if span.href:
+        return HTML_TEMPLATES["link"](href=escape(span.href), text=text)
+    return text
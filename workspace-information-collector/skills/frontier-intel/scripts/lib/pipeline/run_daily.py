@@ -1,44 +1,197 @@
 from __future__ import annotations
 
+import time
+from datetime import timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from scripts.lib.collectors.arxiv import ArxivCollector
-from scripts.lib.collectors.github import GitHubCollector
-from scripts.lib.collectors.reddit import RedditCollector
-from scripts.lib.collectors.twitter import TwitterCollector
-from scripts.lib.collectors.web_news import WebNewsCollector
+from scripts.lib.collectors import load_collector, source_types
 from scripts.lib.models.item import FrontierItem
-from scripts.lib.pipeline.dedupe import dedupe_items
-from scripts.lib.pipeline.digest_daily import build_daily_digest_markdown
+from scripts.lib.pipeline.dedupe import dedupe_items, merge_items
+from scripts.lib.pipeline.digest_daily import build_daily_digest_document, changed_sections
+from scripts.lib.pipeline.render import FORMAT_MARKDOWN, digest_targets, render_to_files
 from scripts.lib.pipeline.scoring import apply_scores
+from scripts.lib.pipeline.selection import select_digest_items
+from scripts.lib.storage.checkpoints import STAGE_COLLECTED, STAGE_COLLECTOR_STATE, STAGE_SCORED, RunCheckpoints
 from scripts.lib.storage.items_store import ItemsStore
-from scripts.utils.dates import current_digest_date
+from scripts.lib.storage.run_lock import RunLock
+from scripts.lib.storage.search_index import SearchIndex
+from scripts.lib.storage.similarity_index import SimilarityIndex
+from scripts.lib.storage.trend_store import TrendStore
+from scripts.lib.storage.state_store import JsonStateStore
+from scripts.utils.dates import current_digest_date, parse_timestamp, utc_now_iso, utc_timestamp_slug
+from scripts.utils.tracing import COUNTER_CACHE_HITS, incr, span, start_trace
 
+if TYPE_CHECKING:
+    from scripts.lib.collectors.base import Collector
+    from scripts.lib.pipeline.profiles import RunProfile
 
-COLLECTOR_TYPES = (
-    WebNewsCollector,
-    GitHubCollector,
-    ArxivCollector,
-    TwitterCollector,
-    RedditCollector,
-)
 
-
-def collect_all_items() -> list[FrontierItem]:
+def collect_all_items(
+    checkpoints: RunCheckpoints | None = None,
+    *,
+    sources: tuple[str, ...] | None = None,
+    options: dict[str, dict[str, Any]] | None = None,
+    time_budget_seconds: float | None = None,
+    since_by_source: dict[str, str] | None = None,
+    known_keys: set[str] | None = None,
+    state_dir: Path | None = None,
+) -> list[FrontierItem]:
     items: list[FrontierItem] = []
-    for collector_type in COLLECTOR_TYPES:
-        items.extend(collector_type().collect())
-    return apply_scores(dedupe_items(items))
+    started = time.monotonic()
+    for source_type in source_types() if sources is None else sources:
+        if time_budget_seconds is not None and time.monotonic() - started >= time_budget_seconds:
+            with span(source_type, "collector", skipped="time_budget"):
+                continue
+        collector = load_collector(source_type)(**(options or {}).get(source_type, {}))
+        if state_dir is not None:
+            collector.configure_state(state_dir)
+        if since_by_source is not None or known_keys:
+            collector.configure_incremental(
+                since=(since_by_source or {}).get(source_type),
+                known_keys=known_keys or set(),
+            )
+        items.extend(_collect_source(collector, checkpoints))
+    with span("dedupe"):
+        unique_items = dedupe_items(items)
+    with span("score"):
+        return apply_scores(unique_items)
 
 
-def run_daily(skill_root: Path) -> tuple[str, list[FrontierItem], Path]:
+def run_daily(
+    skill_root: Path,
+    resume: bool = True,
+    incremental: bool = False,
+    sources: tuple[str, ...] | None = None,
+    profile: RunProfile | None = None,
+) -> tuple[str, list[FrontierItem], Path]:
+    sources = sources or (profile.source_types() if profile else source_types())
     digest_date = current_digest_date()
-    items = collect_all_items()
     project_root = skill_root.parent.parent / "projects" / "frontier-intel"
-    store = ItemsStore(project_root)
-    store.save_items(digest_date, items)
-    markdown = build_daily_digest_markdown(digest_date, items)
-    target = project_root / "digests" / "daily" / f"{digest_date}.md"
-    target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text(markdown)
+    checkpoints = RunCheckpoints(project_root, f"daily-{digest_date}")
+    cursors = JsonStateStore(project_root / "state" / "source-cursors.json")
+    sections = JsonStateStore(project_root / "state" / "digest-sections" / f"daily-{digest_date}.json")
+    similarity = SimilarityIndex(project_root / "state" / "similarity-index.sqlite3")
+    trends = TrendStore(project_root / "state" / "trends.sqlite3")
+    with RunLock(project_root / "state" / "locks" / "daily.lock"):
+        if not resume:
+            checkpoints.clear()
+        run_started_at = utc_now_iso()
+        store = ItemsStore(project_root, SearchIndex(project_root / "state" / "search-index.sqlite3"))
+        with start_trace(f"daily-{digest_date}-{utc_timestamp_slug()}", project_root / "traces"):
+            with span("run_daily", incremental=incremental, sources=",".join(sources), profile=profile.name if profile else None):
+                stored = store.load_items(digest_date)
+                reused = _reusable_sources(sources, profile, cursors.read(), stored, run_started_at)
+                if reused:
+                    incr(COUNTER_CACHE_HITS, len(reused))
+                items = checkpoints.load_items(STAGE_SCORED)
+                if items is None:
+                    with span("collect", reused=",".join(reused)):
+                        collected = collect_all_items(
+                            checkpoints,
+                            sources=tuple(source_type for source_type in sources if source_type not in reused),
+                            options=profile.options() if profile else None,
+                            time_budget_seconds=profile.time_budget_seconds if profile else None,
+                            since_by_source=cursors.read() if incremental else None,
+                            known_keys={item.id for item in stored} if incremental else set(),
+                            state_dir=project_root / "state",
+                        )
+                    collected_sources = {source_type for source_type in sources if checkpoints.has(STAGE_COLLECTED, source_type)}
+                    with span("merge"):
+                        items, _ = merge_items(_existing_items(stored, collected_sources, incremental), collected)
+                    checkpoints.save_items(STAGE_SCORED, items)
+                else:
+                    incr(COUNTER_CACHE_HITS)
+                with span("save_items"):
+                    store.save_items(digest_date, items)
+                with span("related_items"):
+                    similarity.add_items(digest_date, items)
+                    rendered = [item for bucket in select_digest_items(items).values() for item in bucket]
+                    related = similarity.related(rendered, before=digest_date)
+                with span("trends"):
+                    trends.record_day(digest_date, items)
+                    rising = trends.rising_topics(digest_date)
+                with span("render_digest") as current:
+                    previous_sections = sections.read() if incremental else {}
+                    section_cache = dict(previous_sections)
+                    document = build_daily_digest_document(digest_date, items, section_cache, related, rising)
+                    if current is not None:
+                        current.args["changed_sections"] = changed_sections(previous_sections, section_cache)
+                targets = digest_targets(project_root / "digests" / "daily", digest_date)
+                with span("write_digest"):
+                    render_to_files(document, targets)
+                    sections.write(section_cache)
+                target = targets[FORMAT_MARKDOWN]
+        collected_cursors = {source_type: run_started_at for source_type in sources if checkpoints.has(STAGE_COLLECTED, source_type)}
+        cursors.write({**cursors.read(), **collected_cursors})
+        # Collector state (e.g. arXiv watermarks) only advances once the items are
+        # saved, and comes from the checkpoints so a resumed run commits it too
+        _commit_collector_state(checkpoints, sources, profile.options() if profile else None, project_root / "state")
+        checkpoints.clear()
     return digest_date, items, target
+
+
+def _existing_items(stored: list[FrontierItem], collected_sources: set[str], incremental: bool) -> list[FrontierItem]:
+    if incremental:
+        return stored
+    if collected_sources == set(source_types()):
+        return []
+    return [item for item in stored if item.type not in collected_sources]
+
+
+def _reusable_sources(
+    sources: tuple[str, ...],
+    profile: RunProfile | None,
+    cursors: dict[str, str],
+    stored: list[FrontierItem],
+    now: str,
+) -> tuple[str, ...]:
+    if profile is None:
+        return ()
+    stored_types = {item.type for item in stored}
+    current = parse_timestamp(now)
+    reused: list[str] = []
+    for source_type, ttl_minutes in profile.cache_ttls().items():
+        last_collected = parse_timestamp(cursors.get(source_type))
+        if source_type not in sources or source_type not in stored_types or last_collected is None:
+            continue
+        if current - last_collected < timedelta(minutes=ttl_minutes):
+            reused.append(source_type)
+    return tuple(reused)
+
+
+def _commit_collector_state(
+    checkpoints: RunCheckpoints,
+    sources: tuple[str, ...],
+    options: dict[str, dict[str, Any]] | None,
+    state_dir: Path,
+) -> None:
+    for source_type in sources:
+        state = checkpoints.load_state(STAGE_COLLECTOR_STATE, source_type)
+        if state is None:
+            continue
+        collector = load_collector(source_type)(**(options or {}).get(source_type, {}))
+        collector.configure_state(state_dir)
+        collector.restore_pending_state(state)
+        collector.commit_state()
+
+
+def _collect_source(collector: Collector, checkpoints: RunCheckpoints | None) -> list[FrontierItem]:
+    source_type = collector.source_type
+    with span(source_type, "collector") as current:
+        collected = checkpoints.load_items(STAGE_COLLECTED, source_type) if checkpoints else None
+        resumed = collected is not None
+        if resumed:
+            incr(COUNTER_CACHE_HITS)
+        else:
+            collected = collector.collect()
+            if checkpoints is not None:
+                pending = collector.pending_state()
+                # Saved before the items so a collected checkpoint implies its state
+                if pending is not None:
+                    checkpoints.save_state(STAGE_COLLECTOR_STATE, pending, source_type)
+                checkpoints.save_items(STAGE_COLLECTED, collected, source_type)
+        if current is not None:
+            current.args["items"] = len(collected)
+            current.args["resumed"] = resumed
+    return collected
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from scripts.lib.pipeline.digest_weekly import build_weekly_digest_markdown
+from scripts.lib.pipeline.digest_weekly import build_weekly_digest_document
+from scripts.lib.pipeline.render import FORMAT_MARKDOWN, digest_targets, render_to_files
 from scripts.lib.storage.items_store import ItemsStore
+from scripts.lib.storage.trend_store import TrendStore
 from scripts.utils.dates import current_week_key
 
 
@@ -12,8 +14,7 @@ def run_weekly(skill_root: Path, digest_date: str) -> tuple[str, str]:
     store = ItemsStore(project_root)
     items = store.load_items(digest_date)
     week_key = current_week_key()
-    markdown = build_weekly_digest_markdown(week_key, items)
-    target = project_root / "digests" / "weekly" / f"{week_key}.md"
-    target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text(markdown)
-    return week_key, markdown
+    rising = TrendStore(project_root / "state" / "trends.sqlite3").rising_topics(digest_date, bucket_days=7, window_buckets=4)
+    document = build_weekly_digest_document(week_key, items, rising)
+    targets = render_to_files(document, digest_targets(project_root / "digests" / "weekly", week_key))
+    return week_key, targets[FORMAT_MARKDOWN].read_text()
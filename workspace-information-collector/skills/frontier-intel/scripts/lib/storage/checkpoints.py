@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+from typing import Any
+
+from scripts.lib.models.item import FrontierItem
+from scripts.lib.storage.state_store import write_text_atomic
+from scripts.utils.dates import utc_now_iso
+
+STAGE_COLLECTED = "collected"
+STAGE_SCORED = "scored"
+STAGE_COLLECTOR_STATE = "collector-state"
+
+
+class RunCheckpoints:
+    def __init__(self, base_dir: Path, run_key: str) -> None:
+        self.root = base_dir / "state" / "checkpoints" / run_key
+
+    def path_for(self, stage: str, name: str | None = None) -> Path:
+        filename = f"{stage}-{name}.json" if name else f"{stage}.json"
+        return self.root / filename
+
+    def has(self, stage: str, name: str | None = None) -> bool:
+        return self.path_for(stage, name).exists()
+
+    def load_items(self, stage: str, name: str | None = None) -> list[FrontierItem] | None:
+        target = self.path_for(stage, name)
+        if not target.exists():
+            return None
+        payload = json.loads(target.read_text())
+        return [FrontierItem.from_dict(item) for item in payload["items"]]
+
+    def save_items(self, stage: str, items: list[FrontierItem], name: str | None = None) -> Path:
+        target = self.path_for(stage, name)
+        payload = {"stage": stage, "name": name, "saved_at": utc_now_iso(), "items": [item.to_dict() for item in items]}
+        write_text_atomic(target, json.dumps(payload, sort_keys=True))
+        return target
+
+    def load_state(self, stage: str, name: str | None = None) -> dict[str, Any] | None:
+        target = self.path_for(stage, name)
+        if not target.exists():
+            return None
+        return json.loads(target.read_text())["state"]
+
+    def save_state(self, stage: str, state: dict[str, Any], name: str | None = None) -> Path:
+        target = self.path_for(stage, name)
+        payload = {"stage": stage, "name": name, "saved_at": utc_now_iso(), "state": state}
+        write_text_atomic(target, json.dumps(payload, sort_keys=True))
+        return target
+
+    def clear(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+import sys
+from typing import Any, Iterator
+
+from scripts.lib.models.item import FRONTIER_ITEM_FIELDS, FrontierItem
+
+SCHEMA_VERSION = 2
+INTERNED_FIELDS = frozenset({"type", "source", "week_key", "digest_date", "raw_source_type"})
+INTERNED_LIST_FIELDS = frozenset({"tags"})
+LIST_FIELDS = frozenset({"source_urls", "highlights", "suggested_actions", "learning", "tags"})
+
+
+class UnsupportedSchemaError(ValueError):
+    pass
+
+
+class StringTable:
+    def __init__(self) -> None:
+        self.values: list[str] = []
+        self._index: dict[str, int] = {}
+
+    def ref(self, value: str | None) -> int | None:
+        if value is None:
+            return None
+        index = self._index.get(value)
+        if index is None:
+            index = len(self.values)
+            self._index[value] = index
+            self.values.append(value)
+        return index
+
+
+def encode_items(items: list[FrontierItem]) -> dict[str, Any]:
+    strings = StringTable()
+    rows: list[list[Any]] = []
+    for item in items:
+        row: list[Any] = []
+        for name in FRONTIER_ITEM_FIELDS:
+            value = getattr(item, name)
+            if name in INTERNED_FIELDS:
+                row.append(strings.ref(value))
+            elif name in INTERNED_LIST_FIELDS:
+                row.append([strings.ref(entry) for entry in value])
+            else:
+                row.append(value)
+        rows.append(row)
+    return {"schema": SCHEMA_VERSION, "fields": list(FRONTIER_ITEM_FIELDS), "strings": strings.values, "rows": rows}
+
+
+def dumps_items(items: list[FrontierItem]) -> str:
+    return json.dumps(encode_items(items), ensure_ascii=False, separators=(",", ":"))
+
+
+def loads_rows(text: str) -> "ItemRows":
+    return ItemRows.from_payload(json.loads(text))
+
+
+def loads_items(text: str) -> list[FrontierItem]:
+    return loads_rows(text).items()
+
+
+class ItemRows:
+    def __init__(self, fields: list[str], strings: list[str], rows: list[list[Any]]) -> None:
+        self.fields = fields
+        self.strings = strings
+        self.rows = rows
+        self._positions = {name: index for index, name in enumerate(fields)}
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> "ItemRows":
+        if isinstance(payload, list):
+            return cls._from_legacy(payload)
+        version = payload.get("schema")
+        if version != SCHEMA_VERSION:
+            raise UnsupportedSchemaError(f"Unsupported items schema version: {version}")
+        strings = [sys.intern(value) for value in payload["strings"]]
+        return cls(payload["fields"], strings, payload["rows"])
+
+    @classmethod
+    def _from_legacy(cls, payload: list[dict[str, Any]]) -> "ItemRows":
+        return cls.from_payload(encode_items([FrontierItem.from_dict(raw_item) for raw_item in payload]))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def column(self, name: str) -> list[Any]:
+        position = self._positions.get(name)
+        if position is None:
+            return [_default_value(name) for _ in self.rows]
+        strings = self.strings
+        if name in INTERNED_FIELDS:
+            return [None if row[position] is None else strings[row[position]] for row in self.rows]
+        if name in INTERNED_LIST_FIELDS:
+            return [[strings[ref] for ref in row[position]] for row in self.rows]
+        return [row[position] for row in self.rows]
+
+    def records(self, fields: tuple[str, ...]) -> Iterator[dict[str, Any]]:
+        columns = [self.column(name) for name in fields]
+        for values in zip(*columns):
+            yield dict(zip(fields, values))
+
+    def items(self) -> list[FrontierItem]:
+        if tuple(self.fields) != FRONTIER_ITEM_FIELDS:
+            return [FrontierItem.from_dict(record) for record in self.records(tuple(self.fields))]
+        strings = self.strings
+        interned_positions = [index for index, name in enumerate(self.fields) if name in INTERNED_FIELDS]
+        list_positions = [index for index, name in enumerate(self.fields) if name in INTERNED_LIST_FIELDS]
+        items: list[FrontierItem] = []
+        for row in self.rows:
+            values = list(row)
+            for position in interned_positions:
+                ref = values[position]
+                values[position] = None if ref is None else strings[ref]
+            for position in list_positions:
+                values[position] = [strings[ref] for ref in values[position]]
+            items.append(FrontierItem(*values))
+        return items
+
+
+def _default_value(name: str) -> Any:
+    if name in LIST_FIELDS:
+        return []
+    if name == "score":
+        return 0.0
+    return None
@@ -1,28 +1,53 @@
 from __future__ import annotations
 
-import json
+import hashlib
 from pathlib import Path
 
 from scripts.lib.models.item import FrontierItem
+from scripts.lib.storage.codec import ItemRows, dumps_items, loads_rows
+from scripts.lib.storage.search_index import SearchIndex
+from scripts.lib.storage.state_store import write_text_atomic
 
 
 class ItemsStore:
-    def __init__(self, base_dir: Path) -> None:
+    def __init__(self, base_dir: Path, search_index: SearchIndex | None = None) -> None:
         self.base_dir = base_dir
+        self.search_index = search_index
 
     def path_for_date(self, digest_date: str) -> Path:
         return self.base_dir / "items" / f"{digest_date}.json"
 
     def save_items(self, digest_date: str, items: list[FrontierItem]) -> Path:
         target = self.path_for_date(digest_date)
-        target.parent.mkdir(parents=True, exist_ok=True)
-        payload = [item.to_dict() for item in items]
-        target.write_text(json.dumps(payload, indent=2, sort_keys=True))
+        text = dumps_items(items)
+        write_text_atomic(target, text)
+        if self.search_index is not None:
+            self.search_index.index_date(digest_date, items, _fingerprint(text))
         return target
 
+    def reindex(self) -> int:
+        if self.search_index is None:
+            return 0
+        indexed = self.search_index.indexed_dates()
+        updated = 0
+        for path in sorted((self.base_dir / "items").glob("*.json")):
+            text = path.read_text()
+            fingerprint = _fingerprint(text)
+            if indexed.get(path.stem) == fingerprint:
+                continue
+            self.search_index.index_date(path.stem, loads_rows(text).items(), fingerprint)
+            updated += 1
+        return updated
+
     def load_items(self, digest_date: str) -> list[FrontierItem]:
+        return self.load_rows(digest_date).items()
+
+    def load_rows(self, digest_date: str) -> ItemRows:
         target = self.path_for_date(digest_date)
         if not target.exists():
-            return []
-        raw_items = json.loads(target.read_text())
-        return [FrontierItem.from_dict(item) for item in raw_items]
+            return ItemRows.from_payload([])
+        return loads_rows(target.read_text())
+
+
+def _fingerprint(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+
+from scripts.lib.models.item import FrontierItem
+
+SEARCH_FIELDS = ("title", "summary", "highlights", "tags", "source")
+FIELD_WEIGHTS = (10.0, 4.0, 2.0, 3.0, 1.0)
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    digest_date TEXT NOT NULL,
+    type TEXT NOT NULL,
+    item_key TEXT NOT NULL,
+    title TEXT NOT NULL,
+    url TEXT NOT NULL,
+    score REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_by_date ON documents (digest_date, type);
+CREATE TABLE IF NOT EXISTS indexed_dates (
+    digest_date TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+    title, summary, highlights, tags, source,
+    tokenize = 'porter unicode61'
+);
+"""
+
+
+class SearchQueryError(ValueError):
+    pass
+
+
+@dataclass(slots=True)
+class SearchHit:
+    digest_date: str
+    type: str
+    item_key: str
+    title: str
+    url: str
+    score: float
+    rank: float
+
+
+class SearchIndex:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._schema_ready = False
+
+    def index_date(self, digest_date: str, items: list[FrontierItem], fingerprint: str | None = None) -> bool:
+        fingerprint = fingerprint or _fingerprint(items)
+        with closing(self._connect()) as connection, connection:
+            current = connection.execute("SELECT fingerprint FROM indexed_dates WHERE digest_date = ?", (digest_date,)).fetchone()
+            if current is not None and current[0] == fingerprint:
+                return False
+            connection.execute("DELETE FROM items_fts WHERE rowid IN (SELECT id FROM documents WHERE digest_date = ?)", (digest_date,))
+            connection.execute("DELETE FROM documents WHERE digest_date = ?", (digest_date,))
+            for item in items:
+                cursor = connection.execute(
+                    "INSERT INTO documents (digest_date, type, item_key, title, url, score) VALUES (?, ?, ?, ?, ?, ?)",
+                    (digest_date, item.type, item.id or item.url, item.title, item.url, item.score),
+                )
+                connection.execute(
+                    "INSERT INTO items_fts (rowid, title, summary, highlights, tags, source) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        cursor.lastrowid,
+                        item.title,
+                        item.summary or "",
+                        "\n".join(item.highlights),
+                        " ".join(item.tags),
+                        item.source,
+                    ),
+                )
+            connection.execute(
+                "INSERT INTO indexed_dates (digest_date, fingerprint) VALUES (?, ?) "
+                "ON CONFLICT(digest_date) DO UPDATE SET fingerprint = excluded.fingerprint",
+                (digest_date, fingerprint),
+            )
+        return True
+
+    def search(
+        self,
+        query: str,
+        *,
+        item_type: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int = 20,
+        raw: bool = False,
+    ) -> list[SearchHit]:
+        expression = query if raw else _match_expression(query)
+        if not expression:
+            return []
+        clauses = ["items_fts MATCH ?"]
+        params: list[object] = [expression]
+        if item_type:
+            clauses.append("d.type = ?")
+            params.append(item_type)
+        if since:
+            clauses.append("d.digest_date >= ?")
+            params.append(since)
+        if until:
+            clauses.append("d.digest_date <= ?")
+            params.append(until)
+        weights = ", ".join(str(weight) for weight in FIELD_WEIGHTS)
+        sql = (
+            f"SELECT d.digest_date, d.type, d.item_key, d.title, d.url, d.score, bm25(items_fts, {weights}) AS rank "
+            "FROM items_fts JOIN documents d ON d.id = items_fts.rowid "
+            f"WHERE {' AND '.join(clauses)} ORDER BY rank LIMIT ?"
+        )
+        params.append(limit)
+        with closing(self._connect()) as connection:
+            try:
+                return [SearchHit(*row) for row in connection.execute(sql, params)]
+            except sqlite3.OperationalError as error:
+                if not raw:
+                    raise
+                raise SearchQueryError(f"invalid FTS5 query {query!r}: {error}") from error
+
+    def indexed_dates(self) -> dict[str, str]:
+        with closing(self._connect()) as connection:
+            return dict(connection.execute("SELECT digest_date, fingerprint FROM indexed_dates"))
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        if not self._schema_ready:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+            self._schema_ready = True
+        return connection
+
+
+def _match_expression(query: str) -> str:
+    return " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+
+
+def _fingerprint(items: list[FrontierItem]) -> str:
+    digest = hashlib.sha256()
+    for item in items:
+        for value in (item.id, item.title, item.summary or "", item.source, item.score, *item.highlights, *item.tags):
+            digest.update(str(value).encode("utf-8"))
+            digest.update(b"\0")
+    return digest.hexdigest()
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import hashlib
+import heapq
+import math
+import sqlite3
+from collections import Counter, defaultdict
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+
+from scripts.lib.models.item import FrontierItem
+from scripts.utils.text import keyword_terms
+
+MAX_QUERY_TERMS = 24
+MAX_DOCUMENT_FREQUENCY_RATIO = 0.02
+MIN_PRUNED_DOCUMENT_FREQUENCY = 50
+MIN_SIMILARITY = 0.12
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    item_key TEXT NOT NULL UNIQUE,
+    digest_date TEXT NOT NULL,
+    type TEXT NOT NULL,
+    title TEXT NOT NULL,
+    url TEXT NOT NULL,
+    fingerprint TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS documents_by_date ON documents (digest_date);
+CREATE TABLE IF NOT EXISTS terms (
+    term TEXT PRIMARY KEY,
+    df INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    weight REAL NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_by_doc ON postings (doc_id);
+"""
+
+
+@dataclass(slots=True)
+class RelatedItem:
+    item_key: str
+    digest_date: str
+    type: str
+    title: str
+    url: str
+    similarity: float
+
+
+def item_key(item: FrontierItem) -> str:
+    return item.id or item.url
+
+
+def term_weights(item: FrontierItem) -> dict[str, float]:
+    counts = Counter(keyword_terms(item.title) * 2)
+    counts.update(keyword_terms(item.summary or ""))
+    counts.update(term for tag in item.tags for term in keyword_terms(tag))
+    return {term: 1.0 + math.log(count) for term, count in counts.items()}
+
+
+def item_fingerprint(item: FrontierItem) -> str:
+    digest = hashlib.sha256()
+    for value in (item.type, item.title, item.url, item.summary or "", *item.tags):
+        digest.update(value.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class SimilarityIndex:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def add_items(self, digest_date: str, items: list[FrontierItem]) -> int:
+        with closing(self._connect()) as connection, connection:
+            keys = [item_key(item) for item in items]
+            known = _documents(connection, keys)
+            pending: list[tuple[str, str, str, FrontierItem]] = []
+            for key, item in zip(keys, items):
+                fingerprint = item_fingerprint(item)
+                current = known.get(key)
+                if current is None:
+                    pending.append((key, digest_date, fingerprint, item))
+                elif current[2] != fingerprint:
+                    # Re-index edited items in place, keeping the day they were first seen
+                    _remove_document(connection, current[0])
+                    pending.append((key, current[1], fingerprint, item))
+            if not pending:
+                return 0
+            vectors = [term_weights(item) for *_, item in pending]
+            new_df = Counter(term for vector in vectors for term in vector)
+            connection.executemany(
+                "INSERT INTO terms (term, df) VALUES (?, ?) ON CONFLICT(term) DO UPDATE SET df = df + excluded.df",
+                new_df.items(),
+            )
+            total = _document_count(connection) + len(pending)
+            idf = {term: _idf(df, total) for term, df in _document_frequencies(connection, list(new_df)).items()}
+            for (key, first_seen, fingerprint, item), vector in zip(pending, vectors):
+                norm = math.sqrt(sum((weight * idf[term]) ** 2 for term, weight in vector.items())) or 1.0
+                cursor = connection.execute(
+                    "INSERT INTO documents (item_key, digest_date, type, title, url, fingerprint) VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, first_seen, item.type, item.title, item.url, fingerprint),
+                )
+                connection.executemany(
+                    "INSERT INTO postings (term, doc_id, weight) VALUES (?, ?, ?)",
+                    [(term, cursor.lastrowid, weight / norm) for term, weight in vector.items()],
+                )
+        return len(pending)
+
+    def related(self, items: list[FrontierItem], *, before: str, k: int = 3) -> dict[str, list[RelatedItem]]:
+        with closing(self._connect()) as connection:
+            total = _document_count(connection)
+            if not total:
+                return {}
+            excluded = {row[0] for row in connection.execute("SELECT id FROM documents WHERE digest_date >= ?", (before,))}
+            excluded.update(_document_ids(connection, [item_key(item) for item in items]).values())
+            related: dict[str, list[RelatedItem]] = {}
+            for item in items:
+                matches = self._top_k(connection, item, excluded=excluded, k=k, total=total)
+                if matches:
+                    related[item_key(item)] = matches
+            return related
+
+    def _top_k(self, connection: sqlite3.Connection, item: FrontierItem, *, excluded: set[int], k: int, total: int) -> list[RelatedItem]:
+        vector = term_weights(item)
+        frequencies = _document_frequencies(connection, list(vector))
+        idf = {term: _idf(df, total) for term, df in frequencies.items()}
+        weighted = {term: weight * idf[term] for term, weight in vector.items() if term in idf}
+        query_norm = math.sqrt(sum(weight * weight for weight in weighted.values())) or 1.0
+        max_df = max(MIN_PRUNED_DOCUMENT_FREQUENCY, int(total * MAX_DOCUMENT_FREQUENCY_RATIO))
+        query = dict(
+            heapq.nlargest(
+                MAX_QUERY_TERMS,
+                ((term, weight) for term, weight in weighted.items() if frequencies[term] <= max_df),
+                key=lambda entry: entry[1],
+            )
+        )
+        if not query:
+            return []
+        scores: dict[int, float] = defaultdict(float)
+        placeholders = ", ".join("?" for _ in query)
+        for term, doc_id, weight in connection.execute(f"SELECT term, doc_id, weight FROM postings WHERE term IN ({placeholders})", list(query)):
+            scores[doc_id] += query[term] * weight * idf[term]
+        for doc_id in excluded:
+            scores.pop(doc_id, None)
+        best = heapq.nlargest(k, ((doc_id, score / query_norm) for doc_id, score in scores.items()), key=lambda entry: entry[1])
+        best = [(doc_id, similarity) for doc_id, similarity in best if similarity >= MIN_SIMILARITY]
+        if not best:
+            return []
+        placeholders = ", ".join("?" for _ in best)
+        rows = {
+            row[0]: row[1:]
+            for row in connection.execute(
+                f"SELECT id, item_key, digest_date, type, title, url FROM documents WHERE id IN ({placeholders})",
+                [doc_id for doc_id, _ in best],
+            )
+        }
+        return [RelatedItem(*rows[doc_id], round(similarity, 4)) for doc_id, similarity in best]
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        columns = {row[1] for row in connection.execute("PRAGMA table_info(documents)")}
+        if columns and "fingerprint" not in columns:
+            # Indexes created before fingerprints: every document re-indexes once
+            connection.execute("ALTER TABLE documents ADD COLUMN fingerprint TEXT NOT NULL DEFAULT ''")
+        connection.executescript(SCHEMA)
+        return connection
+
+
+def _document_ids(connection: sqlite3.Connection, keys: list[str]) -> dict[str, int]:
+    known: dict[str, int] = {}
+    for start in range(0, len(keys), 500):
+        chunk = keys[start : start + 500]
+        placeholders = ", ".join("?" for _ in chunk)
+        known.update(connection.execute(f"SELECT item_key, id FROM documents WHERE item_key IN ({placeholders})", chunk))
+    return known
+
+
+def _documents(connection: sqlite3.Connection, keys: list[str]) -> dict[str, tuple[int, str, str]]:
+    known: dict[str, tuple[int, str, str]] = {}
+    for start in range(0, len(keys), 500):
+        chunk = keys[start : start + 500]
+        placeholders = ", ".join("?" for _ in chunk)
+        for key, *row in connection.execute(
+            f"SELECT item_key, id, digest_date, fingerprint FROM documents WHERE item_key IN ({placeholders})", chunk
+        ):
+            known[key] = tuple(row)
+    return known
+
+
+def _remove_document(connection: sqlite3.Connection, doc_id: int) -> None:
+    terms = [row[0] for row in connection.execute("SELECT term FROM postings WHERE doc_id = ?", (doc_id,))]
+    connection.executemany("UPDATE terms SET df = df - 1 WHERE term = ?", [(term,) for term in terms])
+    connection.execute("DELETE FROM terms WHERE df <= 0")
+    connection.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+    connection.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
+
+
+def _document_count(connection: sqlite3.Connection) -> int:
+    return connection.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+
+def _document_frequencies(connection: sqlite3.Connection, terms: list[str]) -> dict[str, int]:
+    frequencies: dict[str, int] = {}
+    for start in range(0, len(terms), 500):
+        chunk = terms[start : start + 500]
+        placeholders = ", ".join("?" for _ in chunk)
+        frequencies.update(connection.execute(f"SELECT term, df FROM terms WHERE term IN ({placeholders})", chunk))
+    return frequencies
+
+
+def _idf(df: int, total: int) -> float:
+    return math.log((1 + total) / (1 + df)) + 1.0
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import math
+import sqlite3
+from collections import Counter
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from scripts.lib.models.item import FrontierItem
+from scripts.utils.text import keyword_terms
+
+KIND_KEYWORD = "keyword"
+KIND_REPO = "repo"
+KIND_DOMAIN = "domain"
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trend_counts (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    digest_date TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (digest_date, kind, key)
+) WITHOUT ROWID;
+"""
+BURST_QUERY = """
+WITH buckets AS (
+    SELECT kind, key, CAST((julianday(:as_of) - julianday(digest_date)) / :bucket_days AS INTEGER) AS bucket, SUM(count) AS count
+    FROM trend_counts
+    WHERE digest_date > date(:as_of, :lookback) AND digest_date <= :as_of
+    GROUP BY kind, key, bucket
+)
+SELECT
+    kind,
+    key,
+    SUM(CASE WHEN bucket = 0 THEN count ELSE 0 END) AS current,
+    SUM(CASE WHEN bucket > 0 THEN count ELSE 0 END) AS total,
+    SUM(CASE WHEN bucket > 0 THEN count * count ELSE 0 END) AS squares
+FROM buckets
+GROUP BY kind, key
+HAVING current >= :min_count
+"""
+
+
+@dataclass(slots=True)
+class RisingTopic:
+    kind: str
+    key: str
+    current: int
+    baseline: float
+    z_score: float
+
+
+def extract_entities(item: FrontierItem) -> set[tuple[str, str]]:
+    entities = {(KIND_KEYWORD, term) for term in keyword_terms(f"{item.title} {item.summary or ''}")}
+    entities.update((KIND_KEYWORD, tag.lower()) for tag in item.tags if tag.lower() not in {item.type, "research", "trending"})
+    for url in [item.url, *item.source_urls]:
+        parts = urlsplit(url)
+        domain = parts.netloc.lower().removeprefix("www.")
+        if not domain:
+            continue
+        entities.add((KIND_DOMAIN, domain))
+        segments = [segment for segment in parts.path.split("/") if segment]
+        if domain == "github.com" and len(segments) >= 2:
+            entities.add((KIND_REPO, f"{segments[0]}/{segments[1]}".lower()))
+    return entities
+
+
+class TrendStore:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def record_day(self, digest_date: str, items: list[FrontierItem]) -> int:
+        counts = Counter(entity for item in items for entity in extract_entities(item))
+        with closing(self._connect()) as connection, connection:
+            connection.execute("DELETE FROM trend_counts WHERE digest_date = ?", (digest_date,))
+            connection.executemany(
+                "INSERT INTO trend_counts (kind, key, digest_date, count) VALUES (?, ?, ?, ?)",
+                [(kind, key, digest_date, count) for (kind, key), count in counts.items()],
+            )
+        return len(counts)
+
+    def rising_topics(
+        self,
+        as_of: str,
+        *,
+        bucket_days: int = 1,
+        window_buckets: int = 28,
+        min_count: int = 2,
+        min_z_score: float = 2.0,
+        limit: int = 8,
+    ) -> list[RisingTopic]:
+        params = {
+            "as_of": as_of,
+            "bucket_days": bucket_days,
+            "lookback": f"-{bucket_days * (window_buckets + 1)} days",
+            "min_count": min_count,
+        }
+        with closing(self._connect()) as connection:
+            rows = connection.execute(BURST_QUERY, params).fetchall()
+        topics: list[RisingTopic] = []
+        for kind, key, current, total, squares in rows:
+            mean = total / window_buckets
+            variance = max(squares / window_buckets - mean * mean, 0.0)
+            z_score = (current - mean) / math.sqrt(variance + 1.0)
+            if z_score >= min_z_score:
+                topics.append(RisingTopic(kind, key, current, round(mean, 2), round(z_score, 2)))
+        topics.sort(key=lambda topic: (topic.z_score, topic.current), reverse=True)
+        return topics[:limit]
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(SCHEMA)
+        return connection
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+from pathlib import Path
+
+from scripts.lib.pipeline.dedupe import dedupe_items
+from scripts.lib.pipeline.digest_daily import build_daily_digest_markdown
+from scripts.lib.pipeline.run_daily import collect_all_items, run_daily
+from scripts.lib.pipeline.scoring import apply_scores
+from scripts.lib.pipeline.selection import select_digest_items
+from scripts.tests.benchmarks.fixtures import build_synthetic_cassette
+from scripts.tests.benchmarks.harness import BenchmarkResult, benchmark, print_results, write_results
+from scripts.utils.replay import Cassette, LatencyProfile, use_cassette
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the frontier-intel daily pipeline against replayed fixtures.")
+    parser.add_argument("--bundle", type=Path, help="Fixture bundle recorded with run_daily --record; synthetic when omitted.")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-scale", type=float, default=0.0)
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this path.")
+    return parser.parse_args()
+
+
+def load_cassette(bundle: Path | None, latency: LatencyProfile) -> Cassette:
+    if bundle is None:
+        return build_synthetic_cassette(latency=latency)
+    return Cassette.load(bundle, latency)
+
+
+def run_benchmarks(bundle: Path | None, rounds: int, latency: LatencyProfile) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+    stage_samples: dict[str, list[float]] = {}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        skill_root = Path(temp_dir) / "skills" / "frontier-intel"
+        traces_dir = Path(temp_dir) / "projects" / "frontier-intel" / "traces"
+
+        def end_to_end() -> None:
+            with use_cassette(load_cassette(bundle, latency)):
+                run_daily(skill_root)
+
+        results.append(benchmark("run_daily[end-to-end]", end_to_end, rounds=rounds))
+        for trace_path in sorted(traces_dir.glob("*.json")):
+            if trace_path.name.endswith(".trace.json"):
+                continue
+            for stage, total_ms in json.loads(trace_path.read_text())["totals_ms"].items():
+                if stage.startswith(("collector:", "stage:")):
+                    stage_samples.setdefault(stage, []).append(total_ms)
+    results.extend(BenchmarkResult.from_samples(stage, samples) for stage, samples in sorted(stage_samples.items()))
+
+    with use_cassette(load_cassette(bundle, latency)):
+        items = collect_all_items()
+    results.append(benchmark("dedupe", lambda: dedupe_items(list(items)), rounds=rounds))
+    results.append(benchmark("score", lambda: apply_scores(list(items)), rounds=rounds))
+    results.append(benchmark("select", lambda: select_digest_items(items), rounds=rounds))
+    results.append(benchmark("render", lambda: build_daily_digest_markdown("2026-03-07", items), rounds=rounds))
+    return results
+
+
+def main() -> None:
+    args = parse_args()
+    latency = LatencyProfile(http_ms=args.latency_ms, command_ms=args.latency_ms, recorded_scale=args.latency_scale)
+    results = run_benchmarks(args.bundle, args.rounds, latency)
+    print_results(results)
+    if args.output:
+        write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+from dataclasses import asdict
+from datetime import date, timedelta
+from pathlib import Path
+
+from scripts.lib.models.item import FrontierItem
+from scripts.lib.storage.items_store import ItemsStore
+from scripts.tests.benchmarks.harness import benchmark, print_results
+
+ITEM_TYPES = ("news", "github", "arxiv", "tweet", "reddit")
+
+
+def build_year(days: int, items_per_day: int) -> dict[str, list[FrontierItem]]:
+    start = date(2026, 1, 1)
+    year: dict[str, list[FrontierItem]] = {}
+    for day in range(days):
+        digest_date = (start + timedelta(days=day)).isoformat()
+        week = (start + timedelta(days=day)).isocalendar()
+        year[digest_date] = [
+            FrontierItem(
+                id=f"{digest_date}-{index}",
+                type=ITEM_TYPES[index % len(ITEM_TYPES)],
+                title=f"Frontier item {index} for {digest_date}",
+                source=("arXiv", "GitHub Trending", "X/Twitter", "Reddit r/LocalLLaMA", "Web")[index % 5],
+                url=f"https://example.com/{digest_date}/{index}",
+                source_urls=[f"https://example.com/{digest_date}/{index}"],
+                collected_at=f"{digest_date}T08:00:00+00:00",
+                summary="A lab shipped a new reasoning model with better tool use and cheaper inference. " * 2,
+                executive_summary="Why it matters: agent builders get faster, cheaper reasoning.",
+                highlights=["Language: Python", "Topics: agents, llm"],
+                tags=["research", "agents", "trending"],
+                week_key=f"{week[0]}-W{week[1]:02d}",
+                digest_date=digest_date,
+                raw_source_type="mixed_news",
+                score=float(index),
+            )
+            for index in range(items_per_day)
+        ]
+    return year
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark ItemsStore save/load throughput for a year of daily files.")
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--items-per-day", type=int, default=40)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    year = build_year(args.days, args.items_per_day)
+    total_items = args.days * args.items_per_day
+    with tempfile.TemporaryDirectory() as temp_dir:
+        legacy_dir = Path(temp_dir) / "legacy"
+        legacy_dir.mkdir()
+        store = ItemsStore(Path(temp_dir) / "compact")
+
+        def save_legacy() -> None:
+            for digest_date, items in year.items():
+                payload = [asdict(item) for item in items]
+                (legacy_dir / f"{digest_date}.json").write_text(json.dumps(payload, indent=2, sort_keys=True))
+
+        def load_legacy() -> None:
+            for digest_date in year:
+                [FrontierItem(**raw_item) for raw_item in json.loads((legacy_dir / f"{digest_date}.json").read_text())]
+
+        def save_compact() -> None:
+            for digest_date, items in year.items():
+                store.save_items(digest_date, items)
+
+        def load_compact() -> None:
+            for digest_date in year:
+                store.load_items(digest_date)
+
+        def load_scores_lazily() -> None:
+            for digest_date in year:
+                store.load_rows(digest_date).column("score")
+
+        results = [
+            benchmark("save[legacy asdict+indent]", save_legacy, rounds=args.rounds),
+            benchmark("save[compact codec]", save_compact, rounds=args.rounds),
+            benchmark("load[legacy]", load_legacy, rounds=args.rounds),
+            benchmark("load[compact codec]", load_compact, rounds=args.rounds),
+            benchmark("load[compact, score column only]", load_scores_lazily, rounds=args.rounds),
+        ]
+        legacy_bytes = sum(path.stat().st_size for path in legacy_dir.glob("*.json"))
+        compact_bytes = sum(path.stat().st_size for path in (store.base_dir / "items").glob("*.json"))
+
+    print_results(results)
+    for result in results:
+        print(f"{result.name}: {total_items / (result.median_ms / 1000.0):,.0f} items/s")
+    print(f"on-disk size: legacy={legacy_bytes:,} bytes compact={compact_bytes:,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from scripts.lib.storage.items_store import ItemsStore
+from scripts.lib.storage.search_index import SearchIndex
+from scripts.tests.benchmarks.bench_items_store import build_year
+from scripts.tests.benchmarks.harness import benchmark, print_results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark full-text search over a year of daily item files.")
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--items-per-day", type=int, default=40)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    year = build_year(args.days, args.items_per_day)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        index = SearchIndex(Path(temp_dir) / "search.sqlite3")
+        store = ItemsStore(Path(temp_dir), index)
+        results = [benchmark("index[year]", lambda: [store.save_items(digest_date, items) for digest_date, items in year.items()], rounds=1, warmup=0)]
+        results.extend(
+            [
+                benchmark("search[reasoning model]", lambda: index.search("reasoning model"), rounds=args.rounds),
+                benchmark("search[agents, type=github]", lambda: index.search("agents", item_type="github"), rounds=args.rounds),
+                benchmark("search[inference, last 30 days]", lambda: index.search("inference", since="2026-12-01"), rounds=args.rounds),
+                benchmark("grep[load every file]", lambda: [item for digest_date in year for item in store.load_items(digest_date) if "reasoning" in (item.summary or "")], rounds=3),
+            ]
+        )
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from scripts.lib.models.item import FrontierItem
+from scripts.lib.storage.similarity_index import SimilarityIndex
+from scripts.tests.benchmarks.harness import benchmark, print_results
+
+VOCABULARY_SIZE = 20000
+TOPIC_WORDS = 12
+
+
+def build_days(days: int, items_per_day: int, seed: int = 7) -> list[tuple[str, list[FrontierItem]]]:
+    rng = random.Random(seed)
+    vocabulary = [f"term{index}" for index in range(VOCABULARY_SIZE)]
+    start = date(2020, 1, 1)
+    batches: list[tuple[str, list[FrontierItem]]] = []
+    for day in range(days):
+        digest_date = (start + timedelta(days=day)).isoformat()
+        items = []
+        for index in range(items_per_day):
+            words = [vocabulary[min(int(rng.paretovariate(1.1)) - 1, VOCABULARY_SIZE - 1)] for _ in range(TOPIC_WORDS)]
+            words += rng.sample(vocabulary, TOPIC_WORDS)
+            items.append(
+                FrontierItem(
+                    id=f"{digest_date}-{index}",
+                    type="news",
+                    title=" ".join(words[:8]),
+                    source="Web",
+                    url=f"https://example.com/{digest_date}/{index}",
+                    summary=" ".join(words[8:]),
+                    digest_date=digest_date,
+                )
+            )
+        batches.append((digest_date, items))
+    return batches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark incremental TF-IDF related-item lookups at 100k items.")
+    parser.add_argument("--days", type=int, default=2500)
+    parser.add_argument("--items-per-day", type=int, default=40)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    batches = build_days(args.days + args.rounds + 1, args.items_per_day)
+    history, upcoming = batches[: args.days], batches[args.days :]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        index = SimilarityIndex(Path(temp_dir) / "similarity.sqlite3")
+        started = time.perf_counter()
+        for digest_date, items in history:
+            index.add_items(digest_date, items)
+        build_seconds = time.perf_counter() - started
+
+        def add_next_day() -> None:
+            digest_date, items = upcoming.pop(0)
+            index.add_items(digest_date, items)
+
+        probe_date, probe_items = batches[-1]
+        results = [
+            benchmark(f"add_items[{args.items_per_day} new items]", add_next_day, rounds=args.rounds, warmup=0),
+            benchmark(f"related[top-3 for {args.items_per_day} items]", lambda: index.related(probe_items, before=probe_date), rounds=args.rounds),
+        ]
+    print_results(results)
+    print(f"initial build: {args.days * args.items_per_day:,} items in {build_seconds:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+from scripts.tests.benchmarks.harness import benchmark, print_results
+
+SKILL_ROOT = Path(__file__).resolve().parents[3]
+ENTRY_POINTS = (
+    "scripts.bin.run_daily",
+    "scripts.bin.run_weekly",
+    "scripts.bin.sync_notion",
+    "scripts.bin.search_items",
+)
+SCENARIOS = {
+    "daily pipeline[arxiv,github]": (
+        "from scripts.lib.collectors import load_collector\n"
+        "import scripts.lib.pipeline.run_daily\n"
+        "[load_collector(source)() for source in ('arxiv', 'github')]"
+    ),
+    "daily pipeline[all sources]": (
+        "from scripts.lib.collectors import load_collector, source_types\n"
+        "import scripts.lib.pipeline.run_daily\n"
+        "[load_collector(source)() for source in source_types()]"
+    ),
+}
+
+
+def import_command(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+def loaded_modules(code: str) -> int:
+    completed = subprocess.run(
+        import_command(f"{code}\nimport sys\nprint(len(sys.modules))"),
+        cwd=SKILL_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return int(completed.stdout.split()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark interpreter start-up plus import time for each frontier-intel entry point.")
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    cases = {"python (baseline)": "pass"}
+    cases.update({f"import {module}": f"import {module}" for module in ENTRY_POINTS})
+    cases.update(SCENARIOS)
+    results = []
+    for name, code in cases.items():
+        command = import_command(code)
+        results.append(benchmark(name, lambda: subprocess.run(command, cwd=SKILL_ROOT, check=True), rounds=args.rounds))
+
+    print_results(results)
+    baseline = results[0].median_ms
+    for result, code in zip(results[1:], list(cases.values())[1:]):
+        print(f"{result.name}: +{result.median_ms - baseline:.1f} ms over bare python, {loaded_modules(code)} modules loaded")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import json
+
+from scripts.lib.collectors.arxiv import ARXIV_API, DEFAULT_CATEGORIES
+from scripts.lib.collectors.github import GITHUB_TRENDING_URL
+from scripts.lib.collectors.reddit import DEFAULT_SUBREDDITS
+from scripts.lib.collectors.twitter import DEFAULT_HANDLES
+from scripts.lib.collectors.web_news import NEWS_QUERIES, TAVILY_SCRIPT
+from scripts.utils.fetcher import JINA_PREFIX
+from scripts.utils.replay import MODE_REPLAY, Cassette, LatencyProfile
+from scripts.utils.summarizer import SHARED_SUMMARY_SCRIPT
+
+ARTICLE_TEXT = (
+    "The lab released a new multimodal reasoning model with improved tool use and a longer context window. "
+    "Early benchmark results show gains on coding and agentic evaluations, while inference cost stays flat. "
+    "The release includes an updated safety card and an API rollout schedule for enterprise customers."
+)
+
+
+def build_synthetic_cassette(*, results_per_query: int = 5, latency: LatencyProfile | None = None) -> Cassette:
+    cassette = Cassette(MODE_REPLAY, latency)
+    _add_news(cassette, results_per_query)
+    _add_github(cassette)
+    _add_arxiv(cassette)
+    _add_twitter(cassette)
+    _add_reddit(cassette)
+    cassette.add_command(
+        ["python3", SHARED_SUMMARY_SCRIPT],
+        stdout=json.dumps({"summary": "A frontier lab shipped a faster reasoning model, which matters for agent builders."}),
+    )
+    return cassette
+
+
+def _add_news(cassette: Cassette, results_per_query: int) -> None:
+    for query_index, query in enumerate(NEWS_QUERIES):
+        tavily_lines = ["# Results", "", "## Sources", ""]
+        exa_lines: list[str] = []
+        for result_index in range(results_per_query):
+            url = f"https://news{result_index}.example.com/q{query_index}/story-{result_index}"
+            tavily_lines.extend([f"- **Story {query_index}-{result_index} about frontier models**", url, "A snippet about the release."])
+            exa_url = f"https://exa{result_index}.example.org/q{query_index}/item-{result_index}"
+            exa_lines.extend(
+                [
+                    f"Title: Exa story {query_index}-{result_index} on AI agents",
+                    f"URL: {exa_url}",
+                    "Author: Example Desk",
+                    "Published Date: 2026-03-07T08:00:00Z",
+                    "Text: A longer snippet describing the launch.",
+                    "",
+                ]
+            )
+            for article_url in (url, exa_url):
+                cassette.add_http(JINA_PREFIX + article_url.removeprefix("https://"), ARTICLE_TEXT)
+        cassette.add_command(
+            ["node", str(TAVILY_SCRIPT), query, "--topic", "news", "--days", "1", "-n", "5"],
+            stdout="\n".join(tavily_lines),
+        )
+        cassette.add_command(
+            ["mcporter", "call", f'exa.web_search_exa(query: "{query}", numResults: 5)'],
+            stdout="\n".join(exa_lines),
+        )
+
+
+def _add_github(cassette: Cassette) -> None:
+    articles = []
+    for index in range(10):
+        articles.append(
+            '<article class="Box-row">'
+            f'<h2><a href="/example-org/agent-kit-{index}">example-org / agent-kit-{index}</a></h2>'
+            f'<p class="col-9 color-fg-muted my-1 pr-4">Toolkit number {index} for building LLM agents.</p>'
+            '<span itemprop="programmingLanguage">Python</span>'
+            f'<a href="/example-org/agent-kit-{index}/stargazers" class="Link"><svg></svg> {1000 + index},000</a>'
+            f"<span>{100 + index} stars today</span>"
+            "</article>"
+        )
+    cassette.add_http(GITHUB_TRENDING_URL, "<html><body>" + "".join(articles) + "</body></html>")
+
+
+def _add_arxiv(cassette: Cassette) -> None:
+    for category_index, category in enumerate(DEFAULT_CATEGORIES):
+        entries = []
+        for index in range(5):
+            paper_id = f"2603.{10000 + category_index * 10 + index}v1"
+            entries.append(
+                "<entry>"
+                f"<id>http://arxiv.org/abs/{paper_id}</id>"
+                f"<updated>2026-03-07T00:{59 - index:02d}:00Z</updated>"
+                "<published>2026-03-06T18:00:00Z</published>"
+                f"<title>Scaling Test-Time Reasoning, Part {category_index}.{index}</title>"
+                f"<summary>{ARTICLE_TEXT}</summary>"
+                f'<link href="http://arxiv.org/abs/{paper_id}" rel="alternate" type="text/html"/>'
+                f'<link title="pdf" href="http://arxiv.org/pdf/{paper_id}" rel="related" type="application/pdf"/>'
+                "</entry>"
+            )
+        feed = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">'
+            "<opensearch:totalResults>5</opensearch:totalResults>" + "".join(entries) + "</feed>"
+        )
+        cassette.add_http(ARXIV_API.format(category=category, start=0, page_size=5), feed)
+
+
+def _add_twitter(cassette: Cassette) -> None:
+    for handle_index, handle in enumerate(DEFAULT_HANDLES):
+        tweets = [
+            {
+                "id": f"20300000{handle_index:04d}{index}",
+                "text": f"New AI model results from the {handle} team: reasoning benchmark #{index}",
+                "createdAt": "Sat Mar 07 08:00:00 +0000 2026",
+                "likeCount": 100 * (index + 1),
+                "retweetCount": 10,
+                "quoteCount": 1,
+                "user": {"screenName": handle},
+            }
+            for index in range(5)
+        ]
+        cassette.add_command(["xreach", "tweets", f"@{handle}", "-n", "5", "--json"], stdout=json.dumps(tweets))
+
+
+def _add_reddit(cassette: Cassette) -> None:
+    for subreddit in DEFAULT_SUBREDDITS:
+        children = [
+            {
+                "data": {
+                    "id": f"{subreddit.lower()}{index}",
+                    "permalink": f"/r/{subreddit}/comments/{subreddit.lower()}{index}/thread/",
+                    "title": f"Open-source agent framework ships release {index}",
+                    "selftext": ARTICLE_TEXT,
+                    "score": 250 * (index + 1),
+                }
+            }
+            for index in range(3)
+        ]
+        cassette.add_http(
+            f"https://www.reddit.com/r/{subreddit}/hot.json?limit=3",
+            json.dumps({"data": {"children": children}}),
+        )
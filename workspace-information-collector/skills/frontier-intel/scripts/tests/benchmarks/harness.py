@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import json
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    name: str
+    rounds: int
+    min_ms: float
+    max_ms: float
+    mean_ms: float
+    median_ms: float
+    stddev_ms: float
+
+    @classmethod
+    def from_samples(cls, name: str, samples_ms: list[float]) -> "BenchmarkResult":
+        return cls(
+            name=name,
+            rounds=len(samples_ms),
+            min_ms=round(min(samples_ms), 3),
+            max_ms=round(max(samples_ms), 3),
+            mean_ms=round(statistics.fmean(samples_ms), 3),
+            median_ms=round(statistics.median(samples_ms), 3),
+            stddev_ms=round(statistics.pstdev(samples_ms), 3),
+        )
+
+
+def benchmark(name: str, func: Callable[[], object], *, rounds: int = 5, warmup: int = 1) -> BenchmarkResult:
+    for _ in range(warmup):
+        func()
+    samples: list[float] = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return BenchmarkResult.from_samples(name, samples)
+
+
+def print_results(results: list[BenchmarkResult]) -> None:
+    width = max([len(result.name) for result in results] + [4])
+    print(f"{'name':<{width}}  {'rounds':>6}  {'min ms':>10}  {'median ms':>10}  {'mean ms':>10}  {'max ms':>10}  {'stddev':>8}")
+    for result in results:
+        print(
+            f"{result.name:<{width}}  {result.rounds:>6}  {result.min_ms:>10.3f}  {result.median_ms:>10.3f}"
+            f"  {result.mean_ms:>10.3f}  {result.max_ms:>10.3f}  {result.stddev_ms:>8.3f}"
+        )
+
+
+def write_results(results: list[BenchmarkResult], target: Path) -> Path:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(json.dumps([asdict(result) for result in results], indent=2))
+    return target
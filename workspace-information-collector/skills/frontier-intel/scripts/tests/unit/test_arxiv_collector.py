@@ -1,7 +1,24 @@
+import json
+import tempfile
 import unittest
 import xml.etree.ElementTree as ET
+from pathlib import Path
+from unittest.mock import patch
 
-from scripts.lib.collectors.arxiv import ArxivCollector
+from scripts.lib.collectors.arxiv import ARXIV_API, ArxivCollector
+from scripts.utils.replay import MODE_REPLAY, Cassette, use_cassette
+
+
+def _feed(entries: list[tuple[str, str]], total: int, published: str | None = None) -> str:
+    body = "".join(
+        f"<entry><id>http://arxiv.org/abs/{paper_id}</id><updated>{updated}</updated>"
+        f"<published>{published or updated}</published><title>Paper {paper_id}</title><summary>Abstract</summary></entry>"
+        for paper_id, updated in entries
+    )
+    return (
+        '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">'
+        f"<opensearch:totalResults>{total}</opensearch:totalResults>{body}</feed>"
+    )
 
 
 class ArxivCollectorTest(unittest.TestCase):
@@ -22,6 +39,90 @@ class ArxivCollectorTest(unittest.TestCase):
 
         self.assertEqual(pdf_url, "https://arxiv.org/pdf/1234.5678.pdf")
 
+    def test_pages_until_watermark_and_dedupes_cross_listed_papers(self) -> None:
+        cassette = Cassette(MODE_REPLAY)
+        cassette.add_http(ARXIV_API.format(category="cs.AI", start=0, page_size=2), _feed([("p3", "2026-03-07T03:00:00Z"), ("p2", "2026-03-07T02:00:00Z")], 4))
+        cassette.add_http(ARXIV_API.format(category="cs.AI", start=2, page_size=2), _feed([("p1", "2026-03-07T01:00:00Z"), ("p0", "2026-03-06T00:00:00Z")], 4))
+        cassette.add_http(ARXIV_API.format(category="cs.CL", start=0, page_size=2), _feed([("p3", "2026-03-07T03:00:00Z")], 1))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cursor_path = Path(temp_dir) / "arxiv-cursors.json"
+            cursor_path.write_text(json.dumps({"cs.AI": "2026-03-06T12:00:00+00:00"}))
+            collector = ArxivCollector(limit=10, categories=["cs.AI", "cs.CL"], page_size=2, cursor_path=cursor_path)
+            collector.configure_incremental(since=None, known_keys=set())
+            with use_cassette(cassette), patch.object(collector.summarizer, "summarize_text", return_value="summary"):
+                items = collector.collect()
+            uncommitted = json.loads(cursor_path.read_text())
+            collector.commit_state()
+            cursors = json.loads(cursor_path.read_text())
+
+        self.assertEqual([item.id for item in items], ["p3", "p2", "p1"])
+        self.assertEqual(uncommitted, {"cs.AI": "2026-03-06T12:00:00+00:00"})
+        self.assertEqual(cursors["cs.AI"], "2026-03-07T03:00:00+00:00")
+        self.assertEqual(cursors["cs.CL"], "2026-03-07T03:00:00+00:00")
+
+    def test_incremental_keeps_papers_updated_since_last_run(self) -> None:
+        cassette = Cassette(MODE_REPLAY)
+        cassette.add_http(
+            ARXIV_API.format(category="cs.AI", start=0, page_size=5),
+            _feed([("p1", "2026-03-07T09:00:00Z")], 1, published="2026-03-06T09:00:00Z"),
+        )
+        collector = ArxivCollector(categories=["cs.AI"])
+        collector.configure_incremental(since="2026-03-07T00:00:00+00:00", known_keys=set())
+        with use_cassette(cassette), patch.object(collector.summarizer, "summarize_text", return_value="summary"):
+            items = collector.collect()
+
+        self.assertEqual([item.id for item in items], ["p1"])
+
+    def test_revisions_older_than_since_stop_after_scan_limit(self) -> None:
+        cassette = Cassette(MODE_REPLAY)
+        for page in range(10):
+            entries = [(f"p{page}-{index}", f"2026-03-06T{23 - page * 2 - index:02d}:00:00Z") for index in range(5)]
+            cassette.add_http(ARXIV_API.format(category="cs.AI", start=page * 5, page_size=5), _feed(entries, 50, published="2026-03-01T00:00:00Z"))
+        collector = ArxivCollector(categories=["cs.AI"])
+        collector.configure_incremental(since="2026-03-07T00:00:00+00:00", known_keys=set())
+        with use_cassette(cassette), patch.object(collector, "_fetch_page", wraps=collector._fetch_page) as fetch_page:
+            items = collector.collect()
+
+        self.assertEqual(items, [])
+        self.assertEqual(fetch_page.call_count, 4)
+
+    def test_known_listing_stops_after_scan_limit_and_records_newest_seen(self) -> None:
+        cassette = Cassette(MODE_REPLAY)
+        for page in range(10):
+            entries = [(f"p{page}-{index}", f"2026-03-07T{23 - page * 2 - index:02d}:00:00Z") for index in range(2)]
+            cassette.add_http(ARXIV_API.format(category="cs.AI", start=page * 2, page_size=2), _feed(entries, 20))
+        known = {f"p{page}-{index}" for page in range(10) for index in range(2)}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cursor_path = Path(temp_dir) / "arxiv-cursors.json"
+            collector = ArxivCollector(limit=2, categories=["cs.AI"], cursor_path=cursor_path)
+            collector.configure_incremental(since=None, known_keys=known)
+            with use_cassette(cassette), patch.object(collector, "_fetch_page", wraps=collector._fetch_page) as fetch_page:
+                items = collector.collect()
+            collector.commit_state()
+            cursors = json.loads(cursor_path.read_text())
+
+        self.assertEqual(items, [])
+        self.assertEqual(fetch_page.call_count, 4)
+        self.assertEqual(cursors, {"cs.AI": "2026-03-07T23:00:00+00:00"})
+
+    def test_full_run_ignores_watermark_and_limit_stop_keeps_cursor(self) -> None:
+        cassette = Cassette(MODE_REPLAY)
+        cassette.add_http(
+            ARXIV_API.format(category="cs.AI", start=0, page_size=2),
+            _feed([("p3", "2026-03-07T03:00:00Z"), ("p2", "2026-03-07T02:00:00Z")], 4),
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cursor_path = Path(temp_dir) / "arxiv-cursors.json"
+            cursor_path.write_text(json.dumps({"cs.AI": "2026-03-07T03:00:00+00:00"}))
+            collector = ArxivCollector(limit=2, categories=["cs.AI"], cursor_path=cursor_path)
+            with use_cassette(cassette), patch.object(collector.summarizer, "summarize_text", return_value="summary"):
+                items = collector.collect()
+            collector.commit_state()
+            cursors = json.loads(cursor_path.read_text())
+
+        self.assertEqual([item.id for item in items], ["p3", "p2"])
+        self.assertEqual(cursors, {"cs.AI": "2026-03-07T03:00:00+00:00"})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,35 @@
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+from scripts.lib.collectors import COLLECTORS, load_collector, parse_sources
+
+SKILL_ROOT = Path(__file__).resolve().parents[3]
+LOADED_MODULES = """
+import sys
+import scripts.bin.run_daily
+from scripts.lib.pipeline.run_daily import collect_all_items
+print(" ".join(sorted(name for name in sys.modules if name.startswith("scripts.lib.collectors.") or name in ("xml.etree.ElementTree", "urllib.request"))))
+"""
+
+
+class CollectorRegistryTest(unittest.TestCase):
+    def test_parse_sources_keeps_order_and_rejects_unknown(self) -> None:
+        self.assertEqual(parse_sources(None), tuple(COLLECTORS))
+        self.assertEqual(parse_sources("arxiv, github,arxiv"), ("arxiv", "github"))
+        with self.assertRaisesRegex(ValueError, "hackernews"):
+            parse_sources("arxiv,hackernews")
+
+    def test_every_registered_collector_matches_its_source_type(self) -> None:
+        for source_type in COLLECTORS:
+            self.assertEqual(load_collector(source_type).source_type, source_type)
+
+    def test_importing_the_daily_pipeline_loads_no_collectors(self) -> None:
+        completed = subprocess.run([sys.executable, "-c", LOADED_MODULES], cwd=SKILL_ROOT, capture_output=True, text=True, check=True)
+
+        self.assertEqual(completed.stdout.split(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
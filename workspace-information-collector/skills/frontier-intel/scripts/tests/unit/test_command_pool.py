@@ -0,0 +1,68 @@
+import sys
+import time
+import unittest
+
+from scripts.utils.command import CommandPool, CommandSpec
+from scripts.utils.replay import MODE_RECORD, MODE_REPLAY, Cassette, use_cassette
+
+PRINT_LINES = [sys.executable, "-c", "import sys\nfor index in range(3): print(f'line {index}', flush=True)"]
+SLEEP_IN_CHILD = [sys.executable, "-c", "import subprocess, sys\nsubprocess.run([sys.executable, '-c', 'import time; time.sleep(30)'])"]
+
+UNDECODABLE_OUTPUT = [sys.executable, "-c", "import sys\nsys.stdout.buffer.write(b'ok\\n\\xff\\xfe\\n' + b'x' * 200000 + b'\\n')"]
+UNDECODABLE_STDERR = [sys.executable, "-c", "import sys\nsys.stderr.buffer.write(b'warn \\xff\\n' + b'x' * 200000 + b'\\nend\\n')"]
+
+
+class CommandPoolTest(unittest.TestCase):
+    def test_streams_lines_to_parsers_in_spec_order(self) -> None:
+        pool = CommandPool(max_concurrency=2)
+
+        results = pool.run([CommandSpec(PRINT_LINES, parser=list), CommandSpec(PRINT_LINES, parser=lambda lines: sum(1 for _ in lines))])
+
+        self.assertEqual(results[0].parsed, ["line 0", "line 1", "line 2"])
+        self.assertEqual(results[1].parsed, 3)
+        self.assertTrue(all(result.ok and result.elapsed_ms > 0 for result in results))
+
+    def test_batch_deadline_kills_process_groups(self) -> None:
+        pool = CommandPool(max_concurrency=2, deadline=0.5)
+        started = time.monotonic()
+
+        results = pool.run([CommandSpec(SLEEP_IN_CHILD), CommandSpec(SLEEP_IN_CHILD), CommandSpec(PRINT_LINES)])
+
+        self.assertLess(time.monotonic() - started, 10)
+        self.assertEqual([result.error for result in results], ["deadline", "deadline", "deadline"])
+        self.assertFalse(any(result.ok for result in results))
+
+    def test_undecodable_bytes_are_replaced_on_stdout_and_stderr(self) -> None:
+        results = CommandPool().run([CommandSpec(UNDECODABLE_OUTPUT, parser=list), CommandSpec(UNDECODABLE_STDERR)])
+
+        self.assertTrue(results[0].ok)
+        self.assertEqual(results[0].parsed[:2], ["ok", "\ufffd\ufffd"])
+        self.assertTrue(results[1].ok)
+        self.assertTrue(results[1].stderr.startswith("warn \ufffd\n"))
+        self.assertTrue(results[1].stderr.endswith("\nend\n"))
+
+    def test_parser_error_becomes_that_commands_error(self) -> None:
+        def fail(lines):
+            next(iter(lines))
+            raise ValueError("bad header")
+
+        results = CommandPool().run([CommandSpec(UNDECODABLE_OUTPUT, parser=fail), CommandSpec(PRINT_LINES, parser=list)])
+
+        self.assertIn("bad header", results[0].error)
+        self.assertEqual(results[1].parsed, ["line 0", "line 1", "line 2"])
+
+    def test_recorded_output_replays_through_the_same_parser(self) -> None:
+        recorder = Cassette(MODE_RECORD)
+        with use_cassette(recorder):
+            CommandPool().run([CommandSpec(PRINT_LINES, parser=list)])
+        replayer = Cassette(MODE_REPLAY)
+        replayer.commands = recorder.commands
+
+        with use_cassette(replayer):
+            results = CommandPool().run([CommandSpec(PRINT_LINES, parser=list)])
+
+        self.assertEqual(results[0].parsed, ["line 0", "line 1", "line 2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
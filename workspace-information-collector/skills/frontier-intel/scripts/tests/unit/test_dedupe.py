@@ -1,7 +1,7 @@
 import unittest
 
 from scripts.lib.models.item import FrontierItem
-from scripts.lib.pipeline.dedupe import dedupe_items
+from scripts.lib.pipeline.dedupe import dedupe_items, merge_items
 
 
 class DedupeItemsTest(unittest.TestCase):
@@ -26,6 +26,39 @@ class DedupeItemsTest(unittest.TestCase):
         self.assertEqual(len(items), 1)
         self.assertEqual(items[0].id, "openai/openai-python")
 
+    def test_merge_items_keeps_higher_score_and_unions_source_urls(self) -> None:
+        existing = FrontierItem(
+            id="r1",
+            type="reddit",
+            title="Thread",
+            source="Reddit",
+            url="https://reddit.com/r/a/1",
+            source_urls=["https://reddit.com/r/a/1"],
+            collected_at="2026-03-07T06:00:00+00:00",
+            score=30.0,
+        )
+        refreshed = FrontierItem(
+            id="r1",
+            type="reddit",
+            title="Thread",
+            source="Reddit",
+            url="https://reddit.com/r/a/1",
+            source_urls=["https://old.reddit.com/r/a/1"],
+            collected_at="2026-03-07T09:00:00+00:00",
+            score=42.0,
+        )
+        unchanged = FrontierItem(id="a1", type="arxiv", title="Paper", source="arXiv", url="https://arxiv.org/abs/1", score=60.0)
+        lower = FrontierItem(id="a1", type="arxiv", title="Paper", source="arXiv", url="https://arxiv.org/abs/1", score=10.0)
+
+        merged, changed = merge_items([existing, unchanged], [refreshed, lower])
+
+        by_id = {item.id: item for item in merged}
+        self.assertEqual(changed, {"r1"})
+        self.assertEqual(by_id["r1"].score, 42.0)
+        self.assertEqual(by_id["r1"].collected_at, "2026-03-07T06:00:00+00:00")
+        self.assertEqual(by_id["r1"].source_urls, ["https://old.reddit.com/r/a/1", "https://reddit.com/r/a/1"])
+        self.assertEqual(by_id["a1"].score, 60.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,8 @@
 import unittest
 
 from scripts.lib.models.item import FrontierItem
-from scripts.lib.pipeline.digest_daily import build_daily_digest_markdown
+from scripts.lib.pipeline.digest_daily import build_daily_digest_markdown, changed_sections
+from scripts.utils.tracing import COUNTER_CACHE_HITS, start_trace
 
 
 class DailyDigestTest(unittest.TestCase):
@@ -22,6 +23,22 @@ class DailyDigestTest(unittest.TestCase):
         self.assertIn("https://arxiv.org/pdf/1234.5678.pdf", markdown)
         self.assertIn("## Executive Summary", markdown)
 
+    def test_section_cache_rerenders_only_changed_sections(self) -> None:
+        paper = FrontierItem(id="paper-1", type="arxiv", title="A Good Paper", source="arXiv", url="https://arxiv.org/abs/1", executive_summary="Why it matters.")
+        repo = FrontierItem(id="org/repo", type="github", title="org/repo", source="GitHub", url="https://github.com/org/repo", score=10.0)
+        first_cache: dict = {}
+        build_daily_digest_markdown("2026-03-06", [paper, repo], first_cache)
+
+        updated_repo = FrontierItem(id="org/repo", type="github", title="org/repo", source="GitHub", url="https://github.com/org/repo", executive_summary="Now with a summary.", score=10.0)
+        second_cache = dict(first_cache)
+        with start_trace("daily-test") as tracer:
+            markdown = build_daily_digest_markdown("2026-03-06", [paper, updated_repo], second_cache)
+
+        self.assertIn("Now with a summary.", markdown)
+        self.assertNotIn("arxiv", changed_sections(first_cache, second_cache))
+        self.assertIn("github", changed_sections(first_cache, second_cache))
+        self.assertGreaterEqual(tracer.counters[COUNTER_CACHE_HITS], 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,46 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.lib.models.item import FrontierItem
+from scripts.lib.storage.codec import SCHEMA_VERSION, UnsupportedSchemaError, loads_rows
+from scripts.lib.storage.items_store import ItemsStore
+
+
+class ItemsStoreTest(unittest.TestCase):
+    def test_compact_round_trip_interns_repeated_strings(self) -> None:
+        items = [
+            FrontierItem(id=f"a{index}", type="arxiv", title=f"Paper {index}", source="arXiv", url=f"https://arxiv.org/abs/{index}", tags=["arxiv", "research"], score=60.0)
+            for index in range(3)
+        ]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = ItemsStore(Path(temp_dir))
+            target = store.save_items("2026-03-07", items)
+            payload = json.loads(target.read_text())
+            loaded = store.load_items("2026-03-07")
+
+        self.assertEqual(payload["schema"], SCHEMA_VERSION)
+        self.assertEqual(payload["strings"], ["arxiv", "arXiv", "research", ""])
+        self.assertEqual([item.to_dict() for item in loaded], [item.to_dict() for item in items])
+
+    def test_legacy_list_files_still_load(self) -> None:
+        legacy = [{"id": "r1", "type": "reddit", "title": "Thread", "source": "Reddit", "url": "https://reddit.com/1", "score": 3.0, "retired_field": "x"}]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = ItemsStore(Path(temp_dir))
+            store.path_for_date("2026-03-06").parent.mkdir(parents=True)
+            store.path_for_date("2026-03-06").write_text(json.dumps(legacy))
+
+            items = store.load_items("2026-03-06")
+            titles = store.load_rows("2026-03-06").column("title")
+
+        self.assertEqual(items[0].source, "Reddit")
+        self.assertEqual(titles, ["Thread"])
+
+    def test_unknown_schema_version_is_rejected(self) -> None:
+        with self.assertRaises(UnsupportedSchemaError):
+            loads_rows(json.dumps({"schema": 99, "fields": [], "strings": [], "rows": []}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from scripts.lib.models.item import FrontierItem
+from scripts.lib.notion.blocks import markdown_to_notion_blocks, text_segments
+from scripts.lib.notion.schema import build_item_page_properties
+from scripts.lib.notion.sync import NotionSyncService
+
+
+class _RecordingClient:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict | list]] = []
+        self._lock = threading.Lock()
+
+    def create_page(self, payload: dict) -> dict:
+        with self._lock:
+            self.calls.append(("create_page", payload))
+            return {"id": f"page-{len(self.calls)}"}
+
+    def append_block_children(self, block_id: str, children: list[dict]) -> dict:
+        self.calls.append(("append", children))
+        return {}
+
+
+class _FailingAppendClient(_RecordingClient):
+    def __init__(self, fail_on_append: int) -> None:
+        super().__init__()
+        self.fail_on_append = fail_on_append
+
+    def append_block_children(self, block_id: str, children: list[dict]) -> dict:
+        if sum(1 for name, _ in self.calls if name == "append") + 1 == self.fail_on_append:
+            self.fail_on_append = 0
+            raise RuntimeError("append failed")
+        return super().append_block_children(block_id, children)
+
+
+def _sync_digest(service: NotionSyncService, children: list[dict]) -> dict | None:
+    return service.sync_digest(
+        database_id="db",
+        digest_key="daily-2026-03-07",
+        title="Daily",
+        period="Daily",
+        digest_date="2026-03-07",
+        week_key="2026-W10",
+        executive_summary="",
+        top_highlights=[],
+        suggested_actions=[],
+        learning_themes=[],
+        item_count=0,
+        children=children,
+    )
+
+
+class NotionBlocksTest(unittest.TestCase):
+    def test_long_text_is_split_into_2000_character_segments(self) -> None:
+        segments = text_segments("x" * 4500)
+        item = FrontierItem(id="a", type="news", title="A", source="Web", url="https://a", executive_summary="y" * 2500)
+
+        self.assertEqual([len(segment["text"]["content"]) for segment in segments], [2000, 2000, 500])
+        self.assertEqual(len(build_item_page_properties(item)["Executive Summary"]["rich_text"]), 2)
+
+    def test_digest_body_is_sent_in_batches_of_100(self) -> None:
+        markdown = "# Title\n\n" + "\n".join(f"- bullet {index}" for index in range(249))
+        client = _RecordingClient()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            service = NotionSyncService(client, Path(temp_dir))
+            service.sync_digest(
+                database_id="db",
+                digest_key="daily-2026-03-07",
+                title="Daily",
+                period="Daily",
+                digest_date="2026-03-07",
+                week_key="2026-W10",
+                executive_summary="",
+                top_highlights=[],
+                suggested_actions=[],
+                learning_themes=[],
+                item_count=0,
+                children=markdown_to_notion_blocks(markdown),
+            )
+
+        self.assertEqual([name for name, _ in client.calls], ["create_page", "append", "append"])
+        self.assertEqual(len(client.calls[0][1]["children"]), 100)
+        self.assertEqual([len(children) for _, children in client.calls[1:]], [100, 50])
+        self.assertEqual(client.calls[1][1][0]["bulleted_list_item"]["rich_text"][0]["text"]["content"], "bullet 99")
+
+    def test_failed_append_resumes_on_the_same_page(self) -> None:
+        markdown = "\n".join(f"- bullet {index}" for index in range(250))
+        client = _FailingAppendClient(fail_on_append=2)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            service = NotionSyncService(client, Path(temp_dir))
+            with self.assertRaises(RuntimeError):
+                _sync_digest(service, markdown_to_notion_blocks(markdown))
+            resumed = _sync_digest(service, markdown_to_notion_blocks(markdown))
+            repeated = _sync_digest(service, markdown_to_notion_blocks(markdown))
+            state = service.state.read()
+
+        self.assertEqual([name for name, _ in client.calls], ["create_page", "append", "append"])
+        self.assertEqual(client.calls[2][1][0]["bulleted_list_item"]["rich_text"][0]["text"]["content"], "bullet 200")
+        self.assertEqual((resumed, repeated), ({"id": "page-1"}, None))
+        self.assertEqual(state["digests"], {"daily-2026-03-07": "page-1"})
+        self.assertEqual(state["digest_progress"], {})
+
+    def test_text_beyond_100_segments_continues_in_another_block(self) -> None:
+        blocks = markdown_to_notion_blocks("- " + "x" * (2000 * 150))
+
+        self.assertEqual([len(block["bulleted_list_item"]["rich_text"]) for block in blocks], [100, 50])
+
+    def test_items_are_created_concurrently_and_recorded(self) -> None:
+        client = _RecordingClient()
+        items = [FrontierItem(id=f"i{index}", type="news", title="T", source="Web", url=f"https://t/{index}") for index in range(5)]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            service = NotionSyncService(client, Path(temp_dir))
+            service.sync_items("db", items)
+            service.sync_items("db", items)
+            state = service.state.read()
+
+        self.assertEqual(len(client.calls), 5)
+        self.assertEqual(sorted(state["items"]), [f"i{index}" for index in range(5)])
+
+
+if __name__ == "__main__":
+    unittest.main()
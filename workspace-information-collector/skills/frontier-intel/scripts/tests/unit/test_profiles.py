@@ -0,0 +1,67 @@
+import inspect
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.lib.collectors import load_collector
+from scripts.lib.pipeline.profiles import SOURCE_OPTIONS, ProfileError, load_profile, load_profiles
+
+SKILL_ROOT = Path(__file__).resolve().parents[3]
+INVALID_CONFIG = """
+[profiles.broken]
+time_budget_seconds = -5
+color = "blue"
+
+[profiles.broken.sources.arxiv]
+limit = "many"
+cache_ttl_minutes = -1
+
+[profiles.broken.sources.hackernews]
+limit = 3
+
+[profiles.broken.sources.reddit]
+subreddits = []
+per_subreddit = 2
+"""
+
+
+class ProfilesTest(unittest.TestCase):
+    def test_shipped_profiles_load(self) -> None:
+        profiles = load_profiles(SKILL_ROOT / "config" / "profiles.toml")
+
+        self.assertIn("morning", profiles)
+        self.assertEqual(profiles["morning"].source_types(), ("news", "github", "arxiv"))
+        self.assertEqual(profiles["morning"].options()["arxiv"]["limit"], 5)
+        self.assertEqual(profiles["morning"].cache_ttls()["arxiv"], 360.0)
+
+    def test_every_option_is_a_collector_keyword(self) -> None:
+        for source_type, options in SOURCE_OPTIONS.items():
+            parameters = inspect.signature(load_collector(source_type)).parameters
+            self.assertEqual(set(options) - set(parameters), set(), source_type)
+
+    def test_invalid_config_reports_every_problem_before_running(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "profiles.toml"
+            path.write_text(INVALID_CONFIG)
+            with self.assertRaises(ProfileError) as caught:
+                load_profile(path, "broken")
+
+        message = str(caught.exception)
+        for fragment in (
+            "profiles.broken.time_budget_seconds",
+            "profiles.broken.color: unknown key",
+            "profiles.broken.sources.arxiv.limit",
+            "profiles.broken.sources.arxiv.cache_ttl_minutes",
+            "profiles.broken.sources.hackernews: unknown source",
+            "profiles.broken.sources.reddit.subreddits",
+        ):
+            self.assertIn(fragment, message)
+        self.assertNotIn("per_subreddit", message)
+
+    def test_unknown_profile_name_is_rejected(self) -> None:
+        with self.assertRaisesRegex(ProfileError, "unknown profile 'nightly'"):
+            load_profile(SKILL_ROOT / "config" / "profiles.toml", "nightly")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.lib.models.item import FrontierItem
+from scripts.lib.pipeline.digest_daily import build_daily_digest_document, build_daily_digest_markdown
+from scripts.lib.pipeline.render import FORMAT_HTML, FORMAT_JSON_FEED, FORMAT_MARKDOWN, FORMAT_NOTION, digest_targets, render_to_files
+
+
+class RenderTest(unittest.TestCase):
+    def test_one_pass_writes_every_format_from_the_same_selection(self) -> None:
+        paper = FrontierItem(
+            id="paper-1",
+            type="arxiv",
+            title="Sparse <Experts>",
+            source="arXiv",
+            url="https://arxiv.org/abs/1",
+            pdf_url="https://arxiv.org/pdf/1",
+            executive_summary="Why it matters.",
+            published_at="2026-03-06T00:00:00Z",
+        )
+        document = build_daily_digest_document("2026-03-06", [paper])
+        with tempfile.TemporaryDirectory() as temp_dir:
+            targets = render_to_files(document, digest_targets(Path(temp_dir), "2026-03-06"))
+            markdown = targets[FORMAT_MARKDOWN].read_text()
+            html = targets[FORMAT_HTML].read_text()
+            feed = json.loads(targets[FORMAT_JSON_FEED].read_text())
+            blocks = json.loads(targets[FORMAT_NOTION].read_text())
+            leftovers = [path.name for path in Path(temp_dir).iterdir() if path.name.startswith(".")]
+
+        self.assertEqual(markdown, build_daily_digest_markdown("2026-03-06", [paper]))
+        self.assertIn("<h3>1. Sparse &lt;Experts&gt;</h3>", html)
+        self.assertIn('<strong>PDF:</strong> <a href="https://arxiv.org/pdf/1">', html)
+        self.assertEqual([item["id"] for item in feed["items"]], ["paper-1"])
+        self.assertEqual(feed["items"][0]["attachments"][0]["url"], "https://arxiv.org/pdf/1")
+        self.assertEqual(blocks[0]["type"], "heading_1")
+        self.assertIn({"type": "text", "text": {"content": "Source: "}, "annotations": {"bold": True, "code": False}}, blocks[-2]["bulleted_list_item"]["rich_text"])
+        self.assertEqual(leftovers, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
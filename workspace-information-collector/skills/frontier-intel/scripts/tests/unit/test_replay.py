@@ -0,0 +1,49 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.utils.command import run_command
+from scripts.utils.http import read_url
+from scripts.utils.replay import MODE_RECORD, Cassette, ReplayMissError, use_cassette
+
+
+class ReplayTest(unittest.TestCase):
+    def test_recorded_bundle_replays_http_and_commands(self) -> None:
+        completed = type("Completed", (), {"stdout": '{"items": []}', "stderr": "", "returncode": 0})()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            bundle = Path(temp_dir) / "fixtures.json.gz"
+            with patch("scripts.utils.command.subprocess.run", return_value=completed), patch(
+                "scripts.utils.http._urlopen_read", return_value=b"<feed/>"
+            ):
+                with use_cassette(Cassette(MODE_RECORD), save_to=bundle):
+                    run_command(["xreach", "tweets", "@karpathy", "--json"])
+                    read_url("https://export.arxiv.org/api/query")
+
+            with patch("scripts.utils.command.subprocess.run", side_effect=AssertionError("live call")), patch(
+                "scripts.utils.http._urlopen_read", side_effect=AssertionError("live call")
+            ):
+                with use_cassette(Cassette.load(bundle)):
+                    result = run_command(["xreach", "tweets", "@karpathy", "--json"])
+                    body = read_url("https://export.arxiv.org/api/query")
+
+        self.assertEqual(result.stdout, '{"items": []}')
+        self.assertEqual(body, b"<feed/>")
+
+    def test_replay_miss_raises(self) -> None:
+        with use_cassette(Cassette()):
+            with self.assertRaises(ReplayMissError):
+                read_url("https://example.com/missing")
+
+    def test_stdin_specific_response_falls_back_to_args_only_entry(self) -> None:
+        cassette = Cassette()
+        cassette.add_command(["python3", "summarize_item.py"], stdout="generic")
+
+        with use_cassette(cassette):
+            result = run_command(["python3", "summarize_item.py"], input='{"title": "x"}')
+
+        self.assertEqual(result.stdout, "generic")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,197 @@
+import json
+import tempfile
+import time
+import unittest
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from scripts.lib.collectors import COLLECTORS
+from scripts.lib.collectors.base import Collector
+from scripts.lib.models.item import FrontierItem
+from scripts.lib.pipeline.dedupe import url_dedup_key
+from scripts.lib.pipeline.profiles import RunProfile, SourcePlan
+from scripts.lib.pipeline.run_daily import collect_all_items, run_daily
+from scripts.lib.storage.checkpoints import STAGE_COLLECTED, RunCheckpoints
+from scripts.lib.storage.run_lock import RunLock, RunLockedError
+from scripts.lib.storage.trend_store import TrendStore
+from scripts.utils.dates import current_digest_date
+
+
+class _PaperCollector(Collector):
+    source_type = "arxiv"
+    calls = 0
+
+    def collect(self) -> list[FrontierItem]:
+        type(self).calls += 1
+        return [FrontierItem(id="2603.00001", type="arxiv", title="Paper", source="arXiv", url="https://arxiv.org/abs/2603.00001", pdf_url="https://arxiv.org/pdf/2603.00001")]
+
+
+class _WatermarkCollector(_PaperCollector):
+    def configure_state(self, state_dir: Path) -> None:
+        self.cursor_path = state_dir / "paper-cursors.json"
+
+    def collect(self) -> list[FrontierItem]:
+        self.pending = {"cs.AI": "2026-03-07T03:00:00+00:00"}
+        return super().collect()
+
+    def commit_state(self) -> None:
+        if getattr(self, "pending", None) is not None:
+            self.cursor_path.write_text(json.dumps(self.pending))
+
+    def pending_state(self) -> dict[str, Any] | None:
+        return getattr(self, "pending", None)
+
+    def restore_pending_state(self, state: dict[str, Any]) -> None:
+        self.pending = state
+
+
+class _FlakyRepoCollector(Collector):
+    source_type = "github"
+    fail = True
+    limits: list[int] = []
+
+    def __init__(self, limit: int = 5) -> None:
+        type(self).limits.append(limit)
+
+    def collect(self) -> list[FrontierItem]:
+        if type(self).fail:
+            raise RuntimeError("network down")
+        return [FrontierItem(id="", type="github", title="org/repo", source="GitHub", url="https://github.com/org/repo", score=10)]
+
+
+class _SlowCollector(Collector):
+    source_type = "github"
+
+    def collect(self) -> list[FrontierItem]:
+        time.sleep(0.02)
+        return [FrontierItem(id="", type="github", title="org/slow", source="GitHub", url="https://github.com/org/slow")]
+
+
+class _BatchCollector(Collector):
+    source_type = "news"
+    batches: list[list[str]] = []
+    seen_known_keys: list[frozenset[str]] = []
+
+    def collect(self) -> list[FrontierItem]:
+        type(self).seen_known_keys.append(self.known_keys)
+        urls = type(self).batches.pop(0)
+        return [
+            FrontierItem(id=url, type="news", title=url, source="Web", url=url, score=55.0)
+            for url in urls
+            if self.is_new(key=url_dedup_key(url))
+        ]
+
+
+class RunDailyTest(unittest.TestCase):
+    def test_rerun_resumes_completed_collectors_after_crash(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            skill_root = Path(temp_dir) / "skills" / "frontier-intel"
+            project_root = Path(temp_dir) / "projects" / "frontier-intel"
+            _PaperCollector.calls = 0
+            _FlakyRepoCollector.fail = True
+            with patch.dict(COLLECTORS, {"arxiv": f"{__name__}:_PaperCollector", "github": f"{__name__}:_FlakyRepoCollector"}, clear=True):
+                with self.assertRaises(RuntimeError):
+                    run_daily(skill_root)
+                checkpoints = RunCheckpoints(project_root, f"daily-{current_digest_date()}")
+                self.assertTrue(checkpoints.has(STAGE_COLLECTED, "arxiv"))
+
+                _FlakyRepoCollector.fail = False
+                _, items, target = run_daily(skill_root)
+
+            self.assertEqual(_PaperCollector.calls, 1)
+            self.assertEqual({item.type for item in items}, {"arxiv", "github"})
+            self.assertTrue(target.exists())
+            self.assertFalse(checkpoints.root.exists())
+
+    def test_resume_from_scored_checkpoint_commits_collector_state(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            skill_root = Path(temp_dir) / "skills" / "frontier-intel"
+            project_root = Path(temp_dir) / "projects" / "frontier-intel"
+            _WatermarkCollector.calls = 0
+            with patch.dict(COLLECTORS, {"arxiv": f"{__name__}:_WatermarkCollector"}, clear=True):
+                with patch.object(TrendStore, "record_day", side_effect=RuntimeError("disk full")):
+                    with self.assertRaises(RuntimeError):
+                        run_daily(skill_root)
+                cursor_path = project_root / "state" / "paper-cursors.json"
+                self.assertFalse(cursor_path.exists())
+                run_daily(skill_root)
+
+            self.assertEqual(_WatermarkCollector.calls, 1)
+            self.assertEqual(json.loads(cursor_path.read_text()), {"cs.AI": "2026-03-07T03:00:00+00:00"})
+            self.assertIn("arxiv", json.loads((project_root / "state" / "source-cursors.json").read_text()))
+
+    def test_incremental_run_merges_new_items_into_existing_store(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            skill_root = Path(temp_dir) / "skills" / "frontier-intel"
+            _BatchCollector.batches = [["https://a.example.com/1"], ["https://a.example.com/1", "https://b.example.com/2"]]
+            _BatchCollector.seen_known_keys = []
+            with patch.dict(COLLECTORS, {"news": f"{__name__}:_BatchCollector"}, clear=True):
+                run_daily(skill_root)
+                _, items, _ = run_daily(skill_root, incremental=True)
+
+        self.assertEqual({item.url for item in items}, {"https://a.example.com/1", "https://b.example.com/2"})
+        self.assertIn(url_dedup_key("https://a.example.com/1"), _BatchCollector.seen_known_keys[-1])
+
+    def test_source_subset_run_keeps_other_sources_items(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            skill_root = Path(temp_dir) / "skills" / "frontier-intel"
+            project_root = Path(temp_dir) / "projects" / "frontier-intel"
+            _FlakyRepoCollector.fail = False
+            with patch.dict(COLLECTORS, {"arxiv": f"{__name__}:_PaperCollector", "github": f"{__name__}:_FlakyRepoCollector"}, clear=True):
+                run_daily(skill_root)
+                cursors_path = project_root / "state" / "source-cursors.json"
+                cursors_path.unlink()
+                _PaperCollector.calls = 0
+                _, items, _ = run_daily(skill_root, sources=("arxiv",))
+
+            self.assertEqual(_PaperCollector.calls, 1)
+            self.assertEqual(sorted(item.type for item in items), ["arxiv", "github"])
+            self.assertEqual(list(json.loads(cursors_path.read_text())), ["arxiv"])
+
+    def test_profile_reuses_fresh_sources_and_passes_options(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            skill_root = Path(temp_dir) / "skills" / "frontier-intel"
+            project_root = Path(temp_dir) / "projects" / "frontier-intel"
+            _FlakyRepoCollector.fail = False
+            _FlakyRepoCollector.limits = []
+            _PaperCollector.calls = 0
+            profile = RunProfile(
+                "morning",
+                {"arxiv": SourcePlan("arxiv", cache_ttl_minutes=60), "github": SourcePlan("github", {"limit": 2})},
+            )
+            with patch.dict(COLLECTORS, {"arxiv": f"{__name__}:_PaperCollector", "github": f"{__name__}:_FlakyRepoCollector"}, clear=True):
+                run_daily(skill_root, profile=profile)
+                cursors_path = project_root / "state" / "source-cursors.json"
+                recent = (datetime.now(UTC) - timedelta(minutes=10)).isoformat(timespec="seconds")
+                cursors_path.write_text(json.dumps({"arxiv": recent, "github": recent}))
+                _, items, _ = run_daily(skill_root, profile=profile)
+
+            self.assertEqual(_PaperCollector.calls, 1)
+            self.assertEqual(_FlakyRepoCollector.limits, [2, 2])
+            self.assertEqual(sorted(item.type for item in items), ["arxiv", "github"])
+            cursors = json.loads(cursors_path.read_text())
+            self.assertEqual(cursors["arxiv"], recent)
+            self.assertNotEqual(cursors["github"], recent)
+
+    def test_time_budget_skips_collectors_not_yet_started(self) -> None:
+        _PaperCollector.calls = 0
+        with patch.dict(COLLECTORS, {"github": f"{__name__}:_SlowCollector", "arxiv": f"{__name__}:_PaperCollector"}, clear=True):
+            items = collect_all_items(time_budget_seconds=0.01)
+
+        self.assertEqual([item.type for item in items], ["github"])
+        self.assertEqual(_PaperCollector.calls, 0)
+
+    def test_second_lock_holder_is_rejected(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            lock_path = Path(temp_dir) / "daily.lock"
+            with RunLock(lock_path):
+                with self.assertRaises(RunLockedError):
+                    RunLock(lock_path).acquire()
+            with RunLock(lock_path) as lock:
+                self.assertTrue(lock.held)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.lib.models.item import FrontierItem
+from scripts.lib.storage.items_store import ItemsStore
+from scripts.lib.storage.search_index import SearchIndex, SearchQueryError
+
+
+def _item(item_id: str, item_type: str, title: str, summary: str = "", tags: list[str] | None = None) -> FrontierItem:
+    return FrontierItem(id=item_id, type=item_type, title=title, source="Web", url=f"https://example.com/{item_id}", summary=summary, tags=tags or [])
+
+
+class SearchIndexTest(unittest.TestCase):
+    def test_save_items_updates_index_and_filters_apply(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            index = SearchIndex(Path(temp_dir) / "search.sqlite3")
+            store = ItemsStore(Path(temp_dir), index)
+            store.save_items("2026-03-01", [_item("n1", "news", "Speculative decoding lands in vLLM"), _item("a1", "arxiv", "Reasoning traces", summary="speculative decoding for agents")])
+            store.save_items("2026-03-05", [_item("g1", "github", "fast-decoding", tags=["speculative"])])
+
+            everything = index.search("speculative decoding")
+            arxiv_only = index.search("speculative", item_type="arxiv")
+            recent = index.search("speculative", since="2026-03-02")
+            store.save_items("2026-03-01", [_item("n2", "news", "Unrelated launch")])
+            after_rewrite = index.search("speculative")
+
+        self.assertEqual(everything[0].item_key, "n1")
+        self.assertEqual({hit.item_key for hit in everything}, {"n1", "a1", "g1"})
+        self.assertEqual([hit.item_key for hit in arxiv_only], ["a1"])
+        self.assertEqual([hit.item_key for hit in recent], ["g1"])
+        self.assertEqual([hit.item_key for hit in after_rewrite], ["g1"])
+
+    def test_malformed_raw_query_raises_search_query_error(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            index = SearchIndex(Path(temp_dir) / "search.sqlite3")
+            index.index_date("2026-03-01", [_item("n1", "news", "Mixture of experts")])
+
+            with self.assertRaises(SearchQueryError):
+                index.search('"unbalanced AND', raw=True)
+            self.assertEqual([hit.item_key for hit in index.search("mixture OR nothing", raw=True)], ["n1"])
+
+    def test_reindex_skips_unchanged_files(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            ItemsStore(Path(temp_dir)).save_items("2026-03-01", [_item("n1", "news", "Mixture of experts")])
+            store = ItemsStore(Path(temp_dir), SearchIndex(Path(temp_dir) / "search.sqlite3"))
+
+            first = store.reindex()
+            second = store.reindex()
+            hits = store.search_index.search("experts")
+
+        self.assertEqual((first, second), (1, 0))
+        self.assertEqual([hit.item_key for hit in hits], ["n1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
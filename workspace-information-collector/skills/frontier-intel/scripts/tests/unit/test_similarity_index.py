@@ -0,0 +1,59 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.lib.models.item import FrontierItem
+from scripts.lib.pipeline.digest_daily import build_daily_digest_markdown
+from scripts.lib.storage.similarity_index import SimilarityIndex
+
+
+def _item(item_id: str, title: str, summary: str) -> FrontierItem:
+    return FrontierItem(id=item_id, type="news", title=title, source="Web", url=f"https://example.com/{item_id}", summary=summary, score=60.0)
+
+
+class SimilarityIndexTest(unittest.TestCase):
+    def test_related_items_come_from_earlier_days_only(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            index = SimilarityIndex(Path(temp_dir) / "similarity.sqlite3")
+            index.add_items("2026-03-01", [
+                _item("old-decoding", "Speculative decoding doubles vLLM throughput", "Draft models speed up inference serving."),
+                _item("old-robots", "Humanoid robot startup raises funding", "Warehouse robotics company closes a round."),
+            ])
+            today = [
+                _item("new-decoding", "vLLM adds speculative decoding by default", "Inference serving gets draft model support."),
+                _item("same-day", "Speculative decoding tutorial", "Draft models for vLLM inference."),
+            ]
+            added = index.add_items("2026-03-02", today)
+            added_again = index.add_items("2026-03-02", today)
+
+            related = index.related(today[:1], before="2026-03-02")
+
+        self.assertEqual((added, added_again), (2, 0))
+        self.assertEqual([match.item_key for match in related["new-decoding"]], ["old-decoding"])
+
+    def test_digest_renders_related_links(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            index = SimilarityIndex(Path(temp_dir) / "similarity.sqlite3")
+            index.add_items("2026-03-01", [_item("old", "Mixture of experts routing", "Sparse expert routing for language models.")])
+            item = _item("new", "Expert routing in sparse mixture models", "Routing experts for language models.")
+            markdown = build_daily_digest_markdown("2026-03-02", [item], related=index.related([item], before="2026-03-02"))
+
+        self.assertIn("- **Related Earlier Items:** [Mixture of experts routing](https://example.com/old) (2026-03-01)", markdown)
+
+    def test_changed_items_are_reindexed_and_titles_escaped(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            index = SimilarityIndex(Path(temp_dir) / "similarity.sqlite3")
+            index.add_items("2026-03-01", [_item("old", "Humanoid robot startup raises funding", "Warehouse robotics company.")])
+            renamed = _item("old", "Mixture of experts [MoE] routing", "Sparse expert routing for language models.")
+            updated = index.add_items("2026-03-02", [renamed])
+            item = _item("new", "Expert routing in sparse mixture models", "Routing experts for language models.")
+            related = index.related([item], before="2026-03-02")
+            markdown = build_daily_digest_markdown("2026-03-02", [item], related=related)
+
+        self.assertEqual(updated, 1)
+        self.assertEqual([(match.title, match.digest_date) for match in related["new"]], [("Mixture of experts [MoE] routing", "2026-03-01")])
+        self.assertIn("[Mixture of experts \\[MoE\\] routing](https://example.com/old)", markdown)
+
+
+if __name__ == "__main__":
+    unittest.main()
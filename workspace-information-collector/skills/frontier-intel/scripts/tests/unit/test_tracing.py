@@ -0,0 +1,55 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.utils.command import run_command
+from scripts.utils.tracing import COUNTER_SUBPROCESSES, span, start_trace
+
+
+class TracingTest(unittest.TestCase):
+    def test_spans_nest_and_write_summary_and_chrome_trace(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with start_trace("daily-test") as tracer:
+                with span("collect"):
+                    with span("arxiv", "collector"):
+                        pass
+                summary_path, chrome_path = tracer.write(Path(temp_dir))
+
+            summary = json.loads(summary_path.read_text())
+            chrome = json.loads(chrome_path.read_text())
+
+        spans_by_name = {current["name"]: current for current in summary["spans"]}
+        self.assertEqual(spans_by_name["arxiv"]["parent"], "collect")
+        self.assertIn("collector:arxiv", summary["totals_ms"])
+        self.assertIn("arxiv", [event["name"] for event in chrome["traceEvents"] if event["ph"] == "X"])
+
+    def test_trace_with_output_dir_is_written_when_the_run_fails(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with self.assertRaises(RuntimeError):
+                with start_trace("daily-failed", Path(temp_dir)):
+                    with span("collect"):
+                        raise RuntimeError("network down")
+
+            summary = json.loads((Path(temp_dir) / "daily-failed.json").read_text())
+
+        self.assertEqual(summary["spans"][0]["error"], "RuntimeError")
+
+    def test_run_command_counts_subprocesses(self) -> None:
+        completed = type("Completed", (), {"stdout": "ok", "stderr": "", "returncode": 0})()
+        with patch("scripts.utils.command.subprocess.run", return_value=completed):
+            with start_trace("daily-test") as tracer:
+                run_command(["gh", "search", "repos"])
+
+        self.assertEqual(tracer.counters[COUNTER_SUBPROCESSES], 1)
+        self.assertEqual(tracer.spans[0].category, "subprocess")
+        self.assertEqual(tracer.spans[0].name, "gh")
+
+    def test_span_is_noop_without_active_trace(self) -> None:
+        with span("collect") as current:
+            self.assertIsNone(current)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import tempfile
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+
+from scripts.lib.models.item import FrontierItem
+from scripts.lib.pipeline.digest_weekly import build_weekly_digest_markdown
+from scripts.lib.storage.trend_store import KIND_DOMAIN, KIND_KEYWORD, KIND_REPO, TrendStore, extract_entities
+
+
+def _item(item_id: str, title: str, url: str) -> FrontierItem:
+    return FrontierItem(id=item_id, type="news", title=title, source="Web", url=url)
+
+
+class TrendStoreTest(unittest.TestCase):
+    def test_extracts_keywords_repos_and_domains(self) -> None:
+        entities = extract_entities(_item("r1", "Agents framework", "https://www.github.com/Org/Repo/tree/main"))
+
+        self.assertIn((KIND_KEYWORD, "agents"), entities)
+        self.assertIn((KIND_REPO, "org/repo"), entities)
+        self.assertIn((KIND_DOMAIN, "github.com"), entities)
+
+    def test_bursting_terms_rise_and_steady_terms_do_not(self) -> None:
+        start = date(2026, 2, 1)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = TrendStore(Path(temp_dir) / "trends.sqlite3")
+            for day in range(28):
+                digest_date = (start + timedelta(days=day)).isoformat()
+                store.record_day(digest_date, [_item(f"{day}-{index}", "Agents update", f"https://news.example/{day}/{index}") for index in range(3)])
+            today = (start + timedelta(days=28)).isoformat()
+            items = [_item(f"t{index}", "Agents adopt speculative decoding", f"https://github.com/vllm-project/vllm/pull/{index}") for index in range(3)]
+            store.record_day(today, items)
+            store.record_day(today, items)
+
+            rising = store.rising_topics(today)
+            weekly = build_weekly_digest_markdown("2026-W09", items, rising)
+
+        keys = {(topic.kind, topic.key) for topic in rising}
+        self.assertIn((KIND_KEYWORD, "speculative"), keys)
+        self.assertIn((KIND_REPO, "vllm-project/vllm"), keys)
+        self.assertNotIn((KIND_KEYWORD, "agents"), keys)
+        self.assertIn("## Rising This Week", weekly)
+        self.assertIn("`speculative` (keyword): 3 this week", weekly)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -27,6 +27,37 @@ class WebNewsCollectorTest(unittest.TestCase):
         self.assertEqual(items[0].url, "https://example.com/news")
         self.assertIn("compact multimodal model", items[0].executive_summary)
 
+    @patch("scripts.lib.collectors.web_news.fetch_url_text")
+    @patch.object(WebNewsCollector, "_fetch_results")
+    def test_triage_rejects_before_fetching(self, mocked_fetch_results, mocked_fetch_url_text) -> None:
+        snippet = "Researchers released an open model that beats larger systems on reasoning benchmarks."
+        mocked_fetch_results.return_value = [
+            {"title": "OpenAI ships a new reasoning model", "url": "https://techcrunch.com/a", "text": snippet, "query": "q1"},
+            {"title": "OpenAI ships a new reasoning model", "url": "https://example.com/copy", "text": snippet, "query": "q1"},
+            {"title": "Chip maker stock forecast for AI names", "url": "https://example.com/stock", "text": snippet, "query": "q1"},
+            {"title": "AI funding roundup from the week", "url": "https://bitrue.com/ai", "text": snippet, "query": "q1"},
+            {"title": "Small lab posts agent benchmark", "url": "https://example.com/thin", "text": "", "query": "q1"},
+            {"title": "Robotics startup shows a warehouse agent", "url": "https://example.com/robots", "text": snippet, "query": "q1"},
+        ]
+        mocked_fetch_url_text.return_value = ""
+        collector = WebNewsCollector(limit=5, per_query=1)
+
+        with patch("scripts.lib.collectors.web_news.Summarizer.summarize_text", return_value="A lab released a model that matters for agent builders and inference costs."):
+            items = collector.collect()
+
+        self.assertEqual([item.url for item in items], ["https://techcrunch.com/a"])
+        self.assertEqual(mocked_fetch_url_text.call_count, 1)
+        self.assertEqual(
+            {entry["url"]: entry["reason"] for entry in collector.rejected},
+            {
+                "https://example.com/copy": "duplicate_title",
+                "https://example.com/stock": "low_signal_title",
+                "https://bitrue.com/ai": "low_quality_domain",
+                "https://example.com/robots": "below_top_n",
+                "https://example.com/thin": "below_top_n",
+            },
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
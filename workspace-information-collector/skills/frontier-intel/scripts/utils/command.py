@@ -1,8 +1,17 @@
 from __future__ import annotations
 
 import json
+import os
+import signal
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import IO, Any, Callable, Iterable, Iterator
+
+from scripts.utils.replay import current_cassette
+from scripts.utils.tracing import COUNTER_SUBPROCESSES, incr, span
 
 
 @dataclass(slots=True)
@@ -16,19 +25,207 @@ class CommandResult:
         return self.returncode == 0
 
 
-def run_command(args: list[str], timeout: int = 60) -> CommandResult:
-    completed = subprocess.run(
-        args,
-        capture_output=True,
-        text=True,
-        timeout=timeout,
-        check=False,
-    )
-    return CommandResult(
-        stdout=completed.stdout,
-        stderr=completed.stderr,
-        returncode=completed.returncode,
-    )
+def run_command(args: list[str], timeout: int = 60, input: str | None = None) -> CommandResult:
+    with span(_command_name(args), "subprocess", argv=args[:4]) as current:
+        incr(COUNTER_SUBPROCESSES)
+        cassette = current_cassette()
+        if cassette is not None and cassette.replaying:
+            entry = cassette.replay_command(args, input)
+            result = CommandResult(stdout=entry["stdout"], stderr=entry["stderr"], returncode=entry["returncode"])
+        else:
+            started = time.perf_counter()
+            try:
+                completed = subprocess.run(
+                    args,
+                    input=input,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                    check=False,
+                )
+            except Exception as error:
+                if cassette is not None:
+                    cassette.add_command_error(args, repr(error), input=input, elapsed_ms=_elapsed_ms(started))
+                raise
+            result = CommandResult(
+                stdout=completed.stdout,
+                stderr=completed.stderr,
+                returncode=completed.returncode,
+            )
+            if cassette is not None:
+                cassette.add_command(
+                    args,
+                    stdout=result.stdout,
+                    stderr=result.stderr,
+                    returncode=result.returncode,
+                    input=input,
+                    elapsed_ms=_elapsed_ms(started),
+                )
+        if current is not None:
+            current.args["returncode"] = result.returncode
+            current.args["stdout_bytes"] = len(result.stdout or "")
+    return result
+
+
+@dataclass(slots=True)
+class CommandSpec:
+    args: list[str]
+    parser: Callable[[Iterable[str]], Any] | None = None
+    timeout: float | None = None
+    input: str | None = None
+
+
+@dataclass(slots=True)
+class PooledResult:
+    spec: CommandSpec
+    returncode: int | None = None
+    parsed: Any = None
+    stderr: str = ""
+    elapsed_ms: float = 0.0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.returncode == 0
+
+
+class CommandPool:
+    def __init__(self, max_concurrency: int = 4, deadline: float | None = None) -> None:
+        self.max_concurrency = max_concurrency
+        self.deadline = deadline
+        self._running: dict[int, subprocess.Popen] = {}
+        self._killed: dict[int, str] = {}
+        self._cancelled: str | None = None
+        self._lock = threading.Lock()
+
+    def run(self, specs: list[CommandSpec]) -> list[PooledResult]:
+        self._cancelled = None
+        deadline_at = time.monotonic() + self.deadline if self.deadline is not None else None
+        timer = threading.Timer(self.deadline, self.cancel, kwargs={"reason": "deadline"}) if self.deadline is not None else None
+        if timer is not None:
+            timer.daemon = True
+            timer.start()
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_concurrency, len(specs) or 1))) as pool:
+                return list(pool.map(lambda spec: self._run_one(spec, deadline_at), specs))
+        finally:
+            if timer is not None:
+                timer.cancel()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        with self._lock:
+            self._cancelled = reason
+            running = list(self._running.values())
+        for process in running:
+            self._kill(process, reason)
+
+    def _run_one(self, spec: CommandSpec, deadline_at: float | None) -> PooledResult:
+        args = spec.args
+        result = PooledResult(spec)
+        with span(_command_name(args), "subprocess", argv=args[:4], pooled=True) as current:
+            incr(COUNTER_SUBPROCESSES)
+            started = time.perf_counter()
+            cassette = current_cassette()
+            if self._cancelled is not None:
+                result.error = self._cancelled
+            elif cassette is not None and cassette.replaying:
+                try:
+                    entry = cassette.replay_command(args, spec.input)
+                    result.returncode = entry["returncode"]
+                    result.stderr = entry["stderr"]
+                    result.parsed = _parse(spec, iter(entry["stdout"].splitlines(keepends=True)))
+                except Exception as error:
+                    result.error = repr(error)
+            else:
+                captured = self._execute(spec, result, deadline_at, keep_stdout=cassette is not None)
+                if cassette is not None:
+                    if result.returncode is None:
+                        cassette.add_command_error(args, result.error or "killed", input=spec.input, elapsed_ms=_elapsed_ms(started))
+                    else:
+                        cassette.add_command(
+                            args,
+                            stdout=captured,
+                            stderr=result.stderr,
+                            returncode=result.returncode,
+                            input=spec.input,
+                            elapsed_ms=_elapsed_ms(started),
+                        )
+            result.elapsed_ms = round(_elapsed_ms(started), 3)
+            if current is not None:
+                current.args.update(returncode=result.returncode, error=result.error)
+        return result
+
+    def _execute(self, spec: CommandSpec, result: PooledResult, deadline_at: float | None, *, keep_stdout: bool) -> str:
+        try:
+            process = subprocess.Popen(
+                spec.args,
+                stdin=subprocess.PIPE if spec.input is not None else subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                # Reader threads must not die on a stray non-UTF-8 byte
+                errors="replace",
+                start_new_session=True,
+            )
+        except OSError as error:
+            result.error = repr(error)
+            return ""
+        with self._lock:
+            self._running[process.pid] = process
+            cancelled = self._cancelled
+        if cancelled is not None:
+            self._kill(process, cancelled)
+        limits = [(spec.timeout, "timeout")] if spec.timeout is not None else []
+        if deadline_at is not None:
+            limits.append((deadline_at - time.monotonic(), "deadline"))
+        limit, reason = min(limits) if limits else (None, None)
+        watchdog = threading.Timer(max(0.0, limit), self._kill, args=(process, reason)) if limit is not None else None
+        stderr_chunks: list[str] = []
+        helpers = [threading.Thread(target=_drain, args=(process.stderr, stderr_chunks), daemon=True)]
+        if spec.input is not None:
+            helpers.append(threading.Thread(target=_feed, args=(process.stdin, spec.input), daemon=True))
+        for helper in helpers:
+            helper.start()
+        if watchdog is not None:
+            watchdog.daemon = True
+            watchdog.start()
+        stdout_chunks: list[str] = []
+        try:
+            lines = _tee(process.stdout, stdout_chunks if keep_stdout else None)
+            try:
+                result.parsed = _parse(spec, lines)
+                for _ in lines:
+                    pass
+            except Exception as error:
+                result.error = repr(error)
+                _finish_reading(process, lines)
+            process.wait()
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+            for helper in helpers:
+                helper.join()
+            process.stdout.close()
+            process.stderr.close()
+            with self._lock:
+                self._running.pop(process.pid, None)
+                killed = self._killed.pop(process.pid, None)
+        result.stderr = "".join(stderr_chunks)
+        if killed is not None:
+            result.error = killed
+        else:
+            result.returncode = process.returncode
+        return "".join(stdout_chunks)
+
+    def _kill(self, process: subprocess.Popen, reason: str) -> None:
+        with self._lock:
+            if process.pid not in self._running or process.pid in self._killed:
+                return
+            self._killed[process.pid] = reason
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
 
 
 def load_json_output(args: list[str], timeout: int = 60) -> object:
@@ -36,3 +233,54 @@ def load_json_output(args: list[str], timeout: int = 60) -> object:
     if not result.ok:
         raise RuntimeError(result.stderr.strip() or f"Command failed: {' '.join(args)}")
     return json.loads(result.stdout)
+
+
+def _parse(spec: CommandSpec, lines: Iterator[str]) -> Any:
+    if spec.parser is None:
+        return "".join(lines)
+    return spec.parser(line.rstrip("\n") for line in lines)
+
+
+def _tee(stream: IO[str], chunks: list[str] | None) -> Iterator[str]:
+    for line in stream:
+        if chunks is not None:
+            chunks.append(line)
+        yield line
+
+
+def _finish_reading(process: subprocess.Popen, lines: Iterator[str]) -> None:
+    # Drain what the parser left unread, and stop the process if even that fails
+    # rather than letting wait() block on a full pipe
+    try:
+        for _ in lines:
+            pass
+        for _ in process.stdout:
+            pass
+    except Exception:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+
+def _drain(stream: IO[str], chunks: list[str]) -> None:
+    for chunk in stream:
+        chunks.append(chunk)
+
+
+def _feed(stream: IO[str], text: str) -> None:
+    try:
+        stream.write(text)
+        stream.close()
+    except BrokenPipeError:
+        pass
+
+
+def _command_name(args: list[str]) -> str:
+    if not args:
+        return "command"
+    return args[0].rsplit("/", 1)[-1]
+
+
+def _elapsed_ms(started: float) -> float:
+    return (time.perf_counter() - started) * 1000.0
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import re
-from urllib.request import Request, urlopen
+from urllib.request import Request
+
+from scripts.utils.http import read_url
 
 JINA_PREFIX = "https://r.jina.ai/http://"
 JINA_WRAPPER_START = "Title: "
@@ -36,8 +38,7 @@ def fetch_url_text(url: str, timeout: int = 30) -> str:
     for source_type, candidate in candidates:
         try:
             request = Request(candidate, headers={"User-Agent": "Mozilla/5.0"})
-            with urlopen(request, timeout=timeout) as response:
-                raw_text = response.read().decode(errors="ignore")
+            raw_text = read_url(request, timeout=timeout).decode(errors="ignore")
             cleaned = _clean_fetched_text(raw_text, source_type=source_type)
             if _looks_usable(cleaned):
                 return cleaned
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import io
+import time
+from contextlib import contextmanager
+from typing import IO, Iterator
+from urllib.parse import urlsplit
+from urllib.request import Request, urlopen
+
+from scripts.utils.replay import current_cassette
+from scripts.utils.tracing import COUNTER_BYTES_FETCHED, COUNTER_HTTP_REQUESTS, incr, span
+
+
+def read_url(request: Request | str, timeout: float | None = None) -> bytes:
+    url = request.full_url if isinstance(request, Request) else request
+    method = request.get_method() if isinstance(request, Request) else "GET"
+    with span(urlsplit(url).netloc or url, "http", url=url) as current:
+        incr(COUNTER_HTTP_REQUESTS)
+        cassette = current_cassette()
+        if cassette is not None and cassette.replaying:
+            body = cassette.replay_http(url, method)
+        else:
+            started = time.perf_counter()
+            try:
+                body = _urlopen_read(request, timeout)
+            except Exception as error:
+                if cassette is not None:
+                    cassette.add_http_error(url, repr(error), method=method, elapsed_ms=_elapsed_ms(started))
+                raise
+            if cassette is not None:
+                cassette.add_http(url, body, method=method, elapsed_ms=_elapsed_ms(started))
+        incr(COUNTER_BYTES_FETCHED, len(body))
+        if current is not None:
+            current.args["bytes"] = len(body)
+        return body
+
+
+@contextmanager
+def open_url(request: Request | str, timeout: float | None = None) -> Iterator[IO[bytes]]:
+    url = request.full_url if isinstance(request, Request) else request
+    method = request.get_method() if isinstance(request, Request) else "GET"
+    with span(urlsplit(url).netloc or url, "http", url=url, streamed=True) as current:
+        incr(COUNTER_HTTP_REQUESTS)
+        cassette = current_cassette()
+        if cassette is not None and cassette.replaying:
+            stream: _CountingReader = _CountingReader(io.BytesIO(cassette.replay_http(url, method)))
+            yield stream
+        else:
+            started = time.perf_counter()
+            response = urlopen(request) if timeout is None else urlopen(request, timeout=timeout)
+            with response:
+                stream = _CountingReader(response, keep=cassette is not None)
+                yield stream
+            if cassette is not None:
+                cassette.add_http(url, stream.captured(), method=method, elapsed_ms=_elapsed_ms(started))
+        incr(COUNTER_BYTES_FETCHED, stream.bytes_read)
+        if current is not None:
+            current.args["bytes"] = stream.bytes_read
+
+
+class _CountingReader(io.RawIOBase):
+    def __init__(self, raw: IO[bytes], keep: bool = False) -> None:
+        self._raw = raw
+        self._chunks: list[bytes] | None = [] if keep else None
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._raw.read(size)
+        self.bytes_read += len(chunk)
+        if self._chunks is not None:
+            self._chunks.append(chunk)
+        return chunk
+
+    def readinto(self, buffer: bytearray) -> int:
+        chunk = self.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    def captured(self) -> bytes:
+        return b"".join(self._chunks or [])
+
+
+def _urlopen_read(request: Request | str, timeout: float | None) -> bytes:
+    if timeout is None:
+        with urlopen(request) as response:
+            return response.read()
+    with urlopen(request, timeout=timeout) as response:
+        return response.read()
+
+
+def _elapsed_ms(started: float) -> float:
+    return (time.perf_counter() - started) * 1000.0
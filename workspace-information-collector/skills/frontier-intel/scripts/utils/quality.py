@@ -14,6 +14,17 @@ TRUNCATION_PATTERNS = (
     "...",
     "…",
 )
+LOW_SIGNAL_TITLE_PATTERNS = (
+    "price prediction",
+    "stock forecast",
+    "press release",
+    "sponsored",
+    "webinar",
+    "coupon",
+    "horoscope",
+)
+MIN_TITLE_WORDS = 3
+MIN_SNIPPET_LENGTH = 40
 
 
 def is_bad_summary(title: str, summary: str) -> bool:
@@ -33,5 +44,30 @@ def is_bad_summary(title: str, summary: str) -> bool:
     return False
 
 
+def title_issues(title: str) -> list[str]:
+    issues: list[str] = []
+    lowered = _normalize(title)
+    if len(lowered.split()) < MIN_TITLE_WORDS:
+        issues.append("short_title")
+    if any(pattern in lowered for pattern in LOW_SIGNAL_TITLE_PATTERNS):
+        issues.append("low_signal_title")
+    letters = [char for char in title if char.isalpha()]
+    if len(letters) >= 12 and all(char.isupper() for char in letters):
+        issues.append("shouting_title")
+    return issues
+
+
+def snippet_issues(title: str, snippet: str) -> list[str]:
+    normalized_snippet = _normalize(snippet)
+    if len(normalized_snippet) < MIN_SNIPPET_LENGTH:
+        return ["thin_snippet"]
+    issues: list[str] = []
+    if any(token in normalized_snippet for token in WRAPPER_PATTERNS):
+        issues.append("wrapper_snippet")
+    if normalized_snippet == _normalize(title):
+        issues.append("title_only_snippet")
+    return issues
+
+
 def _normalize(text: str) -> str:
     return re.sub(r"\s+", " ", text or "").strip().lower()
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import base64
+import gzip
+import hashlib
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+BUNDLE_VERSION = 1
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+
+
+class ReplayMissError(LookupError):
+    pass
+
+
+@dataclass(slots=True)
+class LatencyProfile:
+    http_ms: float = 0.0
+    command_ms: float = 0.0
+    recorded_scale: float = 0.0
+    jitter_ms: float = 0.0
+    seed: int = 0
+
+
+class Cassette:
+    def __init__(self, mode: str = MODE_REPLAY, latency: LatencyProfile | None = None) -> None:
+        if mode not in (MODE_RECORD, MODE_REPLAY):
+            raise ValueError(f"Unsupported cassette mode: {mode}")
+        self.mode = mode
+        self.latency = latency or LatencyProfile()
+        self.http: dict[str, list[dict[str, Any]]] = {}
+        self.commands: dict[str, list[dict[str, Any]]] = {}
+        self._cursors: dict[str, int] = {}
+        self._random = random.Random(self.latency.seed)
+        self._lock = threading.Lock()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == MODE_REPLAY
+
+    @classmethod
+    def load(cls, path: Path, latency: LatencyProfile | None = None) -> "Cassette":
+        raw = path.read_bytes()
+        if path.suffix == ".gz":
+            raw = gzip.decompress(raw)
+        payload = json.loads(raw.decode())
+        if payload.get("version") != BUNDLE_VERSION:
+            raise ValueError(f"Unsupported fixture bundle version: {payload.get('version')}")
+        cassette = cls(MODE_REPLAY, latency)
+        cassette.http = payload.get("http", {})
+        cassette.commands = payload.get("commands", {})
+        return cassette
+
+    def save(self, path: Path) -> Path:
+        payload = {"version": BUNDLE_VERSION, "http": self.http, "commands": self.commands}
+        raw = json.dumps(payload, indent=1, sort_keys=True).encode()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(gzip.compress(raw) if path.suffix == ".gz" else raw)
+        return path
+
+    def add_http(self, url: str, body: bytes | str, *, method: str = "GET", elapsed_ms: float = 0.0) -> None:
+        data = body.encode() if isinstance(body, str) else body
+        entry = {"body_b64": base64.b64encode(data).decode(), "elapsed_ms": round(elapsed_ms, 3)}
+        self._append(self.http, http_key(url, method), entry)
+
+    def add_http_error(self, url: str, error: str, *, method: str = "GET", elapsed_ms: float = 0.0) -> None:
+        self._append(self.http, http_key(url, method), {"error": error, "elapsed_ms": round(elapsed_ms, 3)})
+
+    def add_command(
+        self,
+        args: list[str],
+        *,
+        stdout: str = "",
+        stderr: str = "",
+        returncode: int = 0,
+        input: str | None = None,
+        elapsed_ms: float = 0.0,
+    ) -> None:
+        entry = {"stdout": stdout, "stderr": stderr, "returncode": returncode, "elapsed_ms": round(elapsed_ms, 3)}
+        self._append(self.commands, command_key(args, input), entry)
+
+    def add_command_error(self, args: list[str], error: str, *, input: str | None = None, elapsed_ms: float = 0.0) -> None:
+        self._append(self.commands, command_key(args, input), {"error": error, "elapsed_ms": round(elapsed_ms, 3)})
+
+    def replay_http(self, url: str, method: str = "GET") -> bytes:
+        entry = self._next(self.http, [http_key(url, method)])
+        self._sleep(self.latency.http_ms, entry)
+        if "error" in entry:
+            raise OSError(f"replayed HTTP error for {url}: {entry['error']}")
+        return base64.b64decode(entry["body_b64"])
+
+    def replay_command(self, args: list[str], input: str | None = None) -> dict[str, Any]:
+        keys = [command_key(args, input), command_key(args, None)]
+        entry = self._next(self.commands, keys)
+        self._sleep(self.latency.command_ms, entry)
+        if "error" in entry:
+            raise OSError(f"replayed command error for {args[0]}: {entry['error']}")
+        return entry
+
+    def _append(self, table: dict[str, list[dict[str, Any]]], key: str, entry: dict[str, Any]) -> None:
+        with self._lock:
+            table.setdefault(key, []).append(entry)
+
+    def _next(self, table: dict[str, list[dict[str, Any]]], keys: list[str]) -> dict[str, Any]:
+        with self._lock:
+            for key in keys:
+                entries = table.get(key)
+                if not entries:
+                    continue
+                cursor = self._cursors.get(key, 0)
+                self._cursors[key] = cursor + 1
+                return entries[min(cursor, len(entries) - 1)]
+        raise ReplayMissError(f"No recorded response for {keys[0]}")
+
+    def _sleep(self, fixed_ms: float, entry: dict[str, Any]) -> None:
+        delay_ms = fixed_ms + self.latency.recorded_scale * float(entry.get("elapsed_ms", 0.0))
+        if self.latency.jitter_ms:
+            with self._lock:
+                delay_ms += self._random.uniform(0.0, self.latency.jitter_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000.0)
+
+
+def http_key(url: str, method: str = "GET") -> str:
+    return f"{method.upper()} {url}"
+
+
+def command_key(args: list[str], input: str | None = None) -> str:
+    key = json.dumps(list(args))
+    if input is None:
+        return key
+    return f"{key} stdin:{hashlib.sha1(input.encode()).hexdigest()[:12]}"
+
+
+_active_cassette: Cassette | None = None
+
+
+def current_cassette() -> Cassette | None:
+    return _active_cassette
+
+
+@contextmanager
+def use_cassette(cassette: Cassette, save_to: Path | None = None) -> Iterator[Cassette]:
+    global _active_cassette
+    previous = _active_cassette
+    _active_cassette = cassette
+    try:
+        yield cassette
+    finally:
+        _active_cassette = previous
+        if save_to is not None and cassette.mode == MODE_RECORD:
+            cassette.save(save_to)
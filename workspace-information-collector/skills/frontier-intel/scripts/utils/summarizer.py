@@ -3,10 +3,12 @@ from __future__ import annotations
 import json
 import re
 import shutil
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 
 from scripts.utils.command import run_command
 from scripts.utils.text import concise_summary
+from scripts.utils.tracing import span
 
 SHARED_SUMMARY_SCRIPT = "/root/.openclaw/skills/frontier-summary/scripts/summarize_item.py"
 HTML_TAGS = re.compile(r"<[^>]+>")
@@ -17,13 +19,20 @@ SPACE = re.compile(r"\s+")
 class Summarizer:
     def __init__(self, binary: str = "summarize") -> None:
         self.binary = binary
-        self.binary_path = shutil.which(binary)
+
+    @cached_property
+    def binary_path(self) -> str | None:
+        return shutil.which(self.binary)
 
     @property
     def available(self) -> bool:
         return self.binary_path is not None
 
     def summarize_url(self, url: str, *, item_type: str = "news", fallback_title: str = "", fallback_text: str = "") -> str:
+        with span("summarize_url", "summarize", item_type=item_type):
+            return self._summarize_url(url, item_type=item_type, fallback_title=fallback_title, fallback_text=fallback_text)
+
+    def _summarize_url(self, url: str, *, item_type: str, fallback_title: str, fallback_text: str) -> str:
         if self.available and url:
             command = [
                 self.binary_path,
@@ -40,18 +49,24 @@ class Summarizer:
         return self.summarize_text(item_type=item_type, title=fallback_title, text=fallback_text)
 
     def summarize_text(self, *, item_type: str, title: str, text: str) -> str:
+        with span("summarize_text", "summarize", item_type=item_type):
+            return self._summarize_text(item_type=item_type, title=title, text=text)
+
+    def summarize_batch(self, *, item_type: str, entries: list[tuple[str, str]], max_workers: int = 4) -> list[str]:
+        if not entries:
+            return []
+        with span("summarize_batch", "summarize", item_type=item_type, size=len(entries)):
+            if max_workers <= 1 or len(entries) == 1:
+                return [self.summarize_text(item_type=item_type, title=title, text=text) for title, text in entries]
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(entries))) as pool:
+                return list(pool.map(lambda entry: self.summarize_text(item_type=item_type, title=entry[0], text=entry[1]), entries))
+
+    def _summarize_text(self, *, item_type: str, title: str, text: str) -> str:
         cleaned_text = self.clean_source_text(text)
         payload = json.dumps({"type": item_type, "title": title, "text": cleaned_text})
         try:
-            completed = subprocess.run(
-                ["python3", SHARED_SUMMARY_SCRIPT],
-                input=payload,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=False,
-            )
-            if completed.returncode == 0 and completed.stdout.strip():
+            completed = run_command(["python3", SHARED_SUMMARY_SCRIPT], timeout=30, input=payload)
+            if completed.ok and completed.stdout.strip():
                 parsed = json.loads(completed.stdout)
                 summary = parsed.get("summary", "").strip()
                 if summary:
@@ -7,6 +7,17 @@ MULTISPACE_PATTERN = re.compile(r"\s+")
 MARKDOWN_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\([^\)]+\)")
 SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+")
 DATE_LEAD_PATTERN = re.compile(r"^[A-Z][a-z]+\s+\d{1,2},\s+\d{4}[)\-,:\s]+")
+TERM_PATTERN = re.compile(r"[a-z0-9][a-z0-9+\-]*[a-z0-9+]")
+
+STOPWORDS = frozenset(
+    """
+    about after also among and any are because been before being between both but can could did does doing
+    down during each few for from further had has have having her here hers him his how into its itself just
+    more most much new not now off once only other our ours out over own same she should some such than that
+    the their theirs them then there these they this those through too under until very was were what when
+    where which while who whom why will with would you your yours via using used use based per
+    """.split()
+)
 
 NOISE_PATTERNS = [
     re.compile(r"skip to main content.*", re.IGNORECASE),
@@ -87,6 +98,14 @@ def concise_summary(*, title: str, text: str, max_sentences: int = 2, limit: int
     return _trim_to_sentence(joined, limit)
 
 
+def keyword_terms(text: str) -> list[str]:
+    return [
+        term
+        for term in TERM_PATTERN.findall(unescape(text).lower())
+        if len(term) > 2 and term not in STOPWORDS and not term.isdigit()
+    ]
+
+
 def _unique_sentences(text: str) -> list[str]:
     seen: set[str] = set()
     unique: list[str] = []
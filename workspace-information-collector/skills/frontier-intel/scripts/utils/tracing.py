@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+COUNTER_CACHE_HITS = "cache_hits"
+COUNTER_BYTES_FETCHED = "bytes_fetched"
+COUNTER_HTTP_REQUESTS = "http_requests"
+COUNTER_SUBPROCESSES = "subprocesses_spawned"
+
+
+@dataclass(slots=True)
+class Span:
+    name: str
+    category: str
+    start: float
+    duration: float = 0.0
+    thread_id: int = 0
+    parent: str | None = None
+    error: str | None = None
+    args: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "category": self.category,
+            "start_ms": round(self.start * 1000.0, 3),
+            "duration_ms": round(self.duration * 1000.0, 3),
+            "thread_id": self.thread_id,
+            "parent": self.parent,
+            "error": self.error,
+            "args": self.args,
+        }
+
+
+class Tracer:
+    def __init__(self, run_id: str) -> None:
+        self.run_id = run_id
+        self.started_at = time.perf_counter()
+        self.spans: list[Span] = []
+        self.counters: dict[str, float] = {}
+        self._counter_samples: list[tuple[float, str, float]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def span(self, name: str, category: str = "stage", **args: Any) -> Iterator[Span]:
+        stack = self._stack()
+        current = Span(
+            name=name,
+            category=category,
+            start=time.perf_counter() - self.started_at,
+            thread_id=threading.get_ident(),
+            parent=stack[-1].name if stack else None,
+            args=dict(args),
+        )
+        stack.append(current)
+        try:
+            yield current
+        except BaseException as error:
+            current.error = type(error).__name__
+            raise
+        finally:
+            stack.pop()
+            current.duration = time.perf_counter() - self.started_at - current.start
+            with self._lock:
+                self.spans.append(current)
+
+    def incr(self, counter: str, value: float = 1) -> None:
+        with self._lock:
+            total = self.counters.get(counter, 0) + value
+            self.counters[counter] = total
+            self._counter_samples.append((time.perf_counter() - self.started_at, counter, total))
+
+    def stage_totals(self) -> dict[str, float]:
+        totals: dict[str, float] = {}
+        for current in self.spans:
+            key = f"{current.category}:{current.name}"
+            totals[key] = totals.get(key, 0.0) + current.duration * 1000.0
+        return {key: round(value, 3) for key, value in sorted(totals.items())}
+
+    def to_dict(self) -> dict[str, Any]:
+        spans = sorted(self.spans, key=lambda current: current.start)
+        return {
+            "run_id": self.run_id,
+            "elapsed_ms": round((time.perf_counter() - self.started_at) * 1000.0, 3),
+            "counters": dict(sorted(self.counters.items())),
+            "totals_ms": self.stage_totals(),
+            "spans": [current.to_dict() for current in spans],
+        }
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        pid = os.getpid()
+        events: list[dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": f"frontier-intel {self.run_id}"}}
+        ]
+        for current in sorted(self.spans, key=lambda span: span.start):
+            args = dict(current.args)
+            if current.error:
+                args["error"] = current.error
+            events.append(
+                {
+                    "name": current.name,
+                    "cat": current.category,
+                    "ph": "X",
+                    "ts": round(current.start * 1_000_000.0, 1),
+                    "dur": round(current.duration * 1_000_000.0, 1),
+                    "pid": pid,
+                    "tid": current.thread_id,
+                    "args": args,
+                }
+            )
+        for offset, counter, total in self._counter_samples:
+            events.append(
+                {
+                    "name": counter,
+                    "ph": "C",
+                    "ts": round(offset * 1_000_000.0, 1),
+                    "pid": pid,
+                    "tid": 0,
+                    "args": {counter: total},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, target_dir: Path) -> tuple[Path, Path]:
+        target_dir.mkdir(parents=True, exist_ok=True)
+        summary_path = target_dir / f"{self.run_id}.json"
+        chrome_path = target_dir / f"{self.run_id}.trace.json"
+        summary_path.write_text(json.dumps(self.to_dict(), indent=2))
+        chrome_path.write_text(json.dumps(self.to_chrome_trace()))
+        return summary_path, chrome_path
+
+    def _stack(self) -> list[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+
+_active_tracer: Tracer | None = None
+
+
+def current_tracer() -> Tracer | None:
+    return _active_tracer
+
+
+@contextmanager
+def start_trace(run_id: str, output_dir: Path | None = None) -> Iterator[Tracer]:
+    global _active_tracer
+    previous = _active_tracer
+    tracer = Tracer(run_id)
+    _active_tracer = tracer
+    try:
+        yield tracer
+    finally:
+        _active_tracer = previous
+        if output_dir is not None:
+            tracer.write(output_dir)
+
+
+@contextmanager
+def span(name: str, category: str = "stage", **args: Any) -> Iterator[Span | None]:
+    tracer = _active_tracer
+    if tracer is None:
+        yield None
+        return
+    with tracer.span(name, category, **args) as current:
+        yield current
+
+
+def incr(counter: str, value: float = 1) -> None:
+    tracer = _active_tracer
+    if tracer is not None:
+        tracer.incr(counter, value)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark DOCXSchemaValidator on a large synthetic document.
+
+Builds a .docx with the requested number of pages, unpacks it, and times a full
+validation with the shared parse cache against one that re-parses every file
+for every check (the previous behavior). With --jobs N it also times the shared
+cache with XSD validation spread over N worker processes.
+
+Usage:
+    python bench_validate.py [--pages 500] [--rounds 3] [--jobs 4]
+"""
+
+import argparse
+import contextlib
+import io
+import statistics
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+import lxml.etree
+
+from validation import DOCXSchemaValidator, ParsedTreeCache
+
+PARAGRAPHS_PER_PAGE = 30
+
+CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+</Types>"""
+
+ROOT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>"""
+
+DOCUMENT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships"></Relationships>"""
+
+PARAGRAPH = (
+    '<w:p><w:pPr><w:pStyle w:val="Normal"/></w:pPr>'
+    '<w:bookmarkStart w:id="{index}" w:name="p{index}"/>'
+    "<w:r><w:t>Paragraph {index} of the benchmark document with enough text to wrap across a line.</w:t></w:r>"
+    '<w:bookmarkEnd w:id="{index}"/></w:p>'
+)
+PAGE_BREAK = '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+
+
+class UncachedTrees(ParsedTreeCache):
+    """Tree source that parses the file on every call, like the validator used to."""
+
+    def get(self, path):
+        self.parses += 1
+        return lxml.etree.parse(str(path))
+
+
+def build_docx(path, pages):
+    """Write a synthetic .docx with the given number of pages to path."""
+    body = []
+    for page in range(pages):
+        for line in range(PARAGRAPHS_PER_PAGE):
+            body.append(PARAGRAPH.format(index=page * PARAGRAPHS_PER_PAGE + line))
+        body.append(PAGE_BREAK)
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{''.join(body)}</w:body></w:document>"
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", CONTENT_TYPES)
+        zf.writestr("_rels/.rels", ROOT_RELS)
+        zf.writestr("word/_rels/document.xml.rels", DOCUMENT_RELS)
+        zf.writestr("word/document.xml", document)
+
+
+def time_validation(unpacked_dir, original, make_cache, rounds, jobs=1):
+    """Return (median seconds, parses per validation) over the given rounds."""
+    samples = []
+    parses = 0
+    for _ in range(rounds):
+        cache = make_cache()
+        validator = DOCXSchemaValidator(
+            unpacked_dir, original, tree_cache=cache, jobs=jobs
+        )
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            validator.validate()
+        samples.append(time.perf_counter() - started)
+        parses = cache.parses
+    return statistics.median(samples), parses
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DOCX validation")
+    parser.add_argument("--pages", type=int, default=500, help="Pages in the synthetic document")
+    parser.add_argument("--rounds", type=int, default=3, help="Validations to time per mode")
+    parser.add_argument("--jobs", type=int, default=1, help="Also time XSD validation in N workers")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        original = Path(temp_dir) / "bench.docx"
+        unpacked_dir = Path(temp_dir) / "unpacked"
+        build_docx(original, args.pages)
+        with zipfile.ZipFile(original) as zf:
+            zf.extractall(unpacked_dir)
+        size_mb = (unpacked_dir / "word" / "document.xml").stat().st_size / 1e6
+        print(f"{args.pages} pages, document.xml {size_mb:.1f} MB")
+
+        modes = [
+            ("re-parse per check", UncachedTrees, 1),
+            ("shared parse cache", ParsedTreeCache, 1),
+        ]
+        if args.jobs > 1:
+            modes.append((f"{args.jobs} XSD workers", ParsedTreeCache, args.jobs))
+        for name, make_cache, jobs in modes:
+            seconds, parses = time_validation(
+                unpacked_dir, original, make_cache, args.rounds, jobs
+            )
+            print(f"{name:<20} {seconds * 1000:>10.1f} ms  {parses:>4} parses")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,30 +2,90 @@
 """
 Tool to pack a directory into a .docx, .pptx, or .xlsx file with XML formatting undone.
 
+Parts are streamed from the input directory straight into the archive: XML is
+condensed in memory by a streaming serializer, already-compressed media is
+stored rather than deflated, and members that are unchanged from an optional
+original archive are copied over as their compressed bytes. XML parts can be
+condensed in a process pool, and parts that still match the manifest written by
+unpack.py are copied from the unpacked source file without being condensed.
+
 Example usage:
-    python pack.py <input_directory> <office_file> [--force]
+    python pack.py <input_directory> <office_file> [--force] [--original <office_file>] [--jobs N]
 """
 
 import argparse
-import shutil
+import hashlib
+import io
+import json
+import re
+import struct
 import subprocess
 import sys
 import tempfile
-import defusedxml.minidom
+import xml.sax.handler
 import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import defusedxml.sax
+
+# pack.py runs both as a script and as ooxml.scripts.pack (from Document)
+if __package__:
+    from .soffice import UNO_AVAILABLE, SofficeError, SofficeNotFoundError, get_soffice_client
+else:
+    from soffice import UNO_AVAILABLE, SofficeError, SofficeNotFoundError, get_soffice_client
+
+# Media formats that are already compressed; deflating them again costs time
+# and saves almost nothing, so they are written with ZIP_STORED
+STORED_EXTENSIONS = {
+    ".gif",
+    ".jpeg",
+    ".jpg",
+    ".jxr",
+    ".m4a",
+    ".mov",
+    ".mp3",
+    ".mp4",
+    ".png",
+    ".wdp",
+    ".webp",
+    ".wma",
+    ".wmv",
+    ".zip",
+}
+
+# Written by unpack.py at the root of the unpacked directory; never packed
+MANIFEST_NAME = ".unpack-manifest.json"
+
 
 def main():
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
     parser.add_argument("input_directory", help="Unpacked Office document directory")
     parser.add_argument("output_file", help="Output Office file (.docx/.pptx/.xlsx)")
     parser.add_argument("--force", action="store_true", help="Skip validation")
+    parser.add_argument(
+        "--original",
+        help="Original Office file; unchanged members are copied without recompression",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Condense XML parts in N worker processes (default: 1)",
+    )
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     try:
         success = pack_document(
-            args.input_directory, args.output_file, validate=not args.force
+            args.input_directory,
+            args.output_file,
+            validate=not args.force,
+            original_file=args.original,
+            jobs=args.jobs,
         )
 
         # Show warning if validation was skipped
@@ -42,13 +102,18 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(input_dir, output_file, validate=False, original_file=None, jobs=1):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        original_file: Optional original Office file. Members whose packed bytes
+            match the original's (same CRC-32 and size) are copied over as their
+            already-compressed bytes instead of being compressed again. Defaults
+            to the source recorded in the unpack manifest, if it is unchanged.
+        jobs: Worker processes used to condense XML parts (default: 1)
 
     Returns:
         bool: True if successful, False if validation failed
@@ -61,57 +126,262 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
+    # [Content_Types].xml first, then every other part in a stable order
+    files = sorted(
+        (
+            f
+            for f in input_dir.rglob("*")
+            if f.is_file() and f != input_dir / MANIFEST_NAME
+        ),
+        key=lambda f: (f.name != "[Content_Types].xml", f.relative_to(input_dir).as_posix()),
+    )
 
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
+    original_file, part_digests = _manifest_baseline(input_dir, original_file)
+    original = _open_original(original_file, output_file) if original_file else None
+    try:
+        # XML parts that still match the manifest are copied from the original
+        # as-is; only the others are condensed
+        unchanged = set()
+        to_condense = []
+        for f in files:
+            if not f.name.endswith((".xml", ".rels")):
+                continue
+            arcname = f.relative_to(input_dir).as_posix()
+            digest = part_digests.get(arcname)
+            if digest and _has_member(original, arcname) and part_digest(f.read_bytes()) == digest:
+                unchanged.add(arcname)
+            else:
+                to_condense.append(f)
+        condensed = dict(zip(to_condense, _condense_parts(to_condense, jobs)))
 
-        # Create final Office file as zip archive
+        # Create final Office file as zip archive, streaming parts from input_dir
         output_file.parent.mkdir(parents=True, exist_ok=True)
         with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+            for f in files:
+                arcname = f.relative_to(input_dir).as_posix()
+                if arcname in unchanged:
+                    info = original.getinfo(arcname)
+                    _write_raw_member(zf, info, _read_raw_member(original, info))
+                else:
+                    _write_member(zf, f, arcname, condensed.get(f), original)
+    finally:
+        if original is not None:
+            original.close()
+
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file):
+            output_file.unlink()  # Delete the corrupt file
+            return False
+
+    return True
+
+
+def part_digest(data):
+    """Return the digest recorded for a part in the unpack manifest."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _manifest_baseline(input_dir, original_file):
+    """Return (original_file, part_digests) for packing input_dir.
+
+    The manifest's digests are only trusted when its source file still has the
+    size and modification time recorded at unpack time, and is the original
+    being packed against (or no original was given).
+    """
+    try:
+        manifest = json.loads((input_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+        source = Path(manifest["source"])
+        stat = source.stat()
+    except (OSError, ValueError, KeyError):
+        return original_file, {}
+
+    if [stat.st_size, stat.st_mtime_ns] != [manifest.get("size"), manifest.get("mtime_ns")]:
+        return original_file, {}
+    if original_file is None:
+        return source, manifest.get("parts", {})
+    if Path(original_file).resolve() == source.resolve():
+        return original_file, manifest.get("parts", {})
+    return original_file, {}
+
 
+def _open_original(original_file, output_file):
+    """Open the original archive, reading it into memory if it is also the output."""
+    if Path(original_file).resolve() == output_file.resolve():
+        return zipfile.ZipFile(io.BytesIO(Path(original_file).read_bytes()))
+    return zipfile.ZipFile(original_file)
+
+
+def _has_member(archive, arcname):
+    """Return True if archive is open and contains arcname."""
+    if archive is None:
+        return False
+    try:
+        archive.getinfo(arcname)
+    except KeyError:
+        return False
     return True
 
 
+def _condense_parts(xml_files, jobs):
+    """Return condense_xml_bytes output for each file, in order.
+
+    With jobs > 1 the parts are condensed in a process pool; each worker reads
+    its part from disk, so only the condensed bytes cross process boundaries.
+    """
+    if jobs <= 1 or len(xml_files) < 2:
+        return [_condense_part(xml_file) for xml_file in xml_files]
+
+    workers = min(jobs, len(xml_files))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                _condense_part,
+                xml_files,
+                chunksize=max(1, len(xml_files) // (workers * 4)),
+            )
+        )
+
+
+def _condense_part(xml_file):
+    """Condense one part read from disk. Runs in worker processes."""
+    return condense_xml_bytes(Path(xml_file).read_bytes())
+
+
+def _write_member(zf, path, arcname, data, original):
+    """Write one part to the archive, reusing the original's bytes when unchanged.
+
+    data is the condensed content of an XML part, or None for binary parts.
+    """
+    compress_type = (
+        zipfile.ZIP_STORED
+        if path.suffix.lower() in STORED_EXTENSIONS
+        else zipfile.ZIP_DEFLATED
+    )
+
+    if original is not None and _copy_unchanged_member(zf, path, arcname, data, original):
+        return
+
+    if data is not None:
+        zf.writestr(arcname, data, compress_type=compress_type)
+    else:
+        # Binary parts are streamed from disk in chunks by ZipFile.write
+        zf.write(path, arcname, compress_type=compress_type)
+
+
+def _copy_unchanged_member(zf, path, arcname, data, original):
+    """Copy arcname's compressed bytes from original if its content is unchanged.
+
+    Returns:
+        bool: True if the member was copied, False if it must be written normally
+    """
+    try:
+        info = original.getinfo(arcname)
+    except KeyError:
+        return False
+    # Encrypted members and unusual compression methods are always rewritten
+    if info.flag_bits & 0x1 or info.compress_type not in (
+        zipfile.ZIP_STORED,
+        zipfile.ZIP_DEFLATED,
+    ):
+        return False
+
+    if data is not None:
+        size, crc = len(data), zlib.crc32(data)
+    else:
+        size = path.stat().st_size
+        if size != info.file_size:
+            return False
+        crc = 0
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                crc = zlib.crc32(chunk, crc)
+    if size != info.file_size or crc != info.CRC:
+        return False
+
+    _write_raw_member(zf, info, _read_raw_member(original, info))
+    return True
+
+
+def _read_raw_member(archive, info):
+    """Return the still-compressed bytes of a member of an open ZipFile."""
+    archive.fp.seek(info.header_offset)
+    header = archive.fp.read(zipfile.sizeFileHeader)
+    # The local header's name and extra field lengths can differ from the
+    # central directory's, so they are read from the local header itself
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    archive.fp.seek(name_length + extra_length, io.SEEK_CUR)
+    return archive.fp.read(info.compress_size)
+
+
+def _write_raw_member(zf, source_info, raw):
+    """Append an already-compressed member to a ZipFile opened for writing.
+
+    zipfile has no public API for this, so the local header is written with
+    ZipInfo.FileHeader and the entry is registered the same way ZipFile.writestr
+    does internally.
+    """
+    info = zipfile.ZipInfo(source_info.filename, source_info.date_time)
+    info.compress_type = source_info.compress_type
+    info.external_attr = source_info.external_attr
+    info.create_system = source_info.create_system
+    info.CRC = source_info.CRC
+    info.file_size = source_info.file_size
+    info.compress_size = len(raw)
+    # Sizes and CRC go in the local header, so no data descriptor follows
+    info.flag_bits = source_info.flag_bits & ~0x08
+    with zf._lock:
+        zf._writecheck(info)
+        zf._didModify = True
+        info.header_offset = zf.fp.tell()
+        zf.fp.write(info.FileHeader(zip64=info.file_size > zipfile.ZIP64_LIMIT))
+        zf.fp.write(raw)
+        zf.filelist.append(info)
+        zf.NameToInfo[info.filename] = info
+        zf.start_dir = zf.fp.tell()
+
+
 def validate_document(doc_path):
-    """Validate document by converting to HTML with soffice."""
+    """Validate document by converting to HTML with soffice.
+
+    The conversion goes through the persistent LibreOffice listener when the
+    uno bindings are available, and through a one-off soffice process otherwise.
+    """
     # Determine the correct filter based on file extension
     match doc_path.suffix.lower():
         case ".docx":
-            filter_name = "html:HTML"
+            filter_name = "HTML"
         case ".pptx":
-            filter_name = "html:impress_html_Export"
+            filter_name = "impress_html_Export"
         case ".xlsx":
-            filter_name = "html:HTML (StarCalc)"
+            filter_name = "HTML (StarCalc)"
 
     with tempfile.TemporaryDirectory() as temp_dir:
+        if UNO_AVAILABLE:
+            try:
+                get_soffice_client().convert(doc_path, temp_dir, filter_name, "html")
+                return True
+            except SofficeNotFoundError:
+                print("Warning: soffice not found. Skipping validation.", file=sys.stderr)
+                return True
+            except SofficeError as e:
+                print(f"Validation error: {e}", file=sys.stderr)
+                return False
+
         try:
             result = subprocess.run(
                 [
                     "soffice",
                     "--headless",
                     "--convert-to",
-                    filter_name,
+                    f"html:{filter_name}",
                     "--outdir",
                     temp_dir,
                     str(doc_path),
                 ],
                 capture_output=True,
-                timeout=10,
+                # A cold soffice start alone can take longer than 10 seconds
+                timeout=60,
                 text=True,
             )
             if not (Path(temp_dir) / f"{doc_path.stem}.html").exists():
@@ -131,28 +401,106 @@ def validate_document(doc_path):
 
 
 def condense_xml(xml_file):
-    """Strip unnecessary whitespace and remove comments."""
-    with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
-
-    # Process each element to remove whitespace and comments
-    for element in dom.getElementsByTagName("*"):
-        # Skip w:t elements and their processing
-        if element.tagName.endswith(":t"):
-            continue
-
-        # Remove whitespace-only text nodes and comment nodes
-        for child in list(element.childNodes):
-            if (
-                child.nodeType == child.TEXT_NODE
-                and child.nodeValue
-                and child.nodeValue.strip() == ""
-            ) or child.nodeType == child.COMMENT_NODE:
-                element.removeChild(child)
-
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+    """Strip unnecessary whitespace and remove comments, rewriting xml_file."""
+    xml_file = Path(xml_file)
+    xml_file.write_bytes(condense_xml_bytes(xml_file.read_bytes()))
+
+
+def condense_xml_bytes(content):
+    """Return content with pretty-printing whitespace and comments removed.
+
+    Whitespace-only text is dropped everywhere except inside *:t elements, where
+    it is document text. The input is parsed with a SAX parser and written out
+    as it is read, so no DOM is built.
+
+    Args:
+        content: XML document as bytes
+
+    Returns:
+        bytes: Condensed UTF-8 encoded XML
+    """
+    out = io.StringIO()
+    handler = _CondensingHandler(out)
+    parser = defusedxml.sax.make_parser()
+    parser.setContentHandler(handler)
+    parser.setFeature(xml.sax.handler.feature_namespaces, False)
+    parser.parse(io.BytesIO(content))
+
+    standalone = re.match(rb"<\?xml[^>]*?standalone=[\"'](yes|no)[\"']", content)
+    declaration = '<?xml version="1.0" encoding="UTF-8"'
+    if standalone:
+        declaration += f' standalone="{standalone.group(1).decode()}"'
+    return (declaration + "?>" + out.getvalue()).encode("utf-8")
+
+
+class _CondensingHandler(xml.sax.handler.ContentHandler):
+    """SAX handler that writes condensed XML to a text stream as it parses.
+
+    Prefixed names and xmlns declarations are passed through untouched (the
+    parser runs without namespace processing). Start tags are held open until
+    the first child, so empty elements are written as <tag/>.
+    """
+
+    def __init__(self, out):
+        super().__init__()
+        self.out = out
+        self.stack = []
+        self.text = []
+        self.tag_open = False
+
+    def startElement(self, name, attrs):
+        self._flush_text()
+        self._close_start_tag()
+        self.out.write(f"<{name}")
+        for attr_name, value in attrs.items():
+            self.out.write(f' {attr_name}="{_escape(value, _ATTRIBUTE_ESCAPES)}"')
+        self.tag_open = True
+        self.stack.append(name)
+
+    def endElement(self, name):
+        self._flush_text()
+        self.stack.pop()
+        if self.tag_open:
+            self.out.write("/>")
+            self.tag_open = False
+        else:
+            self.out.write(f"</{name}>")
+
+    def characters(self, content):
+        self.text.append(content)
+
+    def processingInstruction(self, target, data):
+        self._flush_text()
+        self._close_start_tag()
+        self.out.write(f"<?{target} {data}?>" if data else f"<?{target}?>")
+
+    def _flush_text(self):
+        if not self.text:
+            return
+        text = "".join(self.text)
+        self.text = []
+        # Whitespace inside w:t (and a:t, etc.) is content; elsewhere it is formatting
+        if text.strip() or (self.stack and self.stack[-1].endswith(":t")):
+            self._close_start_tag()
+            self.out.write(_escape(text, _TEXT_ESCAPES))
+
+    def _close_start_tag(self):
+        if self.tag_open:
+            self.out.write(">")
+            self.tag_open = False
+
+
+# Characters escaped on output; \r (and \n, \t in attributes) are written as
+# character references so parsers do not normalize them away on the next read
+_TEXT_ESCAPES = {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "\r": "&#13;"}
+_ATTRIBUTE_ESCAPES = {**_TEXT_ESCAPES, "\n": "&#10;", "\t": "&#9;"}
+
+
+def _escape(value, escapes):
+    for char, replacement in escapes.items():
+        if char in value:
+            value = value.replace(char, replacement)
+    return value
 
 
 if __name__ == "__main__":
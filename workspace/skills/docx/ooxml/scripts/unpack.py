@@ -1,29 +1,118 @@
 #!/usr/bin/env python3
-"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
+"""
+Unpack and format XML contents of Office files (.docx, .pptx, .xlsx).
 
+XML parts are pretty-printed, optionally in a process pool, and a manifest of
+their digests is written to the output directory so pack.py can copy parts that
+were not edited straight from the original file.
+
+Example usage:
+    python unpack.py <office_file> <output_directory> [--jobs N]
+"""
+
+import argparse
+import json
 import random
 import sys
-import defusedxml.minidom
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-# Get command line arguments
-assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
-input_file, output_dir = sys.argv[1], sys.argv[2]
+import defusedxml.minidom
+
+from pack import MANIFEST_NAME, part_digest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Unpack an Office file and format its XML")
+    parser.add_argument("input_file", help="Office file to unpack (.docx/.pptx/.xlsx)")
+    parser.add_argument("output_directory", help="Directory to unpack into")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Pretty-print XML parts in N worker processes (default: 1)",
+    )
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    try:
+        unpack_document(args.input_file, args.output_directory, jobs=args.jobs)
+    except (ValueError, zipfile.BadZipFile) as e:
+        sys.exit(f"Error: {e}")
+
+    # For .docx files, suggest an RSID for tracked changes
+    if args.input_file.endswith(".docx"):
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+
+def unpack_document(input_file, output_dir, jobs=1):
+    """Extract an Office file and pretty-print its XML parts.
 
-# Extract and format
-output_path = Path(output_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
+    Args:
+        input_file: Path to the .docx/.pptx/.xlsx file
+        output_dir: Directory to extract into (created if missing)
+        jobs: Worker processes used to pretty-print XML parts (default: 1)
 
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
+    Returns:
+        dict: The manifest written to output_dir, mapping each XML part's
+        relative path to the digest of its pretty-printed content
+    """
+    input_file = Path(input_file)
+    output_path = Path(output_dir)
+
+    if not input_file.is_file():
+        raise ValueError(f"{input_file} is not a file")
+
+    # Extract and format
+    output_path.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(input_file) as zf:
+        zf.extractall(output_path)
+
+    xml_files = sorted(list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels")))
+    digests = _pretty_print_parts(xml_files, jobs)
+
+    stat = input_file.stat()
+    manifest = {
+        "source": str(input_file.resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "parts": {
+            xml_file.relative_to(output_path).as_posix(): digest
+            for xml_file, digest in zip(xml_files, digests)
+        },
+    }
+    (output_path / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
+
+
+def _pretty_print_parts(xml_files, jobs):
+    """Pretty-print each file in place and return their digests, in order."""
+    if jobs <= 1 or len(xml_files) < 2:
+        return [_pretty_print_part(xml_file) for xml_file in xml_files]
+
+    workers = min(jobs, len(xml_files))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                _pretty_print_part,
+                xml_files,
+                chunksize=max(1, len(xml_files) // (workers * 4)),
+            )
+        )
+
+
+def _pretty_print_part(xml_file):
+    """Pretty-print one part in place. Runs in worker processes."""
     content = xml_file.read_text(encoding="utf-8")
     dom = defusedxml.minidom.parseString(content)
-    xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
+    formatted = dom.toprettyxml(indent="  ", encoding="ascii")
+    xml_file.write_bytes(formatted)
+    return part_digest(formatted)
+
 
-# For .docx files, suggest an RSID for tracked changes
-if input_file.endswith(".docx"):
-    suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
-    print(f"Suggested RSID for edit session: {suggested_rsid}")
+if __name__ == "__main__":
+    main()
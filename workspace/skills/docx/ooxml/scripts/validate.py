@@ -3,14 +3,14 @@
 Command line tool to validate Office document XML files against XSD schemas and tracked changes.
 
 Usage:
-    python validate.py <dir> --original <original_file>
+    python validate.py <dir> --original <original_file> [--jobs N]
 """
 
 import argparse
 import sys
 from pathlib import Path
 
-from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation import ValidationService
 
 
 def main():
@@ -30,7 +30,16 @@ def main():
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Validate parts against XSD schemas in N worker processes (default: 1)",
+    )
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     # Validate paths
     unpacked_dir = Path(args.unpacked_dir)
@@ -43,21 +52,14 @@ def main():
     )
 
     # Run validations
-    match file_extension:
-        case ".docx":
-            validators = [DOCXSchemaValidator, RedliningValidator]
-        case ".pptx":
-            validators = [PPTXSchemaValidator]
-        case _:
-            print(f"Error: Validation not supported for file type {file_extension}")
-            sys.exit(1)
-
-    # Run validators
-    success = True
-    for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
-        if not validator.validate():
-            success = False
+    try:
+        failed = ValidationService(verbose=args.verbose, jobs=args.jobs).validate(
+            unpacked_dir, original_file, stop_on_failure=False
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    success = failed is None
 
     if success:
         print("All validations PASSED!")
@@ -3,13 +3,25 @@ Validation modules for Word document processing.
 """
 
 from .base import BaseSchemaValidator
+from .baseline import OriginalBaseline, clear_baselines, get_baseline
 from .docx import DOCXSchemaValidator
 from .pptx import PPTXSchemaValidator
 from .redlining import RedliningValidator
+from .schema_cache import clear_schema_cache, load_schema
+from .service import ValidationService, get_validation_service
+from .tree_cache import ParsedTreeCache
 
 __all__ = [
     "BaseSchemaValidator",
     "DOCXSchemaValidator",
+    "OriginalBaseline",
+    "ParsedTreeCache",
     "PPTXSchemaValidator",
     "RedliningValidator",
+    "ValidationService",
+    "clear_baselines",
+    "clear_schema_cache",
+    "get_baseline",
+    "get_validation_service",
+    "load_schema",
 ]
@@ -2,11 +2,17 @@
 Base validator with common validation logic for document files.
 """
 
+import copy
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import lxml.etree
 
+from .baseline import get_baseline
+from .schema_cache import load_schema
+from .tree_cache import ParsedTreeCache
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -103,10 +109,26 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
+    def __init__(
+        self,
+        unpacked_dir,
+        original_file,
+        verbose=False,
+        tree_cache=None,
+        baseline=None,
+        jobs=1,
+        parts=None,
+    ):
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file)
         self.verbose = verbose
+        # Worker processes used for XSD validation (1 validates in this process)
+        self.jobs = jobs
+        self._baseline = baseline
+
+        # Every check reads parsed trees from this cache, so each file is parsed
+        # once per validation instead of once per check
+        self.trees = tree_cache if tree_cache is not None else ParsedTreeCache()
 
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
@@ -120,6 +142,28 @@ class BaseSchemaValidator:
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+        # Per-part checks (well-formedness, namespaces, XSD, ...) only look at
+        # files_to_check. With parts=None that is every file; an incremental run
+        # passes the relative paths changed since the last passing validation.
+        # Cross-part checks (unique IDs, relationships, content types) always
+        # look at every file, because a change in one part can break another.
+        if parts is None:
+            self.files_to_check = self.xml_files
+        else:
+            changed = {Path(part).as_posix() for part in parts}
+            self.files_to_check = [
+                f
+                for f in self.xml_files
+                if f.relative_to(self.unpacked_dir).as_posix() in changed
+            ]
+
+    @property
+    def baseline(self):
+        """Shared in-memory view of the original file (see baseline.get_baseline)."""
+        if self._baseline is None:
+            self._baseline = get_baseline(self.original_file)
+        return self._baseline
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
@@ -128,10 +172,10 @@ class BaseSchemaValidator:
         """Validate that all XML files are well-formed."""
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self.files_to_check:
             try:
                 # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
+                self.trees.get(xml_file)
             except lxml.etree.XMLSyntaxError as e:
                 errors.append(
                     f"  {xml_file.relative_to(self.unpacked_dir)}: "
@@ -157,9 +201,9 @@ class BaseSchemaValidator:
         """Validate that namespace prefixes in Ignorable attributes are declared."""
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self.files_to_check:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self.trees.getroot(xml_file)
                 declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
 
                 for attr_val in [
@@ -190,10 +234,10 @@ class BaseSchemaValidator:
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self.trees.copy(xml_file).getroot()
                 file_ids = {}  # Track IDs that must be unique within this file
 
-                # Remove all mc:AlternateContent elements from the tree
+                # Remove all mc:AlternateContent elements from a private copy of the tree
                 mc_elements = root.xpath(
                     ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
                 )
@@ -310,7 +354,7 @@ class BaseSchemaValidator:
         for rels_file in rels_files:
             try:
                 # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self.trees.getroot(rels_file)
 
                 # Get the directory where this .rels file is located
                 rels_dir = rels_file.parent
@@ -411,7 +455,7 @@ class BaseSchemaValidator:
 
             try:
                 # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self.trees.getroot(rels_file)
                 rid_to_type = {}
 
                 for rel in rels_root.findall(
@@ -434,7 +478,7 @@ class BaseSchemaValidator:
                         rid_to_type[rid] = type_name
 
                 # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
+                xml_root = self.trees.getroot(xml_file)
 
                 # Find all elements with r:id attributes
                 for elem in xml_root.iter():
@@ -531,7 +575,7 @@ class BaseSchemaValidator:
 
         try:
             # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
+            root = self.trees.getroot(content_types_file)
             declared_parts = set()
             declared_extensions = set()
 
@@ -593,7 +637,7 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
+                    root_tag = self.trees.getroot(xml_file).tag
                     root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
 
                     if root_name in declarable_roots and path_str not in declared_parts:
@@ -673,7 +717,7 @@ class BaseSchemaValidator:
             if verbose:
                 relative_path = xml_file.relative_to(unpacked_dir)
                 print(f"FAILED - {relative_path}: {len(new_errors)} new error(s)")
-                for error in list(new_errors)[:3]:
+                for error in sorted(new_errors)[:3]:
                     truncated = error[:250] + "..." if len(error) > 250 else error
                     print(f"  - {truncated}")
             return False, new_errors
@@ -692,11 +736,10 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
-        for xml_file in self.xml_files:
+        for xml_file, (is_valid, new_file_errors) in zip(
+            self.files_to_check, self._validate_parts_against_xsd()
+        ):
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
 
             if is_valid is None:
                 skipped_count += 1
@@ -712,14 +755,14 @@ class BaseSchemaValidator:
 
             # Has new errors
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  # Show first 3 errors
+            for error in sorted(new_file_errors)[:3]:  # Show first 3 errors
                 new_errors.append(
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
 
         # Print summary
         if self.verbose:
-            print(f"Validated {len(self.xml_files)} files:")
+            print(f"Validated {len(self.files_to_check)} files:")
             print(f"  - Valid: {valid_count}")
             print(f"  - Skipped (no schema): {skipped_count}")
             if original_error_count:
@@ -738,6 +781,35 @@ class BaseSchemaValidator:
                 print("\nPASSED - No new XSD validation errors introduced")
             return True
 
+    def _validate_parts_against_xsd(self):
+        """Return validate_file_against_xsd results for files_to_check, in order.
+
+        With jobs > 1 the parts are spread over a process pool. Each worker builds
+        its own validator, so parse trees, the original baseline and compiled
+        schemas are cached per worker process.
+        """
+        if self.jobs <= 1 or len(self.files_to_check) < 2:
+            return [
+                self.validate_file_against_xsd(xml_file, verbose=False)
+                for xml_file in self.files_to_check
+            ]
+
+        workers = min(self.jobs, len(self.files_to_check))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_xsd_worker,
+            initargs=(type(self), self.unpacked_dir, self.original_file),
+        ) as executor:
+            # executor.map yields results in submission order, so the merged
+            # report is identical to a serial run
+            return list(
+                executor.map(
+                    _validate_part_in_worker,
+                    self.files_to_check,
+                    chunksize=max(1, len(self.files_to_check) // (workers * 4)),
+                )
+            )
+
     def _get_schema_path(self, xml_file):
         """Determine the appropriate schema path for an XML file."""
         # Check exact filename match
@@ -765,8 +837,7 @@ class BaseSchemaValidator:
     def _clean_ignorable_namespaces(self, xml_doc):
         """Remove attributes and elements not in allowed namespaces."""
         # Create a clean copy
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
+        xml_copy = copy.deepcopy(xml_doc.getroot())
 
         # Remove attributes not in allowed namespaces
         for elem in xml_copy.iter():
@@ -825,28 +896,33 @@ class BaseSchemaValidator:
 
     def _validate_single_file_xsd(self, xml_file, base_path):
         """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
-        schema_path = self._get_schema_path(xml_file)
+        return self._validate_xsd(
+            xml_file.relative_to(base_path), lambda: self.trees.get(xml_file)
+        )
+
+    def _validate_xsd(self, relative_path, load_tree):
+        """Validate one part against its XSD schema. Returns (is_valid, errors_set).
+
+        Args:
+            relative_path: Path of the part relative to the package root, used to
+                pick the schema and decide whether to clean ignorable namespaces
+            load_tree: Callable returning the part's parsed lxml ElementTree
+        """
+        schema_path = self._get_schema_path(relative_path)
         if not schema_path:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            # Load schema (compiled once per process, see schema_cache)
+            schema = load_schema(schema_path)
 
-            # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+            # Load and preprocess XML (template tag removal works on a copy)
+            xml_doc = load_tree()
 
             xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
             xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
 
             # Clean ignorable namespaces if needed
-            relative_path = xml_file.relative_to(base_path)
             if (
                 relative_path.parts
                 and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
@@ -869,39 +945,29 @@ class BaseSchemaValidator:
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
+        The member is read from the original archive in memory and the result is
+        memoized on the shared baseline, so each original part is validated once.
+
         Args:
             xml_file: Path to the XML file in unpacked_dir to check
 
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
-        relative_path = xml_file.relative_to(unpacked_dir)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
-
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
+        relative_path = xml_file.relative_to(self.unpacked_dir.resolve())
 
-            if not original_xml_file.exists():
+        def compute():
+            if not self.baseline.has(relative_path):
                 # File didn't exist in original, so no original errors
-                return set()
-
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
+                return frozenset()
+            _, errors = self._validate_xsd(
+                relative_path, lambda: self.baseline.parse(relative_path)
             )
-            return errors if errors else set()
+            return frozenset(errors or ())
+
+        return self.baseline.memo(("xsd_errors", relative_path.as_posix()), compute)
 
     def _remove_template_tags_from_text_nodes(self, xml_doc):
         """Remove template tags from XML text nodes and collect warnings.
@@ -916,9 +982,9 @@ class BaseSchemaValidator:
         warnings = []
         template_pattern = re.compile(r"\{\{[^}]*\}\}")
 
-        # Create a copy of the document to avoid modifying the original
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
+        # Create a copy of the document to avoid modifying the original (which may
+        # be a shared tree from the parse cache)
+        xml_copy = copy.deepcopy(xml_doc.getroot())
 
         def process_text_content(text, content_type):
             if not text:
@@ -947,5 +1013,20 @@ class BaseSchemaValidator:
         return lxml.etree.ElementTree(xml_copy), warnings
 
 
+# Validator owned by an XSD worker process (see _validate_parts_against_xsd)
+_WORKER_VALIDATOR = None
+
+
+def _init_xsd_worker(validator_class, unpacked_dir, original_file):
+    """Create the validator that this worker process reuses for every part."""
+    global _WORKER_VALIDATOR
+    _WORKER_VALIDATOR = validator_class(unpacked_dir, original_file)
+
+
+def _validate_part_in_worker(xml_file):
+    """Validate one part in a worker process. Returns (is_valid, new_errors_set)."""
+    return _WORKER_VALIDATOR.validate_file_against_xsd(xml_file, verbose=False)
+
+
 if __name__ == "__main__":
     raise RuntimeError("This module should not be run directly.")
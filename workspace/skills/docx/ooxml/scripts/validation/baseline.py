@@ -0,0 +1,131 @@
+"""
+Read-only view of the original document that validators compare against.
+"""
+
+import os
+import threading
+import zipfile
+from pathlib import Path, PurePosixPath
+
+import lxml.etree
+
+
+class OriginalBaseline:
+    """Read members of the original .docx/.pptx in memory, without extracting it.
+
+    The archive is opened once and members are read with ZipFile.open on demand.
+    Results derived from the original (XSD error sets, paragraph counts, text
+    used by the redlining check) are memoized per baseline, so validating a
+    document with many edited parts reads each original member at most once.
+
+    Example:
+        baseline = get_baseline("original.docx")
+        if baseline.has("word/document.xml"):
+            root = baseline.parse("word/document.xml").getroot()
+    """
+
+    def __init__(self, original_file):
+        self.original_file = Path(original_file)
+        self._zip = None
+        self._names = None
+        self._memo = {}
+        self._lock = threading.Lock()
+        self.reads = 0
+
+    @staticmethod
+    def member_name(relative_path):
+        """Return the zip member name for a path relative to the unpacked root."""
+        return str(PurePosixPath(*Path(relative_path).parts))
+
+    def _archive(self):
+        if self._zip is None:
+            self._zip = zipfile.ZipFile(self.original_file, "r")
+            self._names = set(self._zip.namelist())
+        return self._zip
+
+    def has(self, relative_path):
+        """Return True if the original contains the given member."""
+        with self._lock:
+            self._archive()
+            return self.member_name(relative_path) in self._names
+
+    def read(self, relative_path):
+        """Return the raw bytes of a member, or None if the original lacks it."""
+        name = self.member_name(relative_path)
+        with self._lock:
+            archive = self._archive()
+            if name not in self._names:
+                return None
+            self.reads += 1
+            with archive.open(name) as member:
+                return member.read()
+
+    def parse(self, relative_path):
+        """Parse a member into a new lxml ElementTree.
+
+        Raises:
+            KeyError: If the original does not contain the member
+            lxml.etree.XMLSyntaxError: If the member is not well-formed XML
+        """
+        data = self.read(relative_path)
+        if data is None:
+            raise KeyError(f"{self.member_name(relative_path)} not found in {self.original_file}")
+        return lxml.etree.ElementTree(lxml.etree.fromstring(data))
+
+    def memo(self, key, compute):
+        """Return the memoized result for key, calling compute() on first use.
+
+        Exceptions raised by compute are not memoized, so a later call retries.
+        """
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def close(self):
+        """Close the underlying archive; it is reopened on the next read."""
+        with self._lock:
+            if self._zip is not None:
+                self._zip.close()
+                self._zip = None
+                self._names = None
+
+
+# Baselines keyed by resolved path, each stored with the (mtime_ns, size) it was
+# opened at so a replaced original is never served from stale memoized results
+_BASELINES = {}
+_BASELINES_LOCK = threading.Lock()
+
+
+def get_baseline(original_file):
+    """Return the process-wide OriginalBaseline for original_file.
+
+    Args:
+        original_file: Path to the original .docx/.pptx file
+
+    Returns:
+        OriginalBaseline: Shared baseline, rebuilt if the file changed on disk
+    """
+    path = Path(original_file).resolve()
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _BASELINES_LOCK:
+        entry = _BASELINES.get(path)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        if entry is not None:
+            entry[1].close()
+        baseline = OriginalBaseline(path)
+        _BASELINES[path] = (signature, baseline)
+        return baseline
+
+
+def clear_baselines():
+    """Close and forget every shared baseline."""
+    with _BASELINES_LOCK:
+        for _, baseline in _BASELINES.values():
+            baseline.close()
+        _BASELINES.clear()
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,57 @@
+"""
+Process-wide cache of compiled XSD schemas.
+"""
+
+import threading
+from pathlib import Path
+
+import lxml.etree
+
+# Compiled schemas keyed by resolved schema path. Compiling the WordprocessingML
+# schema set (wml.xsd and everything it imports) is the most expensive step in
+# validation, so each schema is compiled at most once per process.
+_SCHEMAS = {}
+_LOCK = threading.Lock()
+
+
+def load_schema(schema_path):
+    """Return the compiled lxml XMLSchema for schema_path, compiling it on first use.
+
+    Args:
+        schema_path: Path to the XSD file
+
+    Returns:
+        lxml.etree.XMLSchema: Compiled schema shared by every caller in this process
+
+    Raises:
+        OSError, lxml.etree.XMLSchemaParseError: If the schema cannot be read or compiled.
+            Failures are not cached, so a later call retries.
+    """
+    key = Path(schema_path).resolve()
+    schema = _SCHEMAS.get(key)
+    if schema is not None:
+        return schema
+    with _LOCK:
+        schema = _SCHEMAS.get(key)
+        if schema is None:
+            with open(key, "rb") as xsd_file:
+                parser = lxml.etree.XMLParser()
+                xsd_doc = lxml.etree.parse(xsd_file, parser=parser, base_url=str(key))
+            schema = lxml.etree.XMLSchema(xsd_doc)
+            _SCHEMAS[key] = schema
+    return schema
+
+
+def cached_schema_paths():
+    """Return the paths of all schemas compiled so far in this process."""
+    return sorted(_SCHEMAS)
+
+
+def clear_schema_cache():
+    """Forget every compiled schema (e.g. after the schema files change)."""
+    with _LOCK:
+        _SCHEMAS.clear()
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
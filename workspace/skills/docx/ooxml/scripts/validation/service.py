@@ -0,0 +1,109 @@
+"""
+Long-lived validation service that keeps compiled XSD schemas warm.
+"""
+
+from pathlib import Path
+
+from .base import BaseSchemaValidator
+from .docx import DOCXSchemaValidator
+from .pptx import PPTXSchemaValidator
+from .redlining import RedliningValidator
+from .schema_cache import cached_schema_paths, load_schema
+
+# Validators to run for each document type, in order, with the label used when one fails
+VALIDATORS = {
+    ".docx": (("Schema", DOCXSchemaValidator), ("Redlining", RedliningValidator)),
+    ".pptx": (("Schema", PPTXSchemaValidator),),
+}
+
+
+class ValidationService:
+    """Validate many documents in one process without recompiling schemas.
+
+    Schemas live in the process-wide cache from schema_cache, so every validator
+    created in this process benefits. The service adds an up-front warm() step
+    and a single entry point that Document.save and scripts can call repeatedly.
+
+    Example:
+        service = get_validation_service()
+        service.warm()
+        failed = service.validate(unpacked_dir, "original.docx")
+        if failed:
+            raise ValueError(f"{failed} validation failed")
+    """
+
+    def __init__(self, verbose=False, jobs=1):
+        self.verbose = verbose
+        # Worker processes for per-part XSD validation (see BaseSchemaValidator)
+        self.jobs = jobs
+        self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
+
+    def warm(self):
+        """Compile every mapped schema that exists on disk.
+
+        Returns:
+            int: Number of schemas now compiled in this process
+        """
+        for relative_path in sorted(set(BaseSchemaValidator.SCHEMA_MAPPINGS.values())):
+            schema_path = self.schemas_dir / relative_path
+            if schema_path.exists():
+                load_schema(schema_path)
+        return len(cached_schema_paths())
+
+    def validate(
+        self,
+        unpacked_dir,
+        original_file,
+        stop_on_failure=True,
+        parts=None,
+        tree_cache=None,
+    ):
+        """Run the validators for the original file's type.
+
+        Args:
+            unpacked_dir: Path to the unpacked document directory
+            original_file: Path to the original .docx/.pptx used as baseline
+            stop_on_failure: Stop at the first failing validator (default: True)
+            parts: Relative paths changed since the last passing validation, to
+                validate incrementally; None validates every part (default: None)
+            tree_cache: ParsedTreeCache to reuse across calls, so unchanged files
+                are not parsed again (default: a fresh cache per validator)
+
+        Returns:
+            str or None: Label of the first failing validator ("Schema" or
+            "Redlining"), or None if every validator passed
+
+        Raises:
+            ValueError: If the file type is not supported
+        """
+        suffix = Path(original_file).suffix.lower()
+        if suffix not in VALIDATORS:
+            raise ValueError(f"Validation not supported for file type {suffix}")
+
+        first_failure = None
+        for label, validator_class in VALIDATORS[suffix]:
+            options = {"verbose": self.verbose, "parts": parts}
+            if issubclass(validator_class, BaseSchemaValidator):
+                options["jobs"] = self.jobs
+                options["tree_cache"] = tree_cache
+            validator = validator_class(unpacked_dir, original_file, **options)
+            if not validator.validate():
+                first_failure = first_failure or label
+                if stop_on_failure:
+                    break
+        return first_failure
+
+
+_SERVICE = None
+
+
+def get_validation_service():
+    """Return the process-wide ValidationService, creating it on first use."""
+    global _SERVICE
+    if _SERVICE is None:
+        _SERVICE = ValidationService()
+    return _SERVICE
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
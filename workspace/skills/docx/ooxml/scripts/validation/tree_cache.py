@@ -0,0 +1,77 @@
+"""
+Parsed XML tree cache shared by validation checks.
+"""
+
+import copy
+import os
+from pathlib import Path
+
+import lxml.etree
+
+
+class ParsedTreeCache:
+    """Parse each XML file once and hand the same tree to every check.
+
+    Entries are keyed by resolved path and invalidated when the file's mtime or
+    size changes, so edits made between validation runs are always picked up.
+    Parse failures are cached too and re-raised on every lookup, so checks see
+    the same XMLSyntaxError they would get from calling lxml.etree.parse.
+
+    Trees returned by get() are shared and must be treated as read-only.
+    Checks that need to modify a tree should call copy() instead.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self.parses = 0
+        self.hits = 0
+
+    def get(self, path):
+        """Return the parsed lxml ElementTree for path.
+
+        Args:
+            path: Path to the XML file
+
+        Returns:
+            lxml.etree._ElementTree: Shared, read-only parsed tree
+        """
+        path = Path(path).resolve()
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+        else:
+            self.parses += 1
+            try:
+                entry = (key, lxml.etree.parse(str(path)), None)
+            except lxml.etree.XMLSyntaxError as e:
+                entry = (key, None, e)
+            self._entries[path] = entry
+        _, tree, error = entry
+        if error is not None:
+            raise error
+        return tree
+
+    def getroot(self, path):
+        """Return the root element of the shared tree for path."""
+        return self.get(path).getroot()
+
+    def copy(self, path):
+        """Return a private copy of the tree for checks that mutate it.
+
+        Copying the cached tree is much cheaper than parsing the file again,
+        and source line numbers are preserved on the copied elements.
+        """
+        return copy.deepcopy(self.get(path))
+
+    def invalidate(self, path=None):
+        """Drop one cached entry, or every entry when path is None."""
+        if path is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(Path(path).resolve(), None)
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
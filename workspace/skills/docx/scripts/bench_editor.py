@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark the minidom and lxml XMLEditor engines on a large document.xml.
+
+Builds a synthetic document.xml with the requested number of paragraphs and
+times, for each engine, parsing the file, a batch of get_node lookups followed
+by edits, and saving.
+
+Usage:
+    python -m scripts.bench_editor [--paragraphs 20000] [--edits 200] [--rounds 3]
+"""
+
+import argparse
+import gc
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from .utilities import EDITOR_ENGINES, open_editor
+
+PARAGRAPH = (
+    '<w:p w:rsidR="00AB12CD"><w:pPr><w:pStyle w:val="Normal"/></w:pPr>'
+    '<w:r w:rsidR="00AB12CD"><w:t>Paragraph {index} of the benchmark document.</w:t></w:r>'
+    "</w:p>\n"
+)
+
+
+def build_document_xml(path, paragraphs):
+    """Write a synthetic document.xml with one paragraph per line to path."""
+    body = "".join(PARAGRAPH.format(index=index) for index in range(paragraphs))
+    path.write_text(
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>\n{body}</w:body></w:document>",
+        encoding="utf-8",
+    )
+
+
+def time_engine(path, engine, paragraphs, edits):
+    """Return (parse, edit, save) seconds for one pass of the given engine."""
+    started = time.perf_counter()
+    editor = open_editor(path, engine=engine)
+    parsed = time.perf_counter()
+
+    step = max(1, paragraphs // edits)
+    for index in range(0, step * edits, step):
+        # Paragraph N sits on line N + 3 of the generated file
+        para = editor.get_node(tag="w:p", line_number=index + 3)
+        run = editor.get_node(tag="w:r", contains=f"Paragraph {index} of")
+        editor.insert_after(run, f"<w:r><w:t> edited {index}</w:t></w:r>")
+        editor.append_to(para, "<w:r><w:t> (appended)</w:t></w:r>")
+    edited = time.perf_counter()
+
+    editor.save()
+    saved = time.perf_counter()
+    return parsed - started, edited - parsed, saved - edited
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark XMLEditor engines")
+    parser.add_argument("--paragraphs", type=int, default=20000, help="Paragraphs in document.xml")
+    parser.add_argument("--edits", type=int, default=200, help="Lookup and edit rounds per pass")
+    parser.add_argument("--rounds", type=int, default=3, help="Passes to time per engine")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source = Path(temp_dir) / "source.xml"
+        build_document_xml(source, args.paragraphs)
+        print(f"{args.paragraphs} paragraphs, document.xml {source.stat().st_size / 1e6:.1f} MB")
+        print(f"{'engine':<8} {'parse':>10} {'edit':>10} {'save':>10}")
+
+        for engine in EDITOR_ENGINES:
+            samples = []
+            for _ in range(args.rounds):
+                # Each pass edits a fresh copy so every engine sees the same input
+                path = Path(temp_dir) / f"{engine}.xml"
+                path.write_bytes(source.read_bytes())
+                # minidom trees are reference cycles; collect the previous pass
+                # now so its cleanup is not timed against the next engine
+                gc.collect()
+                samples.append(time_engine(path, engine, args.paragraphs, args.edits))
+            parse, edit, save = (statistics.median(column) for column in zip(*samples))
+            print(f"{engine:<8} {parse * 1000:>8.1f}ms {edit * 1000:>8.1f}ms {save * 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -35,8 +35,8 @@ from pathlib import Path
 
 from defusedxml import minidom
 from ooxml.scripts.pack import pack_document
-from ooxml.scripts.validation.docx import DOCXSchemaValidator
-from ooxml.scripts.validation.redlining import RedliningValidator
+from ooxml.scripts.validation.service import get_validation_service
+from ooxml.scripts.validation.tree_cache import ParsedTreeCache
 
 from .utilities import XMLEditor
 
@@ -94,6 +94,7 @@ class DocxXMLEditor(XMLEditor):
                 "xmlns:w16du",
                 "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
             )
+            self.invalidate_index()
 
     def _ensure_w16cex_namespace(self):
         """Ensure w16cex namespace is declared on the root element."""
@@ -103,6 +104,7 @@ class DocxXMLEditor(XMLEditor):
                 "xmlns:w16cex",
                 "http://schemas.microsoft.com/office/word/2018/wordml/cex",
             )
+            self.invalidate_index()
 
     def _ensure_w14_namespace(self):
         """Ensure w14 namespace is declared on the root element."""
@@ -112,6 +114,7 @@ class DocxXMLEditor(XMLEditor):
                 "xmlns:w14",
                 "http://schemas.microsoft.com/office/word/2010/wordml",
             )
+            self.invalidate_index()
 
     def _inject_attributes_to_nodes(self, nodes):
         """Inject RSID, author, and date attributes into DOM nodes where applicable.
@@ -337,6 +340,7 @@ class DocxXMLEditor(XMLEditor):
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
 
+        self.invalidate_index()
         return [elem]
 
     def revert_deletion(self, elem):
@@ -529,6 +533,7 @@ class DocxXMLEditor(XMLEditor):
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
 
+            self.invalidate_index()
             return del_wrapper
 
         elif elem.nodeName == "w:p":
@@ -587,6 +592,7 @@ class DocxXMLEditor(XMLEditor):
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
 
+            self.invalidate_index()
             return elem
 
         else:
@@ -658,6 +664,13 @@ class Document:
         # Cache for lazy-loaded editors
         self._editors = {}
 
+        # Incremental validation state: parts written by save() since the last
+        # passing validation, the parts that existed then, and parsed trees that
+        # are reused across validations (re-parsed only when a file changes)
+        self._dirty_parts = set()
+        self._validated_parts = None
+        self._tree_cache = ParsedTreeCache()
+
         # Comment file paths
         self.comments_path = self.word_path / "comments.xml"
         self.comments_extended_path = self.word_path / "commentsExtended.xml"
@@ -835,26 +848,38 @@ class Document:
         if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
             shutil.rmtree(self.temp_dir)
 
-    def validate(self) -> None:
+    def validate(self, full=False) -> None:
         """
         Validate the document against XSD schema and redlining rules.
 
+        The first call validates every part. After a passing validation, later
+        calls only re-check the parts save() has written since then, plus any new
+        parts; cross-part checks (IDs, relationships, content types) always run.
+
+        Args:
+            full: If True, validate every part regardless of what changed (default: False).
+
         Raises:
             ValueError: If validation fails.
         """
-        # Create validators with current state
-        schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
-        )
-        redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+        current_parts = self._xml_parts()
+        parts = None
+        if not full and self._validated_parts is not None:
+            parts = self._dirty_parts | (current_parts - self._validated_parts)
+
+        # Run schema then redlining validation through the shared service, which
+        # keeps compiled XSD schemas warm across repeated save() calls
+        failed = get_validation_service().validate(
+            self.unpacked_path,
+            self.original_docx,
+            parts=parts,
+            tree_cache=self._tree_cache,
         )
+        if failed:
+            raise ValueError(f"{failed} validation failed")
 
-        # Run validations
-        if not schema_validator.validate():
-            raise ValueError("Schema validation failed")
-        if not redlining_validator.validate():
-            raise ValueError("Redlining validation failed")
+        self._validated_parts = current_parts
+        self._dirty_parts.clear()
 
     def save(self, destination=None, validate=True) -> None:
         """
@@ -871,9 +896,11 @@ class Document:
             self._ensure_comment_relationships()
             self._ensure_comment_content_types()
 
-        # Save all modified XML files in temp directory
-        for editor in self._editors.values():
-            editor.save()
+        # Save all modified XML files in temp directory, remembering which ones
+        # changed so the next validation only re-checks those
+        for xml_path, editor in self._editors.items():
+            if editor.save():
+                self._dirty_parts.add(Path(xml_path).as_posix())
 
         # Validate by default
         if validate:
@@ -883,6 +910,14 @@ class Document:
         target_path = Path(destination) if destination else self.original_path
         shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
 
+    def _xml_parts(self):
+        """Return the relative paths of all XML and .rels parts in the document."""
+        return {
+            path.relative_to(self.unpacked_path).as_posix()
+            for pattern in ("*.xml", "*.rels")
+            for path in self.unpacked_path.rglob(pattern)
+        }
+
     # ==================== Private: Initialization ====================
 
     def _get_next_comment_id(self):
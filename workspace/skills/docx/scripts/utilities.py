@@ -28,14 +28,26 @@ Example usage:
 
     # Save changes
     editor.save()
+
+LxmlXMLEditor offers the same editing API on top of lxml.etree, which parses,
+searches and serializes large parts much faster than minidom. Pick an engine with
+open_editor():
+
+    editor = open_editor("document.xml", engine="lxml")
 """
 
+import bisect
+import hashlib
 import html
 from pathlib import Path
 from typing import Optional, Union
 
 import defusedxml.minidom
 import defusedxml.sax
+import lxml.etree
+
+# Namespace bound to the reserved xml: prefix
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
 
 
 class XMLEditor:
@@ -50,6 +62,14 @@ class XMLEditor:
         xml_path: Path to the XML file being edited
         encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
         dom: Parsed DOM tree with parse_position attributes on elements
+        content_hash: SHA-256 of the file content as last loaded or saved
+
+    get_node() answers lookups from indexes built on first use and kept up to date
+    by replace_node, insert_after, insert_before and append_to. Lookups that find
+    nothing, or that see a node detached or changed behind the indexes, are
+    repeated on rebuilt indexes. Code that changes self.dom directly should still
+    call invalidate_index() afterwards: a node inserted directly is otherwise
+    missed by a lookup that already has another match.
     """
 
     def __init__(self, xml_path):
@@ -66,13 +86,17 @@ class XMLEditor:
         if not self.xml_path.exists():
             raise ValueError(f"XML file not found: {xml_path}")
 
-        with open(self.xml_path, "rb") as f:
-            header = f.read(200).decode("utf-8", errors="ignore")
+        content = self.xml_path.read_bytes()
+        header = content[:200].decode("utf-8", errors="ignore")
         self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
+        self.content_hash = hashlib.sha256(content).hexdigest()
 
         parser = _create_line_tracking_parser()
         self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
 
+        # Lookup indexes for get_node, built on first use (see _NodeIndex)
+        self._index = None
+
     def get_node(
         self,
         tag: str,
@@ -109,80 +133,18 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
-        matches = []
-        for elem in self.dom.getElementsByTagName(tag):
-            # Check line_number filter
-            if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
+        # Normalize the search string once: convert HTML entities to Unicode characters
+        # This allows searching for both "&#8220;Rowan" and "“Rowan"
+        normalized_contains = html.unescape(contains) if contains is not None else None
 
-                # Handle both single line number and range
-                if isinstance(line_number, range):
-                    if elem_line not in line_number:
-                        continue
-                else:
-                    if elem_line != line_number:
-                        continue
-
-            # Check attrs filter
-            if attrs is not None:
-                if not all(
-                    elem.getAttribute(attr_name) == attr_value
-                    for attr_name, attr_value in attrs.items()
-                ):
-                    continue
-
-            # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
-                    continue
-
-            # If all applicable filters passed, this is a match
-            matches.append(elem)
-
-        if not matches:
-            # Build descriptive error message
-            filters = []
-            if line_number is not None:
-                line_str = (
-                    f"lines {line_number.start}-{line_number.stop - 1}"
-                    if isinstance(line_number, range)
-                    else f"line {line_number}"
-                )
-                filters.append(f"at {line_str}")
-            if attrs is not None:
-                filters.append(f"with attributes {attrs}")
-            if contains is not None:
-                filters.append(f"containing '{contains}'")
-
-            filter_desc = " ".join(filters) if filters else ""
-            base_msg = f"Node not found: <{tag}> {filter_desc}".strip()
-
-            # Add helpful hint based on filters used
-            if contains:
-                hint = "Text may be split across elements or use different wording."
-            elif line_number:
-                hint = "Line numbers may have changed if document was modified."
-            elif attrs:
-                hint = "Verify attribute values are correct."
-            else:
-                hint = "Try adding filters (attrs, line_number, or contains)."
-
-            raise ValueError(f"{base_msg}. {hint}")
-        if len(matches) > 1:
-            raise ValueError(
-                f"Multiple nodes found: <{tag}>. "
-                f"Add more filters (attrs, line_number, or contains) to narrow the search."
-            )
-        return matches[0]
+        # Start from the narrowest indexed candidate set, then apply every
+        # filter to each candidate exactly as a full scan would
+        matches = _find_nodes(self, tag, attrs, line_number, normalized_contains)
+        return _single_match(matches, tag, attrs, line_number, contains)
 
     def _get_element_text(self, elem):
         """
-        Recursively extract all text content from an element.
+        Extract all text content from an element (cached until it is edited).
 
         Skips text nodes that contain only whitespace (spaces, tabs, newlines),
         which typically represent XML formatting rather than document content.
@@ -193,15 +155,7 @@ class XMLEditor:
         Returns:
             str: Concatenated text from all non-whitespace text nodes within the element
         """
-        text_parts = []
-        for node in elem.childNodes:
-            if node.nodeType == node.TEXT_NODE:
-                # Skip whitespace-only text nodes (XML formatting)
-                if node.data.strip():
-                    text_parts.append(node.data)
-            elif node.nodeType == node.ELEMENT_NODE:
-                text_parts.append(self._get_element_text(node))
-        return "".join(text_parts)
+        return self._node_index().text(elem)
 
     def replace_node(self, elem, new_content):
         """
@@ -222,6 +176,7 @@ class XMLEditor:
         for node in nodes:
             parent.insertBefore(node, elem)
         parent.removeChild(elem)
+        self._record_edit(parent, inserted=nodes, removed=elem)
         return nodes
 
     def insert_after(self, elem, xml_content):
@@ -246,6 +201,7 @@ class XMLEditor:
                 parent.insertBefore(node, next_sibling)
             else:
                 parent.appendChild(node)
+        self._record_edit(parent, inserted=nodes)
         return nodes
 
     def insert_before(self, elem, xml_content):
@@ -266,6 +222,7 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             parent.insertBefore(node, elem)
+        self._record_edit(parent, inserted=nodes)
         return nodes
 
     def append_to(self, elem, xml_content):
@@ -285,8 +242,24 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             elem.appendChild(node)
+        self._record_edit(elem, inserted=nodes)
         return nodes
 
+    def invalidate_index(self):
+        """Drop the get_node indexes; call after changing self.dom directly."""
+        self._index = None
+
+    def _node_index(self):
+        """Return the get_node indexes, building them on first use."""
+        if self._index is None:
+            self._index = _NodeIndex(self.dom, self.dom.documentElement)
+        return self._index
+
+    def _record_edit(self, parent, inserted=(), removed=None):
+        """Keep built indexes in step with an edit made under parent."""
+        if self._index is not None:
+            self._index.record_edit(parent, inserted, removed)
+
     def get_next_rid(self):
         """Get the next available rId for relationships files."""
         max_id = 0
@@ -304,10 +277,20 @@ class XMLEditor:
         Save the edited XML back to the file.
 
         Serializes the DOM tree and writes it back to the original file path,
-        preserving the original encoding (ascii or utf-8).
+        preserving the original encoding (ascii or utf-8). The file is left
+        untouched when the serialized content matches content_hash, so callers
+        can track which parts actually changed.
+
+        Returns:
+            bool: True if the file was written, False if its content was unchanged
         """
         content = self.dom.toxml(encoding=self.encoding)
+        content_hash = hashlib.sha256(content).hexdigest()
+        if content_hash == self.content_hash:
+            return False
         self.xml_path.write_bytes(content)
+        self.content_hash = content_hash
+        return True
 
     def _parse_fragment(self, xml_content):
         """
@@ -343,6 +326,616 @@ class XMLEditor:
         return nodes
 
 
+class LxmlXMLEditor:
+    """
+    XMLEditor engine backed by lxml.etree instead of minidom.
+
+    lxml records each element's source line natively (element.sourceline), so no
+    instrumented SAX parser is needed, and parsing, searching and serializing
+    large parts is much faster. The editing API matches XMLEditor: tag and
+    attribute names use the document's prefixes ("w:p", "w:id"), and
+    get_node/replace_node/insert_*/append_to take and return lxml elements.
+    Inserted elements have no source line, like inserted minidom nodes, and
+    lookups use the same indexes; call invalidate_index() after changing the
+    tree directly.
+
+    Only the generic editing API is provided; DocxXMLEditor and Document build
+    tracked changes and comments with minidom calls and keep using XMLEditor.
+
+    Attributes:
+        xml_path: Path to the XML file being edited
+        encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
+        tree: Parsed lxml ElementTree
+        root: Root element of tree
+        content_hash: SHA-256 of the file content as last loaded or saved
+    """
+
+    def __init__(self, xml_path):
+        """
+        Initialize with path to XML file and parse it with lxml.
+
+        Args:
+            xml_path: Path to XML file to edit (str or Path)
+
+        Raises:
+            ValueError: If the XML file does not exist
+        """
+        self.xml_path = Path(xml_path)
+        if not self.xml_path.exists():
+            raise ValueError(f"XML file not found: {xml_path}")
+
+        content = self.xml_path.read_bytes()
+        header = content[:200].decode("utf-8", errors="ignore")
+        self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
+        self.content_hash = hashlib.sha256(content).hexdigest()
+
+        self.tree = lxml.etree.ElementTree(
+            lxml.etree.fromstring(content, _safe_lxml_parser())
+        )
+        self.root = self.tree.getroot()
+
+        # Lookup indexes for get_node, built on first use (see _LxmlNodeIndex)
+        self._index = None
+
+    def get_node(
+        self,
+        tag: str,
+        attrs: Optional[dict[str, str]] = None,
+        line_number: Optional[Union[int, range]] = None,
+        contains: Optional[str] = None,
+    ):
+        """
+        Get an element by tag and identifier. See XMLEditor.get_node.
+
+        Returns:
+            lxml.etree._Element: The matching element
+
+        Raises:
+            ValueError: If node not found or multiple matches found
+        """
+        qualified_tag = "*" if tag == "*" else self._qualify(tag)
+        qualified_attrs = (
+            {self._qualify(name, attribute=True): value for name, value in attrs.items()}
+            if attrs is not None
+            else None
+        )
+
+        normalized_contains = html.unescape(contains) if contains is not None else None
+
+        # Same candidate narrowing and filters as XMLEditor.get_node
+        matches = _find_nodes(self, qualified_tag, qualified_attrs, line_number, normalized_contains)
+        return _single_match(matches, tag, attrs, line_number, contains)
+
+    def _get_element_text(self, elem):
+        """Return the element's text content, skipping whitespace-only text nodes."""
+        return self._node_index().text(elem)
+
+    def replace_node(self, elem, new_content):
+        """
+        Replace an element with new XML content.
+
+        Args:
+            elem: lxml element to replace
+            new_content: String containing XML to replace the node with
+
+        Returns:
+            List[lxml.etree._Element]: All inserted elements
+        """
+        parent = elem.getparent()
+        index = parent.index(elem)
+        tail, elem.tail = elem.tail, None
+        parent.remove(elem)
+        nodes = self._splice(parent, index, self._parse_fragment(new_content))
+        _append_tail(nodes[-1], tail)
+        self._record_edit(parent, inserted=nodes, removed=elem)
+        return nodes
+
+    def insert_after(self, elem, xml_content):
+        """
+        Insert XML content after an element.
+
+        Args:
+            elem: lxml element to insert after
+            xml_content: String containing XML to insert
+
+        Returns:
+            List[lxml.etree._Element]: All inserted elements
+        """
+        parent = elem.getparent()
+        # Text following elem stays after the inserted content, as with minidom
+        tail, elem.tail = elem.tail, None
+        nodes = self._splice(
+            parent, parent.index(elem) + 1, self._parse_fragment(xml_content)
+        )
+        _append_tail(nodes[-1], tail)
+        self._record_edit(parent, inserted=nodes)
+        return nodes
+
+    def insert_before(self, elem, xml_content):
+        """
+        Insert XML content before an element.
+
+        Args:
+            elem: lxml element to insert before
+            xml_content: String containing XML to insert
+
+        Returns:
+            List[lxml.etree._Element]: All inserted elements
+        """
+        parent = elem.getparent()
+        nodes = self._splice(
+            parent, parent.index(elem), self._parse_fragment(xml_content)
+        )
+        self._record_edit(parent, inserted=nodes)
+        return nodes
+
+    def append_to(self, elem, xml_content):
+        """
+        Append XML content as the last children of an element.
+
+        Args:
+            elem: lxml element to append to
+            xml_content: String containing XML to append
+
+        Returns:
+            List[lxml.etree._Element]: All inserted elements
+        """
+        nodes = self._splice(elem, len(elem), self._parse_fragment(xml_content))
+        self._record_edit(elem, inserted=nodes)
+        return nodes
+
+    def invalidate_index(self):
+        """Drop the get_node indexes; call after changing the tree directly."""
+        self._index = None
+
+    def _node_index(self):
+        """Return the get_node indexes, building them on first use."""
+        if self._index is None:
+            self._index = _LxmlNodeIndex(self.root, self.root)
+        return self._index
+
+    def _record_edit(self, parent, inserted=(), removed=None):
+        """Keep built indexes in step with an edit made under parent."""
+        if self._index is not None:
+            self._index.record_edit(parent, inserted, removed)
+
+    def get_next_rid(self):
+        """Get the next available rId for relationships files."""
+        max_id = 0
+        for rel_elem in self.root.iter(self._qualify("Relationship")):
+            rel_id = rel_elem.get("Id", "")
+            if rel_id.startswith("rId"):
+                try:
+                    max_id = max(max_id, int(rel_id[3:]))
+                except ValueError:
+                    pass
+        return f"rId{max_id + 1}"
+
+    def save(self):
+        """
+        Save the edited XML back to the file.
+
+        Like XMLEditor.save, the file is left untouched when the serialized
+        content matches content_hash.
+
+        Returns:
+            bool: True if the file was written, False if its content was unchanged
+        """
+        content = lxml.etree.tostring(
+            self.tree,
+            xml_declaration=True,
+            encoding=self.encoding,
+            standalone=self.tree.docinfo.standalone,
+        )
+        content_hash = hashlib.sha256(content).hexdigest()
+        if content_hash == self.content_hash:
+            return False
+        self.xml_path.write_bytes(content)
+        self.content_hash = content_hash
+        return True
+
+    def _qualify(self, name, attribute=False):
+        """Convert a prefixed name such as "w:p" to lxml's {namespace}local form."""
+        if ":" in name:
+            prefix, local = name.split(":", 1)
+            if prefix == "xml":
+                return f"{{{XML_NAMESPACE}}}{local}"
+            namespace = self.root.nsmap.get(prefix)
+            if namespace is None:
+                raise ValueError(f"Namespace prefix not declared: {prefix}")
+            return f"{{{namespace}}}{local}"
+        # Unprefixed attributes are in no namespace; unprefixed elements use the default one
+        namespace = None if attribute else self.root.nsmap.get(None)
+        return f"{{{namespace}}}{name}" if namespace else name
+
+    def _parse_fragment(self, xml_content):
+        """
+        Parse an XML fragment using the root element's namespace declarations.
+
+        Returns:
+            lxml.etree._Element: Wrapper element holding the fragment's content
+
+        Raises:
+            AssertionError: If fragment contains no element nodes
+        """
+        declarations = " ".join(
+            f'xmlns:{prefix}="{namespace}"' if prefix else f'xmlns="{namespace}"'
+            for prefix, namespace in self.root.nsmap.items()
+        )
+        wrapper = lxml.etree.fromstring(
+            f"<root {declarations}>{xml_content}</root>".encode("utf-8"),
+            _safe_lxml_parser(),
+        )
+        assert len(wrapper), "Fragment must contain at least one element"
+        # Inserted content has no line in the original file
+        for elem in wrapper.iter():
+            elem.sourceline = 0
+        return wrapper
+
+    def _splice(self, parent, index, wrapper):
+        """Move the wrapper's children to parent[index], keeping surrounding text."""
+        nodes = list(wrapper)
+        if wrapper.text:
+            if index == 0:
+                parent.text = (parent.text or "") + wrapper.text
+            else:
+                _append_tail(parent[index - 1], wrapper.text)
+        for offset, node in enumerate(nodes):
+            parent.insert(index + offset, node)
+        return nodes
+
+
+# Editor engines selectable through open_editor()
+EDITOR_ENGINES = {"minidom": XMLEditor, "lxml": LxmlXMLEditor}
+
+
+def open_editor(xml_path, engine="minidom"):
+    """
+    Open an XML file with the chosen editor engine.
+
+    Args:
+        xml_path: Path to XML file to edit (str or Path)
+        engine: "minidom" for XMLEditor (default) or "lxml" for LxmlXMLEditor
+
+    Returns:
+        XMLEditor or LxmlXMLEditor
+
+    Raises:
+        ValueError: If the engine is unknown or the file does not exist
+    """
+    if engine not in EDITOR_ENGINES:
+        raise ValueError(
+            f"Unknown editor engine: {engine} (expected one of {', '.join(EDITOR_ENGINES)})"
+        )
+    return EDITOR_ENGINES[engine](xml_path)
+
+
+def _safe_lxml_parser():
+    """Return an lxml parser that never resolves entities or touches the network."""
+    return lxml.etree.XMLParser(resolve_entities=False, no_network=True)
+
+
+def _append_tail(elem, text):
+    """Append text after elem."""
+    if text:
+        elem.tail = (elem.tail or "") + text
+
+
+def _single_match(matches, tag, attrs, line_number, contains):
+    """
+    Return the only element in matches, or raise a descriptive ValueError.
+
+    Shared by the get_node implementations of both editor engines.
+    """
+    if not matches:
+        # Build descriptive error message
+        filters = []
+        if line_number is not None:
+            line_str = (
+                f"lines {line_number.start}-{line_number.stop - 1}"
+                if isinstance(line_number, range)
+                else f"line {line_number}"
+            )
+            filters.append(f"at {line_str}")
+        if attrs is not None:
+            filters.append(f"with attributes {attrs}")
+        if contains is not None:
+            filters.append(f"containing '{contains}'")
+
+        filter_desc = " ".join(filters) if filters else ""
+        base_msg = f"Node not found: <{tag}> {filter_desc}".strip()
+
+        # Add helpful hint based on filters used
+        if contains:
+            hint = "Text may be split across elements or use different wording."
+        elif line_number:
+            hint = "Line numbers may have changed if document was modified."
+        elif attrs:
+            hint = "Verify attribute values are correct."
+        else:
+            hint = "Try adding filters (attrs, line_number, or contains)."
+
+        raise ValueError(f"{base_msg}. {hint}")
+    if len(matches) > 1:
+        raise ValueError(
+            f"Multiple nodes found: <{tag}>. "
+            f"Add more filters (attrs, line_number, or contains) to narrow the search."
+        )
+    return matches[0]
+
+
+class _NodeIndex:
+    """
+    Lookup indexes over a minidom DOM for XMLEditor.get_node.
+
+    Holds tag -> elements, plus lazily built (tag, attribute) -> value -> elements
+    and tag -> sorted source line tables, and a text-content cache.
+    Indexes only narrow the candidates; find() checks every filter on each
+    candidate against the live tree, and reports when a candidate shows the tree
+    was changed without record_edit() so the lookup can be retried on fresh
+    indexes (see _find_nodes).
+
+    Edits are recorded with record_edit(). Removed subtrees leave the tag index
+    at once; inserted nodes are indexed on the next lookup, after callers such as
+    DocxXMLEditor have finished setting attributes on them.
+
+    Node access goes through the small _tag/_children/... hooks so that
+    _LxmlNodeIndex can reuse the same tables for lxml trees.
+    """
+
+    def __init__(self, document, root):
+        self.document = document
+        self._by_tag = {}  # tag -> {element: None}, an insertion-ordered set
+        self._by_attribute = {}  # (tag, attribute) -> {value: [elements]}
+        self._by_line = {}  # tag -> (sorted line numbers, elements in same order)
+        self._text = {}  # element -> text content
+        self._pending = []  # nodes inserted since the last lookup
+        for elem in self._iter_elements(root):
+            self._by_tag.setdefault(self._tag(elem), {})[elem] = None
+
+    def with_tag(self, tag):
+        """Return all elements with the given tag name ("*" matches any)."""
+        self._apply_pending()
+        if tag == "*":
+            return [elem for elems in self._by_tag.values() for elem in elems]
+        return list(self._by_tag.get(tag, ()))
+
+    def with_attribute(self, tag, name, value):
+        """Return candidate elements whose attribute name equals value."""
+        self._apply_pending()
+        if tag == "*":
+            return self.with_tag(tag)
+        key = (tag, name)
+        if key not in self._by_attribute:
+            table = {}
+            for elem in self._by_tag.get(tag, ()):
+                table.setdefault(self._attribute(elem, name), []).append(elem)
+            self._by_attribute[key] = table
+        live = self._by_tag.get(tag, {})
+        return [elem for elem in self._by_attribute[key].get(value, ()) if elem in live]
+
+    def containing(self, tag, text):
+        """Return elements with the tag whose text content contains text."""
+        cache = self._text
+        return [
+            elem
+            for elem in self.with_tag(tag)
+            if text in (cache[elem] if elem in cache else self.text(elem))
+        ]
+
+    def on_lines(self, tag, line_number):
+        """Return candidate elements parsed at line_number (an int or a range)."""
+        self._apply_pending()
+        if tag == "*":
+            return self.with_tag(tag)
+        if tag not in self._by_line:
+            # Source lines never change and inserted elements have none, so
+            # the table is built once per tag
+            positioned = sorted(
+                (
+                    (self._line(elem), order, elem)
+                    for order, elem in enumerate(self._by_tag.get(tag, ()))
+                    if self._line(elem) is not None
+                ),
+                key=lambda entry: entry[:2],
+            )
+            self._by_line[tag] = (
+                [line for line, _, _ in positioned],
+                [elem for _, _, elem in positioned],
+            )
+        lines, elems = self._by_line[tag]
+        if isinstance(line_number, range):
+            if not line_number:
+                return []
+            start, stop = min(line_number), max(line_number) + 1
+        else:
+            start, stop = line_number, line_number + 1
+        live = self._by_tag.get(tag, {})
+        return [
+            elem
+            for elem in elems[bisect.bisect_left(lines, start) : bisect.bisect_left(lines, stop)]
+            if elem in live
+        ]
+
+    def find(self, tag, attrs, line_number, contains):
+        """Return (matches, stale) for a get_node lookup.
+
+        stale is True if a candidate was detached, or its indexed attribute or
+        text differs from what the indexes recorded, meaning the tree was edited
+        directly and the indexes may have missed other matches.
+        """
+        if attrs:
+            attr_name, attr_value = next(iter(attrs.items()))
+            candidates = self.with_attribute(tag, attr_name, attr_value)
+        elif line_number is not None:
+            candidates = self.on_lines(tag, line_number)
+        elif contains is not None:
+            candidates = self.containing(tag, contains)
+        else:
+            candidates = self.with_tag(tag)
+
+        matches = []
+        stale = False
+        for elem in candidates:
+            if not self._is_attached(elem):
+                stale = True
+                continue
+
+            # Check line_number filter (a single line or a range)
+            if line_number is not None:
+                elem_line = self._line(elem)
+                if isinstance(line_number, range):
+                    if elem_line not in line_number:
+                        continue
+                elif elem_line != line_number:
+                    continue
+
+            # Check attrs filter
+            if attrs is not None:
+                if tag != "*" and self._attribute(elem, attr_name) != attr_value:
+                    stale = True
+                    continue
+                if not all(self._attribute(elem, name) == value for name, value in attrs.items()):
+                    continue
+
+            # Check contains filter against the current text, not the cache
+            if contains is not None:
+                text = self._compute_text(elem, fresh=True)
+                if self._text.get(elem, text) != text:
+                    stale = True
+                self._text[elem] = text
+                if contains not in text:
+                    continue
+
+            matches.append(elem)
+        return matches, stale
+
+    def text(self, elem):
+        """Return the element's text content, skipping whitespace-only text nodes."""
+        text = self._text.get(elem)
+        if text is None:
+            text = self._text[elem] = self._compute_text(elem)
+        return text
+
+    def record_edit(self, parent, inserted, removed):
+        """Update the indexes for nodes inserted into or removed from parent."""
+        if removed is not None and self._is_element(removed):
+            for elem in self._iter_elements(removed):
+                self._by_tag.get(self._tag(elem), {}).pop(elem, None)
+                self._text.pop(elem, None)
+        self._pending.extend(inserted)
+        # The text of parent and every ancestor now includes or lacks the edit
+        node = parent
+        while node is not None and self._is_element(node):
+            self._text.pop(node, None)
+            node = self._parent(node)
+
+    def _apply_pending(self):
+        """Index inserted nodes that are still part of the document."""
+        pending, self._pending = self._pending, []
+        for node in pending:
+            if not self._is_element(node) or not self._is_attached(node):
+                continue
+            for elem in self._iter_elements(node):
+                tag = self._tag(elem)
+                self._by_tag.setdefault(tag, {})[elem] = None
+                for (indexed_tag, name), table in self._by_attribute.items():
+                    if indexed_tag == tag:
+                        table.setdefault(self._attribute(elem, name), []).append(elem)
+
+    def _is_attached(self, node):
+        """Return True if node is currently part of the document."""
+        while node is not None:
+            if node is self.document:
+                return True
+            node = self._parent(node)
+        return False
+
+    def _iter_elements(self, root):
+        """Yield root and all of its descendant elements in document order."""
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if self._is_element(node):
+                yield node
+                stack.extend(reversed(self._children(node)))
+
+    # Node access hooks (minidom)
+
+    def _is_element(self, node):
+        return node.nodeType == node.ELEMENT_NODE
+
+    def _tag(self, elem):
+        return elem.tagName
+
+    def _children(self, elem):
+        return elem.childNodes
+
+    def _parent(self, node):
+        return node.parentNode
+
+    def _attribute(self, elem, name):
+        return elem.getAttribute(name)
+
+    def _line(self, elem):
+        return elem.parse_position[0] if hasattr(elem, "parse_position") else None
+
+    def _compute_text(self, elem, fresh=False):
+        text_parts = []
+        for node in elem.childNodes:
+            if node.nodeType == node.TEXT_NODE:
+                # Skip whitespace-only text nodes (XML formatting)
+                if node.data.strip():
+                    text_parts.append(node.data)
+            elif node.nodeType == node.ELEMENT_NODE:
+                text_parts.append(self._compute_text(node, fresh) if fresh else self.text(node))
+        return "".join(text_parts)
+
+
+class _LxmlNodeIndex(_NodeIndex):
+    """_NodeIndex over an lxml tree; tags and attributes use {namespace}local names."""
+
+    def _is_element(self, node):
+        return isinstance(node.tag, str)
+
+    def _tag(self, elem):
+        return elem.tag
+
+    def _children(self, elem):
+        return list(elem)
+
+    def _parent(self, node):
+        return node.getparent()
+
+    def _attribute(self, elem, name):
+        return elem.get(name, "")
+
+    def _line(self, elem):
+        return elem.sourceline
+
+    def _compute_text(self, elem, fresh=False):
+        return "".join(part for part in elem.itertext() if part.strip())
+
+    def _iter_elements(self, root):
+        return root.iter(lxml.etree.Element)
+
+
+def _find_nodes(editor, tag, attrs, line_number, contains):
+    """Return get_node matches from the editor's indexes.
+
+    If the lookup finds nothing, or a candidate shows the tree was changed
+    without going through the editor (see XMLEditor.invalidate_index), the
+    indexes are rebuilt and the lookup repeated, so direct DOM edits give the
+    same answers as a full scan.
+    """
+    built_now = editor._index is None
+    matches, stale = editor._node_index().find(tag, attrs, line_number, contains)
+    if (stale or not matches) and not built_now:
+        editor.invalidate_index()
+        matches, _ = editor._node_index().find(tag, attrs, line_number, contains)
+    return matches
+
+
 def _create_line_tracking_parser():
     """
     Create a SAX parser that tracks line and column numbers for each element.
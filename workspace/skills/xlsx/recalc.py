@@ -11,6 +11,7 @@ import os
 import platform
 from pathlib import Path
 from openpyxl import load_workbook
+from soffice import UNO_AVAILABLE, SofficeError, get_soffice_client
 
 
 def setup_libreoffice_macro():
@@ -66,8 +67,29 @@ def recalc(filename, timeout=30):
     
     abs_path = str(Path(filename).absolute())
     
+    # Reuse the persistent LibreOffice listener when the uno bindings are available
+    if UNO_AVAILABLE:
+        try:
+            get_soffice_client().recalculate(abs_path, timeout=timeout)
+        except SofficeError as e:
+            return {'error': str(e)}
+        return check_errors(filename)
+    
+    error = recalc_with_macro(abs_path, timeout)
+    if error:
+        return {'error': error}
+    return check_errors(filename)
+
+
+def recalc_with_macro(abs_path, timeout):
+    """
+    Recalculate by starting soffice once for this file and running the macro
+    
+    Returns:
+        Error message, or None on success
+    """
     if not setup_libreoffice_macro():
-        return {'error': 'Failed to setup LibreOffice macro'}
+        return 'Failed to setup LibreOffice macro'
     
     cmd = [
         'soffice', '--headless', '--norestore',
@@ -94,10 +116,20 @@ def recalc(filename, timeout=30):
     if result.returncode != 0 and result.returncode != 124:  # 124 is timeout exit code
         error_msg = result.stderr or 'Unknown error during recalculation'
         if 'Module1' in error_msg or 'RecalculateAndSave' not in error_msg:
-            return {'error': 'LibreOffice macro not configured properly'}
+            return 'LibreOffice macro not configured properly'
         else:
-            return {'error': error_msg}
+            return error_msg
     
+    return None
+
+
+def check_errors(filename):
+    """
+    Scan a recalculated Excel file for formula errors
+    
+    Returns:
+        dict with error locations and counts
+    """
     # Check for Excel errors in the recalculated file - scan ALL cells
     try:
         wb = load_workbook(filename, data_only=True)
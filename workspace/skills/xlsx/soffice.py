@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+"""
+Persistent headless LibreOffice listener and a client that reuses it.
+
+Starting soffice takes several seconds, which used to be paid on every
+validation and recalculation. SofficeListener starts one headless soffice that
+accepts UNO connections on a named pipe private to the current user and leaves
+it running across processes until it has been idle for a while; SofficeClient
+loads, converts and recalculates documents through it, checking its health and
+restarting it when it dies or hangs.
+
+The client needs the LibreOffice Python bindings (the uno module). When they
+are not importable, UNO_AVAILABLE is False and callers fall back to running
+soffice as a subprocess.
+
+Example usage:
+    python soffice.py start|stop|status [--name soffice-listener] [--idle-timeout 900]
+"""
+
+import argparse
+import contextlib
+import fcntl
+import os
+import signal
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from pathlib import Path
+
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+    from com.sun.star.uno import RuntimeException as UnoRuntimeException
+except ImportError:
+    uno = None
+
+UNO_AVAILABLE = uno is not None
+
+DEFAULT_NAME = "soffice-listener"
+# Seconds without requests after which the listener shuts itself down
+DEFAULT_IDLE_TIMEOUT = 15 * 60
+
+
+class SofficeError(Exception):
+    """Raised when the listener cannot be started or a request to it fails."""
+
+
+class SofficeNotFoundError(SofficeError):
+    """Raised when the soffice executable is not installed."""
+
+
+class SofficeListener:
+    """A headless soffice process accepting UNO connections on a named pipe.
+
+    The listener is started in its own session with a dedicated user profile
+    and is not stopped when the starting process exits, so later processes
+    reuse it. A watchdog process stops it once no request has used it for
+    idle_timeout seconds.
+
+    The pipe name and the state directory both include the user id. The state
+    directory holds the profile, the pid file, a lock serializing restarts
+    across processes and the last-use timestamp. It lives under
+    $XDG_RUNTIME_DIR, or the temp directory, and must be a directory owned by
+    the current user that no one else can access.
+
+    Example:
+        listener = SofficeListener()
+        listener.ensure_running()
+        ...
+        listener.stop()
+    """
+
+    def __init__(self, name=DEFAULT_NAME, start_timeout=60, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        self.name = name
+        self.pipe_name = f"{name}-{os.getuid()}"
+        self.start_timeout = start_timeout
+        self.idle_timeout = idle_timeout
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+        self.state_dir = Path(runtime_dir) / self.pipe_name
+        self.pid_file = self.state_dir / "listener.pid"
+        self.lock_file = self.state_dir / "listener.lock"
+        self.last_used_file = self.state_dir / "last-used"
+        # Set when this process started the listener, so it can be reaped
+        self._process = None
+
+    @property
+    def connection_string(self):
+        """UNO connection string for the listener's component context."""
+        return f"pipe,name={self.pipe_name};urp;StarOffice.ComponentContext"
+
+    def pid(self):
+        """Return the pid of the running listener, or None if it is not running."""
+        try:
+            pid = int(self.pid_file.read_text())
+            # A listener this process started stays a zombie until it is reaped
+            if self._process is not None and self._process.pid == pid and self._process.poll() is not None:
+                return None
+            # The listener leads its own process group; anything else is a
+            # reused pid
+            if os.getpgid(pid) != pid:
+                return None
+        except (OSError, ValueError):
+            return None
+        return pid
+
+    def is_healthy(self):
+        """Return True if the listener process is alive and accepting connections."""
+        return self.pid() is not None and self._accepting()
+
+    def touch(self):
+        """Record a use of the listener, postponing its idle shutdown."""
+        with contextlib.suppress(OSError):
+            self.last_used_file.touch()
+
+    def ensure_running(self):
+        """Start the listener unless a healthy one is already running."""
+        if self.is_healthy():
+            self.touch()
+            return
+        with self._locked():
+            # Another process may have started it while this one waited
+            if not self.is_healthy():
+                self._restart()
+        self.touch()
+
+    def restart(self, replacing=None):
+        """Stop any existing listener and start a fresh one.
+
+        Args:
+            replacing: Pid of the listener the caller found broken. If another
+                process has already replaced it, the new listener is kept.
+
+        Raises:
+            SofficeError: If soffice is not installed or does not start listening
+                within start_timeout seconds
+        """
+        with self._locked():
+            current = self.pid()
+            if replacing is not None and current is not None and current != replacing:
+                return
+            self._restart()
+
+    def stop(self, timeout=10):
+        """Terminate the listener if it is running, killing it if it does not exit."""
+        with self._locked():
+            self._stop(timeout)
+
+    def watch(self, pid, interval=30):
+        """Stop listener pid once it has been idle for idle_timeout seconds.
+
+        Returns when the listener stops, whether idle or not.
+        """
+        while self.pid() == pid:
+            idle = time.time() - self._last_used()
+            if idle >= self.idle_timeout:
+                with self._locked():
+                    if self.pid() == pid and time.time() - self._last_used() >= self.idle_timeout:
+                        self._stop()
+                return
+            time.sleep(min(interval, self.idle_timeout - idle))
+
+    def _restart(self):
+        self._stop()
+        self._prepare_state_dir()
+        profile_dir = self.state_dir / "profile"
+        try:
+            process = subprocess.Popen(
+                [
+                    "soffice",
+                    "--headless",
+                    "--invisible",
+                    "--nologo",
+                    "--nodefault",
+                    "--norestore",
+                    f"--accept={self.connection_string}",
+                    f"-env:UserInstallation={profile_dir.as_uri()}",
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                # Detach so the listener outlives this process and its signals
+                start_new_session=True,
+            )
+        except FileNotFoundError:
+            raise SofficeNotFoundError("soffice not found")
+        self._process = process
+        self.pid_file.write_text(str(process.pid))
+        self.touch()
+
+        deadline = time.monotonic() + self.start_timeout
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                self._process = None
+                self.pid_file.unlink(missing_ok=True)
+                raise SofficeError(f"soffice exited during startup (code {process.returncode})")
+            if self._accepting():
+                self._start_watchdog(process.pid)
+                return
+            time.sleep(0.2)
+        self._stop()
+        raise SofficeError(f"soffice did not start listening within {self.start_timeout}s")
+
+    def _stop(self, timeout=10):
+        pid = self.pid()
+        if pid is not None:
+            # soffice is a wrapper around oosplash and soffice.bin, so signal
+            # the whole process group
+            self._signal(pid, signal.SIGTERM)
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline and self._alive(pid):
+                time.sleep(0.1)
+            if self._alive(pid):
+                self._signal(pid, signal.SIGKILL)
+        if self._process is not None:
+            self._process.wait()
+            self._process = None
+        self.pid_file.unlink(missing_ok=True)
+
+    def _signal(self, pid, signum):
+        with contextlib.suppress(ProcessLookupError):
+            os.killpg(pid, signum)
+
+    def _alive(self, pid):
+        # A listener this process started stays a zombie until it is reaped
+        if self._process is not None and self._process.pid == pid:
+            self._process.poll()
+        try:
+            os.killpg(pid, 0)
+        except OSError:
+            return False
+        return True
+
+    def _accepting(self):
+        """Return True if the listener answers a UNO connection."""
+        if uno is None:
+            # Nothing here can connect, so a running process is all there is to check
+            return True
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        try:
+            resolver.resolve(f"uno:{self.connection_string}")
+        except Exception:
+            return False
+        return True
+
+    def _start_watchdog(self, pid):
+        if not self.idle_timeout:
+            return
+        subprocess.Popen(
+            [
+                sys.executable,
+                str(Path(__file__).resolve()),
+                "watch",
+                f"--pid={pid}",
+                f"--name={self.name}",
+                f"--idle-timeout={self.idle_timeout}",
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+    def _last_used(self):
+        try:
+            return self.last_used_file.stat().st_mtime
+        except OSError:
+            return 0.0
+
+    def _prepare_state_dir(self):
+        """Create the state directory, refusing one that others could tamper with."""
+        try:
+            self.state_dir.mkdir(mode=0o700, exist_ok=True)
+            st = os.lstat(self.state_dir)
+        except OSError as e:
+            raise SofficeError(f"Cannot create {self.state_dir}: {e}")
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+            raise SofficeError(
+                f"{self.state_dir} must be a directory owned by the current user with mode 0700"
+            )
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """Hold the state directory's lock, serializing starts and stops across processes."""
+        self._prepare_state_dir()
+        with open(self.lock_file, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+class SofficeClient:
+    """Run document operations through a SofficeListener over UNO.
+
+    Each request gets a health check first. A request that loses its UNO
+    bridge, because the listener died or another process restarted it,
+    reconnects and is retried once, starting the listener only if none is
+    running. A request that does not finish within its timeout restarts the
+    listener, since a hung soffice would otherwise block every later request.
+
+    Example:
+        client = get_soffice_client()
+        client.convert("report.docx", "/tmp/out", "HTML", "html")
+        client.recalculate("model.xlsx")
+    """
+
+    def __init__(self, listener=None):
+        if not UNO_AVAILABLE:
+            raise SofficeError("LibreOffice Python bindings (uno) are not available")
+        self.listener = listener or SofficeListener()
+        self._desktop = None
+        # Pid of the listener self._desktop belongs to
+        self._desktop_pid = None
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def convert(self, doc_path, output_dir, filter_name, extension, timeout=60):
+        """Export a document with the given filter.
+
+        Args:
+            doc_path: Document to convert
+            output_dir: Directory to write the converted file into
+            filter_name: LibreOffice export filter, e.g. "HTML (StarCalc)"
+            extension: Extension of the converted file, e.g. "html"
+            timeout: Seconds to wait before giving up and restarting the listener
+
+        Returns:
+            Path: The converted file
+
+        Raises:
+            SofficeError: If the document cannot be loaded or exported
+        """
+        doc_path = Path(doc_path).resolve()
+        output = Path(output_dir).resolve() / f"{doc_path.stem}.{extension}"
+
+        def export(desktop):
+            document = self._load(desktop, doc_path, ReadOnly=True)
+            try:
+                document.storeToURL(output.as_uri(), _properties(FilterName=filter_name))
+            finally:
+                document.close(True)
+            return output
+
+        return self._request(export, timeout)
+
+    def recalculate(self, doc_path, timeout=60):
+        """Recalculate every formula in a spreadsheet and save it in place.
+
+        Raises:
+            SofficeError: If the document cannot be loaded, recalculated or saved
+        """
+        doc_path = Path(doc_path).resolve()
+
+        def recalc(desktop):
+            document = self._load(desktop, doc_path)
+            try:
+                document.calculateAll()
+                document.store()
+            finally:
+                document.close(True)
+
+        self._request(recalc, timeout)
+
+    def _load(self, desktop, doc_path, **options):
+        document = desktop.loadComponentFromURL(
+            doc_path.as_uri(), "_blank", 0, _properties(Hidden=True, **options)
+        )
+        if document is None:
+            raise SofficeError(f"LibreOffice could not load {doc_path}")
+        return document
+
+    def _request(self, operation, timeout):
+        """Run operation(desktop) on the listener, reconnecting once if the bridge drops."""
+        with self._lock:
+            for attempt in range(2):
+                desktop = self._connect()
+                self.listener.touch()
+                future = self._executor.submit(operation, desktop)
+                try:
+                    return future.result(timeout=timeout)
+                except FutureTimeoutError:
+                    # Killing soffice also unblocks the worker thread's UNO call
+                    stale_pid = self._desktop_pid
+                    self._desktop = None
+                    self.listener.restart(replacing=stale_pid)
+                    raise SofficeError(f"LibreOffice did not respond within {timeout}s")
+                except SofficeError:
+                    raise
+                except UnoRuntimeException as e:
+                    # A disposed or dropped bridge means the listener went away
+                    # or was replaced; document errors are not RuntimeExceptions
+                    self._desktop = None
+                    if attempt:
+                        raise SofficeError(f"Lost the connection to LibreOffice: {e}") from e
+                except Exception as e:
+                    raise SofficeError(str(e)) from e
+                finally:
+                    self.listener.touch()
+
+    def _connect(self):
+        """Return the listener's Desktop, starting the listener if needed."""
+        if self._desktop is not None and self.listener.pid() == self._desktop_pid:
+            return self._desktop
+        self._desktop = None
+        self.listener.ensure_running()
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        try:
+            context = resolver.resolve(f"uno:{self.listener.connection_string}")
+        except Exception as e:
+            raise SofficeError(f"Cannot connect to LibreOffice: {e}") from e
+        self._desktop_pid = self.listener.pid()
+        self._desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+        return self._desktop
+
+
+def _properties(**values):
+    """Return a tuple of UNO PropertyValues for keyword arguments."""
+    properties = []
+    for name, value in values.items():
+        prop = PropertyValue()
+        prop.Name = name
+        prop.Value = value
+        properties.append(prop)
+    return tuple(properties)
+
+
+_CLIENT = None
+
+
+def get_soffice_client():
+    """Return the process-wide SofficeClient, creating it on first use.
+
+    Raises:
+        SofficeError: If the uno module is not available
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = SofficeClient()
+    return _CLIENT
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the headless LibreOffice listener")
+    # "watch" is the idle watchdog the listener starts for itself
+    parser.add_argument("command", choices=["start", "stop", "status", "watch"])
+    parser.add_argument("--name", default=DEFAULT_NAME, help="Listener pipe name (the user id is appended)")
+    parser.add_argument(
+        "--idle-timeout",
+        type=int,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help="Seconds without requests before the listener stops (0 keeps it running)",
+    )
+    parser.add_argument("--pid", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    listener = SofficeListener(name=args.name, idle_timeout=args.idle_timeout)
+    try:
+        if args.command == "start":
+            listener.ensure_running()
+            print(f"soffice listening on pipe {listener.pipe_name} (pid {listener.pid()})")
+        elif args.command == "stop":
+            listener.stop()
+            print("soffice listener stopped")
+        elif args.command == "watch":
+            listener.watch(args.pid)
+        elif listener.is_healthy():
+            print(f"soffice listening on pipe {listener.pipe_name} (pid {listener.pid()})")
+        else:
+            print("soffice listener is not running")
+            sys.exit(1)
+    except SofficeError as e:
+        sys.exit(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    main()